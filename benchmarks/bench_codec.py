@@ -0,0 +1,92 @@
+"""
+Micro-benchmark for the JSON codec backends on realistic association payloads.
+
+Decodes a page of associations shaped like the Monarch /association response
+and encodes it back the way MonarchMcpServer does for tool results.
+
+    python benchmarks/bench_codec.py [--items 500] [--repeat 50]
+"""
+import argparse
+import json
+import timeit
+
+from monarch_mcp import codec
+
+
+def make_association_page(n_items: int) -> dict:
+    """Builds a /association response with n_items fully populated associations."""
+    items = []
+    for i in range(n_items):
+        items.append({
+            "id": f"uuid:6a3b2f4c-{i:08d}",
+            "category": "biolink:DiseaseToPhenotypicFeatureAssociation",
+            "subject": "MONDO:0007739",
+            "original_subject": "OMIM:143100",
+            "subject_namespace": "MONDO",
+            "subject_category": "biolink:Disease",
+            "subject_closure": [f"MONDO:{j:07d}" for j in range(12)],
+            "subject_label": "Huntington disease",
+            "subject_closure_label": [f"ancestor disease {j}" for j in range(12)],
+            "subject_taxon": None,
+            "predicate": "biolink:has_phenotype",
+            "object": f"HP:{i:07d}",
+            "original_object": None,
+            "object_namespace": "HP",
+            "object_category": "biolink:PhenotypicFeature",
+            "object_closure": [f"HP:{j:07d}" for j in range(15)],
+            "object_label": f"Phenotypic abnormality number {i}",
+            "object_closure_label": [f"ancestor phenotype {j}" for j in range(15)],
+            "primary_knowledge_source": "infores:hpo-annotations",
+            "aggregator_knowledge_source": ["infores:monarchinitiative"],
+            "negated": False,
+            "frequency_qualifier": "HP:0040283",
+            "onset_qualifier": None,
+            "sex_qualifier": None,
+            "publications": [f"PMID:{20000000 + i}", "OMIM:143100"],
+            "has_evidence": ["ECO:0000269"],
+            "grouping_key": f"MONDO:0007739|biolink:has_phenotype|0|HP:{i:07d}",
+            "provided_by": "hpoa_disease_to_phenotype_edges",
+            "has_count": 3,
+            "has_total": 7,
+            "has_percentage": 42.857,
+            "knowledge_level": "knowledge_assertion",
+            "agent_type": "manual_agent",
+        })
+    return {"limit": n_items, "offset": 0, "total": 8412, "items": items, "facet_fields": [], "facet_queries": []}
+
+
+def bench(backend: str, raw: bytes, payload: dict, repeat: int) -> tuple:
+    codec.use_backend(backend)
+    decode = min(timeit.repeat(lambda: codec.loads(raw), number=1, repeat=repeat))
+    encode = min(timeit.repeat(lambda: codec.dumps(payload, indent=2), number=1, repeat=repeat))
+    return decode, encode
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500, help="associations per page")
+    parser.add_argument("--repeat", type=int, default=50, help="timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    payload = make_association_page(args.items)
+    raw = json.dumps(payload).encode()
+    print(f"payload: {args.items} associations, {len(raw) / 1024:.0f} KiB")
+
+    results = {}
+    for backend in codec.BACKENDS:
+        if codec.select_backend(backend) != backend:
+            print(f"{backend:>8}: not installed")
+            continue
+        results[backend] = bench(backend, raw, payload, args.repeat)
+
+    baseline_decode, baseline_encode = results["stdlib"]
+    print(f"{'backend':>8} {'decode ms':>10} {'speedup':>8} {'encode ms':>10} {'speedup':>8}")
+    for backend, (decode, encode) in results.items():
+        print(
+            f"{backend:>8} {decode * 1000:>10.2f} {baseline_decode / decode:>7.1f}x "
+            f"{encode * 1000:>10.2f} {baseline_encode / encode:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark of per-call tool dispatch overhead in MonarchMcpServer.
+
+Compares the previous dispatch path (API_CLASS_MAP lookup, lazy instantiation,
+hasattr/getattr and jsonschema.validate on every call) with the precomputed
+dispatch table and compiled validators. The upstream client is stubbed out so
+only dispatch and validation are measured.
+
+    python benchmarks/bench_dispatch.py [--calls 20000]
+"""
+import argparse
+import asyncio
+import time
+
+import jsonschema
+
+from monarch_mcp.server import MonarchMcpServer
+from monarch_mcp.tools import ALL_TOOLS, API_CLASS_MAP
+
+CALLS = [
+    ("get_entity", {"entity_id": "MONDO:0007739"}),
+    ("get_gene_phenotype_associations", {"gene_id": "HGNC:1100", "limit": 20}),
+    ("get_associations", {"subject": ["MONDO:0007739"], "category": ["biolink:DiseaseToPhenotypicFeatureAssociation"]}),
+    ("find_similar_terms", {"termset": ["HP:0001250", "HP:0001263"], "search_group": "Human Diseases"}),
+]
+
+
+class StubClient:
+    async def get(self, endpoint, params=None):
+        return None
+
+
+async def legacy_dispatch(instances, schemas, client, name, arguments):
+    jsonschema.validate(instance=arguments, schema=schemas[name])
+    api_class = API_CLASS_MAP[name]
+    if api_class not in instances:
+        instances[api_class] = api_class()
+    api_instance = instances[api_class]
+    if not hasattr(api_instance, name):
+        raise ValueError(f"Tool method '{name}' not found")
+    return await getattr(api_instance, name)(client, **arguments)
+
+
+async def table_dispatch(server, client, name, arguments):
+    func = server._resolve_tool(name)
+    error = jsonschema.exceptions.best_match(server._validators[name].iter_errors(arguments))
+    if error is not None:
+        raise ValueError(error.message)
+    return await func(client, **arguments)
+
+
+async def run(n_calls: int):
+    client = StubClient()
+    server = MonarchMcpServer()
+    schemas = {tool.name: tool.inputSchema for tool in ALL_TOOLS}
+    instances = {}
+
+    async def timed(dispatch):
+        started = time.perf_counter()
+        for i in range(n_calls):
+            name, arguments = CALLS[i % len(CALLS)]
+            await dispatch(name, arguments)
+        return (time.perf_counter() - started) / n_calls * 1e6
+
+    legacy = await timed(lambda name, args: legacy_dispatch(instances, schemas, client, name, args))
+    table = await timed(lambda name, args: table_dispatch(server, client, name, args))
+    await server.client.close()
+
+    print(f"{n_calls} calls over {len(CALLS)} tools")
+    print(f"legacy dispatch:  {legacy:8.1f} us/call")
+    print(f"table dispatch:   {table:8.1f} us/call ({legacy / table:.1f}x faster)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="number of dispatched calls per variant")
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
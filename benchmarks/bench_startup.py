@@ -0,0 +1,96 @@
+"""
+Cold-start benchmark of the stdio server, as paid by every session an MCP
+host spawns.
+
+Each run starts a fresh interpreter that imports the server, constructs it,
+lists the tools and makes one tool call, and reports the time at which each
+step finished (measured from process launch). The upstream client is stubbed
+out, so only import and loading costs are measured. With --importtime the
+slowest imports of one extra run are listed, as `python -X importtime` does.
+
+    python benchmarks/bench_startup.py [--runs 10] [--importtime]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+CHILD = """
+import asyncio, json, sys, time
+started = float(sys.argv[1])
+marks = {}
+def mark(step):
+    marks[step] = (time.time() - started) * 1000
+
+mark("interpreter")
+from monarch_mcp.server import MonarchMcpServer
+mark("import")
+server = MonarchMcpServer()
+mark("init")
+
+async def stub_get(endpoint, params=None):
+    return {"id": "HGNC:1097"}
+
+async def first_calls():
+    server.client.get = stub_get
+    server.list_tools()
+    mark("first_list_tools")
+    await server.call_tool("get_gene_orthologs", {"gene_id": "HGNC:1097"})
+    mark("first_call_tool")
+
+asyncio.run(first_calls())
+print(json.dumps(marks))
+"""
+
+STEPS = ["interpreter", "import", "init", "first_list_tools", "first_call_tool"]
+
+
+def run_once(extra_args=()) -> subprocess.CompletedProcess:
+    env = dict(os.environ, MONARCH_API_URL="https://api.example.org/v3/api/")
+    return subprocess.run(
+        [sys.executable, *extra_args, "-c", CHILD, repr(time.time())],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def print_importtime(stderr: str, top: int):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    print("\nslowest imports (cumulative, of one run):")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms self  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh processes to time")
+    parser.add_argument("--importtime", action="store_true", help="also list the slowest imports")
+    parser.add_argument("--top", type=int, default=15, help="number of imports listed with --importtime")
+    args = parser.parse_args()
+
+    samples = {step: [] for step in STEPS}
+    for _ in range(args.runs):
+        marks = json.loads(run_once().stdout.splitlines()[-1])
+        for step in STEPS:
+            samples[step].append(marks[step])
+
+    print(f"{args.runs} runs, milliseconds since process launch (median / min)")
+    for step in STEPS:
+        print(f"  {step:18} {statistics.median(samples[step]):8.1f} {min(samples[step]):8.1f}")
+
+    if args.importtime:
+        print_importtime(run_once(["-X", "importtime"]).stderr, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# src/monarch_mcp/admission.py
+import asyncio
+import collections
+import contextlib
+import os
+import time
+from typing import Any, AsyncIterator, Counter, Deque, Dict, List, Optional
+
+from .metrics import Metrics
+
+
+class OverloadedError(Exception):
+    """Raised when a tool call is rejected because the server is saturated."""
+
+
+def parse_limits(value: str) -> Dict[str, int]:
+    """Parses a per-tool-class limit string of the form 'similarity=4,entity=32'."""
+    limits = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, limit = item.partition("=")
+        limits[name.strip()] = int(limit)
+    return limits
+
+
+class CallLimit:
+    """
+    Bounds the number of concurrent tool calls, with a bounded FIFO queue of
+    calls waiting for a slot. Calls are rejected with OverloadedError when the
+    queue is full or when they have waited longer than the queue timeout.
+    """
+
+    def __init__(self, name: str, max_inflight: int, max_queued: int):
+        self.name = name
+        self.max_inflight = max(1, max_inflight)
+        self.max_queued = max(0, max_queued)
+        self.inflight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.queued_calls = 0
+        self.queue_seconds = 0.0
+        self.max_queue_seconds = 0.0
+        self._waiters: Deque[asyncio.Future] = collections.deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        """Waits up to timeout seconds for a free slot."""
+        if self.inflight < self.max_inflight and not self._waiters:
+            self.inflight += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queued:
+            self.rejected += 1
+            raise OverloadedError(
+                f"Too many concurrent {self.name} tool calls "
+                f"({self.inflight} running, {self.queued} queued); retry later"
+            )
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except (asyncio.CancelledError, TimeoutError) as e:
+            granted = waiter.done() and not waiter.cancelled()
+            if not granted:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                if granted:
+                    # The slot was handed over just as we were cancelled; give it back
+                    self.release()
+                raise
+            if not granted:
+                self.rejected += 1
+                raise OverloadedError(
+                    f"Timed out after {timeout} seconds waiting for a free {self.name} tool call slot; retry later"
+                ) from None
+        finally:
+            waited = time.monotonic() - started
+            self.queued_calls += 1
+            self.queue_seconds += waited
+            self.max_queue_seconds = max(self.max_queue_seconds, waited)
+        self.admitted += 1
+
+    def release(self) -> None:
+        self.inflight -= 1
+        while self._waiters and self.inflight < self.max_inflight:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.inflight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.max_inflight,
+            "inflight": self.inflight,
+            "queued": self.queued,
+            "queue_limit": self.max_queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "mean_queue_seconds": self.queue_seconds / self.queued_calls if self.queued_calls else 0.0,
+            "max_queue_seconds": self.max_queue_seconds,
+        }
+
+
+class AdmissionController:
+    """
+    Admission control for tool calls: a server-wide limit on concurrent calls
+    and optional tighter limits per tool class (the tool module, e.g.
+    "similarity" or "entity"). A call waits for its class slot before it
+    queues for a server-wide one, so a saturated class does not hold
+    server-wide slots while it waits.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int = 64,
+        max_queued: int = 128,
+        queue_timeout: Optional[float] = 30.0,
+        class_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.queue_timeout = queue_timeout
+        self.total = CallLimit("server", max_inflight, max_queued)
+        self.classes = {
+            name: CallLimit(name, limit, max_queued) for name, limit in (class_limits or {}).items()
+        }
+        # Admitted calls per tool class, including classes without their own limit
+        self.inflight_by_class: Counter[str] = collections.Counter()
+
+    @classmethod
+    def from_env(cls) -> Optional["AdmissionController"]:
+        """
+        Builds the admission controller from MONARCH_MAX_CONCURRENT_CALLS and
+        related variables, or returns None when admission control is disabled.
+        """
+        max_inflight = int(os.getenv("MONARCH_MAX_CONCURRENT_CALLS", "64"))
+        if max_inflight <= 0:
+            return None
+        return cls(
+            max_inflight=max_inflight,
+            max_queued=int(os.getenv("MONARCH_MAX_QUEUED_CALLS", "128")),
+            queue_timeout=float(os.getenv("MONARCH_QUEUE_TIMEOUT", "30")) or None,
+            class_limits=parse_limits(os.getenv("MONARCH_TOOL_CLASS_LIMITS", "")),
+        )
+
+    @contextlib.asynccontextmanager
+    async def admit(self, tool_class: str, metrics: Optional[Metrics] = None) -> AsyncIterator[None]:
+        """
+        Holds a slot for one tool call of the given class, or raises
+        OverloadedError. The queue wait, rejections and calls in flight are
+        recorded per tool class in metrics, when given.
+        """
+        limits = [self.classes[tool_class]] if tool_class in self.classes else []
+        limits.append(self.total)
+        started = time.monotonic()
+        expires_at = None if self.queue_timeout is None else started + self.queue_timeout
+        acquired: List[CallLimit] = []
+        try:
+            try:
+                for limit in limits:
+                    remaining = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+                    await limit.acquire(remaining)
+                    acquired.append(limit)
+            except OverloadedError:
+                if metrics is not None:
+                    metrics.inc("tool_calls_rejected_total", tool_class)
+                raise
+            self._track(tool_class, 1, metrics)
+            if metrics is not None:
+                metrics.observe("tool_queue_wait_seconds", time.monotonic() - started, tool_class)
+            try:
+                yield
+            finally:
+                self._track(tool_class, -1, metrics)
+        finally:
+            for limit in reversed(acquired):
+                limit.release()
+
+    def _track(self, tool_class: str, delta: int, metrics: Optional[Metrics]) -> None:
+        self.inflight_by_class[tool_class] += delta
+        if metrics is not None:
+            metrics.set("tool_calls_inflight", self.inflight_by_class[tool_class], tool_class)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.total.stats(),
+            "classes": {name: limit.stats() for name, limit in self.classes.items()},
+        }
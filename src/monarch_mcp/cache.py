@@ -0,0 +1,320 @@
+# src/monarch_mcp/cache.py
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from . import codec
+
+# TTLs in seconds, keyed by the first path segment of the endpoint.
+DEFAULT_TTLS: Dict[str, float] = {
+    "entity": 3600.0,
+    "histopheno": 3600.0,
+    "mappings": 3600.0,
+    "association": 600.0,
+    "semsim": 600.0,
+    "search": 300.0,
+    "autocomplete": 300.0,
+}
+
+
+def make_cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Builds a cache key from an endpoint and its params, independent of param order.
+    """
+    canonical = json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{endpoint}?{canonical}"
+
+
+def endpoint_prefix(endpoint: str) -> str:
+    """Returns the first path segment of an endpoint, e.g. 'entity' for 'entity/HP:0001250'."""
+    return endpoint.lstrip("/").split("/", 1)[0]
+
+
+def parse_ttls(value: str) -> Dict[str, float]:
+    """Parses a TTL override string of the form 'entity=3600,association=60'."""
+    ttls = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        prefix, _, seconds = item.partition("=")
+        ttls[prefix.strip()] = float(seconds)
+    return ttls
+
+
+class _EndpointTtls:
+    """Resolves per-endpoint TTLs shared by the cache tiers."""
+
+    default_ttl: float
+    ttls: Dict[str, float]
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Returns the TTL that applies to the given endpoint."""
+        return self.ttls.get(endpoint_prefix(endpoint), self.default_ttl)
+
+
+class ResponseCache(_EndpointTtls):
+    """
+    In-process LRU cache for decoded Monarch API responses.
+
+    Entries expire after a per-endpoint TTL and the cache is bounded both by
+    number of entries and by the size of the raw response bodies. Cached values
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 300.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        # key -> (expires_at, size, value)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """
+        Builds a cache from MONARCH_CACHE_* environment variables, or returns None
+        when MONARCH_CACHE is not enabled.
+        """
+        if os.getenv("MONARCH_CACHE", "").lower() not in ("1", "true", "yes", "on"):
+            return None
+        return cls(
+            max_entries=int(os.getenv("MONARCH_CACHE_MAX_ENTRIES", "1024")),
+            max_bytes=int(os.getenv("MONARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            default_ttl=float(os.getenv("MONARCH_CACHE_DEFAULT_TTL", "300")),
+            ttls=parse_ttls(os.getenv("MONARCH_CACHE_TTLS", "")),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value for key, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, size, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, size: int, ttl: float) -> None:
+        """Stores a value, evicting least recently used entries to stay within bounds."""
+        if ttl <= 0 or size > self.max_bytes or self.max_entries <= 0:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self.current_bytes += size
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+
+class DiskCache(_EndpointTtls):
+    """
+    Persistent response cache stored in a SQLite database.
+
+    The database runs in WAL mode so that many server processes on the same host
+    can read and write it concurrently. Response bodies are stored as zlib
+    compressed JSON and the least recently used rows are evicted once the total
+    uncompressed size exceeds max_bytes. The total is kept in a one-row table
+    updated in the same transaction as the rows, so writes do not sum the
+    whole table. Methods are blocking; async callers should run them in a
+    worker thread.
+    """
+
+    # Hits only refresh accessed_at when it is older than this, to limit writes.
+    TOUCH_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        default_ttl: float = 300.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+            "size INTEGER NOT NULL, body BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS total_size (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)"
+        )
+        # Counts the rows of a cache file created before the total was kept
+        self._conn.execute(
+            "INSERT OR IGNORE INTO total_size (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM responses"
+        )
+
+    @classmethod
+    def from_env(cls) -> Optional["DiskCache"]:
+        """
+        Builds a disk cache from MONARCH_DISK_CACHE_* environment variables, or
+        returns None when MONARCH_DISK_CACHE_PATH is not set.
+        """
+        path = os.getenv("MONARCH_DISK_CACHE_PATH")
+        if not path:
+            return None
+        return cls(
+            path,
+            max_bytes=int(os.getenv("MONARCH_DISK_CACHE_MAX_BYTES", str(512 * 1024 * 1024))),
+            default_ttl=float(os.getenv("MONARCH_CACHE_DEFAULT_TTL", "300")),
+            ttls=parse_ttls(os.getenv("MONARCH_CACHE_TTLS", "")),
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value for key, or None if it is missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, int, float]]:
+        """
+        Returns (value, size, remaining_ttl) for key, or None if it is missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, size, expires_at, accessed_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] <= now:
+                self.misses += 1
+                return None
+            body, size, expires_at, accessed_at = row
+            if now - accessed_at > self.TOUCH_INTERVAL:
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return codec.loads(zlib.decompress(body)), size, expires_at - now
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        """
+        Stores a raw JSON response body, evicting expired and least recently used
+        rows to stay within max_bytes.
+        """
+        if ttl <= 0 or len(body) > self.max_bytes:
+            return
+        now = time.time()
+        compressed = zlib.compress(body)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, expires_at, accessed_at, size, body) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, now + ttl, now, len(body), compressed),
+                )
+                self._evict(now, len(body) - (row[0] if row is not None else 0))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.execute("UPDATE total_size SET bytes = 0")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            (total,) = self._conn.execute("SELECT bytes FROM total_size").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float, added: int) -> None:
+        """Updates the total size by `added` bytes, then drops expired and least recently used rows."""
+        (expired,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses WHERE expires_at <= ?", (now,)
+        ).fetchone()
+        if expired:
+            self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        self._conn.execute("UPDATE total_size SET bytes = bytes + ?", (added - expired,))
+        (total,) = self._conn.execute("SELECT bytes FROM total_size").fetchone()
+        evicted = 0
+        while total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at, rowid LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                total -= size
+                evicted += size
+                self.evictions += 1
+        if evicted:
+            self._conn.execute("UPDATE total_size SET bytes = bytes - ?", (evicted,))
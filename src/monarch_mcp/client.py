@@ -1,35 +1,396 @@
 # src/monarch_mcp/client.py
+import asyncio
+import contextlib
+import contextvars
 import httpx
+import importlib.util
+import logging
 import os
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
 from dotenv import load_dotenv
 
-load_dotenv()
+from . import codec, tracing
+from .cache import DiskCache, ResponseCache, make_cache_key
+from .metrics import Metrics, endpoint_template
+from .ratelimit import BULK, INTERACTIVE, AdaptiveConcurrencyLimiter, TokenBucket
+from .resilience import RETRY_STATUSES, CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+_env_loaded = False
+
+# Absolute time.monotonic() deadline for requests made in the current context
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("monarch_deadline", default=None)
+# Scheduling priority (INTERACTIVE or BULK) of requests made in the current context
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("monarch_priority", default=INTERACTIVE)
+
+# Values of the circuit_breaker_state gauge
+BREAKER_STATE_VALUES = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1, CircuitBreaker.OPEN: 2}
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request cannot complete before the deadline of its tool call."""
+
+
+@contextlib.contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Sets a deadline that every MonarchClient request made within the context
+    (including from tasks spawned in it) respects. Nested deadlines can only
+    shorten the outer one.
+    """
+    if seconds is None:
+        yield
+        return
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextlib.contextmanager
+def priority(level: int) -> Iterator[None]:
+    """
+    Sets the priority of every MonarchClient request made within the context
+    (including from tasks spawned in it). Queued INTERACTIVE requests get a
+    concurrency slot before queued BULK ones.
+    """
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def load_env() -> None:
+    """
+    Loads settings from a .env file into the environment. Called on first use
+    rather than at import time; only the first call reads the file.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+def timeout_from_env() -> httpx.Timeout:
+    """Builds the httpx timeouts from MONARCH_*_TIMEOUT environment variables."""
+    return httpx.Timeout(
+        connect=float(os.getenv("MONARCH_CONNECT_TIMEOUT", "5")),
+        read=float(os.getenv("MONARCH_READ_TIMEOUT", "30")),
+        write=float(os.getenv("MONARCH_WRITE_TIMEOUT", "30")),
+        pool=float(os.getenv("MONARCH_POOL_TIMEOUT", "10")),
+    )
+
+
+def limits_from_env() -> httpx.Limits:
+    """Builds the connection pool limits from MONARCH_* environment variables."""
+    return httpx.Limits(
+        max_connections=int(os.getenv("MONARCH_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("MONARCH_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        keepalive_expiry=float(os.getenv("MONARCH_KEEPALIVE_EXPIRY", "30")),
+    )
+
+
+def http2_available() -> bool:
+    """HTTP/2 support in httpx needs the optional 'h2' package (httpx[http2])."""
+    return importlib.util.find_spec("h2") is not None
+
 
 class MonarchClient:
-    def __init__(self):
-        self.base_url = os.getenv("MONARCH_API_URL")
-        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=None)
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker_factory: Callable[[], CircuitBreaker] = CircuitBreaker.from_env,
+        rate_limiter: Optional[TokenBucket] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        load_env()
+        self.base_url = base_url or os.getenv("MONARCH_API_URL")
+        # The response cache is opt-in: pass one explicitly or set MONARCH_CACHE=1
+        self.cache = cache if cache is not None else ResponseCache.from_env()
+        # Optional second tier shared with other server processes on this host
+        self.disk_cache = disk_cache if disk_cache is not None else DiskCache.from_env()
+        if http2 is None:
+            http2 = os.getenv("MONARCH_HTTP2", "").lower() in ("1", "true", "yes", "on")
+        if http2 and not http2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout if timeout is not None else timeout_from_env(),
+            limits=limits if limits is not None else limits_from_env(),
+            http2=http2,
+            transport=transport,
+        )
+        # The disk cache file may be shared by servers using different APIs
+        # (e.g. staging and production), so its keys include the base URL
+        self._disk_key_prefix = str(self.client.base_url)
+        # Per-endpoint-template latency, size, status, retry and cache metrics
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.metrics.add_collector(self._collect_breaker_metrics)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Number of callers waiting on each shared fetch
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self.coalesced_requests = 0
+        self.cancelled_requests = 0
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy.from_env()
+        self._breaker_factory = breaker_factory
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.retries = 0
+        # Shared by every tool class using this client
+        self.rate_limiter = rate_limiter if rate_limiter is not None else TokenBucket.from_env()
+        self.concurrency_limiter = (
+            concurrency_limiter if concurrency_limiter is not None else AdaptiveConcurrencyLimiter.from_env()
+        )
 
     async def get(self, endpoint, params=None):
+        cache_key = make_cache_key(endpoint, params)
+        template = endpoint_template(endpoint)
+        with tracing.span(
+            "client.get", endpoint=endpoint, template=template, params_bytes=len(cache_key) - len(endpoint) - 1
+        ) as span:
+            if self.cache is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    self._record_lookup(template, "memory_hit", span)
+                    return cached
+
+            expires_at = _deadline.get()
+            if expires_at is not None and expires_at <= time.monotonic():
+                raise DeadlineExceeded(f"Deadline exceeded before requesting '{endpoint}'")
+
+            # Single-flight: identical concurrent requests share one upstream fetch
+            task = self._inflight.get(cache_key)
+            if task is not None:
+                self.coalesced_requests += 1
+                self._record_lookup(template, "coalesced", span)
+            else:
+                task = asyncio.ensure_future(self._fetch(endpoint, params, cache_key, template))
+                self._inflight[cache_key] = task
+                task.add_done_callback(lambda t: self._forget_inflight(cache_key, t))
+
+            if expires_at is None:
+                return await self._wait_for(cache_key, task)
+            try:
+                async with asyncio.timeout(expires_at - time.monotonic()) as timeout:
+                    return await self._wait_for(cache_key, task)
+            except TimeoutError:
+                if timeout.expired():
+                    raise DeadlineExceeded(f"Deadline exceeded while waiting for '{endpoint}'") from None
+                raise
+
+    async def _wait_for(self, cache_key, task):
+        """
+        Waits for a shared fetch. The fetch is shielded from the cancellation of
+        any one caller, but once every caller has been cancelled or timed out it
+        is cancelled too, which aborts the upstream request and frees its
+        connection and concurrency slot.
+        """
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    # New callers must start a fresh fetch instead of joining the cancelled one
+                    self._forget_inflight(cache_key, task)
+                    task.cancel()
+                    self.cancelled_requests += 1
+
+    async def _fetch(self, endpoint, params, cache_key, template):
+        # The span of the get() that started this shared fetch
+        span = tracing.current_span()
+        disk_key = self._disk_key_prefix + cache_key
+        if self.disk_cache is not None:
+            entry = await asyncio.to_thread(self.disk_cache.get_entry, disk_key)
+            if entry is not None:
+                data, size, remaining_ttl = entry
+                self._record_lookup(template, "disk_hit", span, size)
+                if self.cache is not None:
+                    ttl = min(self.cache.ttl_for(endpoint), remaining_ttl)
+                    self.cache.set(cache_key, data, size=size, ttl=ttl)
+                return data
+
+        self._record_lookup(template, "miss", span)
         try:
-            response = await self.client.get(endpoint, params=params)
+            response = await self._send_with_retries(endpoint, params, template)
+            if span is not None:
+                span.set(bytes=len(response.content))
             response.raise_for_status()
-            return response.json()
+            data = codec.loads(response.content)
         except httpx.HTTPStatusError as e:
             # Re-raise with more context
             raise Exception(f"HTTP error occurred: {e.response.status_code} - {e.response.text}") from e
 
+        if self.cache is not None:
+            self.cache.set(cache_key, data, size=len(response.content), ttl=self.cache.ttl_for(endpoint))
+        if self.disk_cache is not None:
+            await asyncio.to_thread(
+                self.disk_cache.set, disk_key, response.content, self.disk_cache.ttl_for(endpoint)
+            )
+        return data
+
+    async def _send_with_retries(self, endpoint, params, template) -> httpx.Response:
+        """
+        Sends a GET request, retrying connection errors and transient statuses with
+        jittered exponential backoff. The last response is returned once retries
+        are exhausted; connection errors are re-raised.
+        """
+        host = self.client.base_url.host
+        breaker = self.circuit_breaker(host)
+        attempt = 0
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit breaker for '{host}' is open; upstream considered unavailable")
+            retry_after = None
+            probe = breaker.state == breaker.HALF_OPEN
+            try:
+                response = await self._send(endpoint, params, template)
+            except httpx.TransportError:
+                breaker.record_failure()
+                if attempt >= self.retry_policy.max_retries:
+                    raise
+            except BaseException:
+                # A probe abandoned by cancellation (e.g. a deadline) has no outcome;
+                # without releasing it the circuit would stay shut for reset_timeout
+                if probe:
+                    breaker.release_probe()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                # 429 means we are being throttled, not that the upstream is down
+                if response.status_code != 429:
+                    breaker.record_failure()
+                if attempt >= self.retry_policy.max_retries:
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.retries += 1
+            self.metrics.inc("upstream_retries_total", template)
+            await asyncio.sleep(self.retry_policy.delay(attempt, retry_after))
+            attempt += 1
+
+    async def _send(self, endpoint, params, template) -> httpx.Response:
+        """
+        Sends a single GET request within the rate and concurrency limits and
+        records its latency, size and status.
+        """
+        await self.concurrency_limiter.acquire(_priority.get())
+        latency = None
+        throttled = False
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            started = time.monotonic()
+            with tracing.span("http.request", method="GET", endpoint=endpoint) as span:
+                try:
+                    response = await self.client.get(endpoint, params=params)
+                except httpx.TransportError:
+                    self.metrics.inc("upstream_responses_total", template, "error")
+                    raise
+                if span is not None:
+                    span.set(status_code=response.status_code, bytes=len(response.content))
+            elapsed = time.monotonic() - started
+            self.metrics.observe("upstream_request_duration_seconds", elapsed, template)
+            self.metrics.observe("upstream_response_bytes", len(response.content), template)
+            self.metrics.inc("upstream_responses_total", template, str(response.status_code))
+            throttled = response.status_code == 429
+            if response.status_code < 500:
+                latency = elapsed
+            return response
+        finally:
+            self.concurrency_limiter.release(latency=latency, throttled=throttled, key=template)
+
+    def _collect_breaker_metrics(self, metrics: Metrics) -> None:
+        for host, breaker in self._breakers.items():
+            metrics.set("circuit_breaker_state", BREAKER_STATE_VALUES[breaker.state], host)
+            metrics.set("circuit_breaker_opened_total", breaker.times_opened, host)
+            metrics.set("circuit_breaker_rejected_total", breaker.rejected_requests, host)
+
+    def _record_lookup(self, template, result, span, size=None):
+        """Records how a get was served (memory_hit, disk_hit, coalesced or miss)."""
+        self.metrics.inc("cache_lookups_total", template, result)
+        if span is not None:
+            span.set(cache=result)
+            if size is not None:
+                span.set(bytes=size)
+
+    def circuit_breaker(self, host: str) -> CircuitBreaker:
+        """Returns the circuit breaker for host, creating it on first use."""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = self._breaker_factory()
+        return breaker
+
+    def _forget_inflight(self, cache_key, task):
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+
     async def post(self, endpoint, data=None):
         try:
             response = await self.client.post(endpoint, json=data)
             response.raise_for_status()
-            return response.json()
+            return codec.loads(response.content)
         except httpx.HTTPStatusError as e:
             raise Exception(f"HTTP error occurred: {e.response.status_code} - {e.response.text}") from e
 
+    async def warm_up(self, connections: Optional[int] = None) -> None:
+        """
+        Opens pooled connections (DNS, TCP and TLS handshakes) ahead of the first
+        tool call by sending lightweight requests to the API root. Failures are
+        logged and otherwise ignored.
+        """
+        if connections is None:
+            connections = int(os.getenv("MONARCH_PREWARM_CONNECTIONS", "1"))
+        if connections <= 0:
+            return
+        results = await asyncio.gather(
+            *[self.client.head("") for _ in range(connections)], return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning(f"Connection pre-warming failed: {failures[0]!r}")
+        else:
+            logger.info(f"Pre-warmed {connections} connection(s) to {self.base_url}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns counters describing caching, coalescing, retries and upstream limits."""
+        return {
+            "coalesced_requests": self.coalesced_requests,
+            "cancelled_requests": self.cancelled_requests,
+            "retries": self.retries,
+            "circuit_breakers": {host: breaker.stats() for host, breaker in self._breakers.items()},
+            "concurrency": self.concurrency_limiter.stats(),
+            "rate_limiter": self.rate_limiter.stats() if self.rate_limiter is not None else None,
+            "inflight_requests": len(self._inflight),
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "disk_cache": self.disk_cache.stats() if self.disk_cache is not None else None,
+        }
+
     async def close(self):
         """
         Closes the underlying httpx client session using the correct async method.
         """
         # CORRECT: The httpx async client uses 'aclose()'
-        await self.client.aclose()
\ No newline at end of file
+        await self.client.aclose()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
@@ -0,0 +1,90 @@
+# src/monarch_mcp/codec.py
+"""
+JSON encoding and decoding for upstream responses and tool results.
+
+orjson or msgspec is used when installed (pip install monarch-mcp[fast]) and
+the standard library json module otherwise. MONARCH_JSON_BACKEND can force a
+backend: "orjson", "msgspec" or "stdlib".
+"""
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+
+def _stdlib_codec():
+    def loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        if indent is None:
+            return json.dumps(obj, separators=(",", ":"))
+        return json.dumps(obj, indent=indent)
+
+    return loads, dumps
+
+
+def _orjson_codec():
+    import orjson
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        if indent is None:
+            return orjson.dumps(obj).decode()
+        if indent == 2:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(obj, indent=indent)
+
+    return loads, dumps
+
+
+def _msgspec_codec():
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return decoder.decode(data)
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        encoded = encoder.encode(obj)
+        if indent is not None:
+            encoded = msgspec.json.format(encoded, indent=indent)
+        return encoded.decode()
+
+    return loads, dumps
+
+
+_FACTORIES = {"orjson": _orjson_codec, "msgspec": _msgspec_codec, "stdlib": _stdlib_codec}
+
+
+def select_backend(preferred: str = "auto") -> str:
+    """
+    Returns the name of the backend to use: the preferred one if it is
+    importable, otherwise the first importable backend in BACKENDS order.
+    """
+    candidates = BACKENDS if preferred == "auto" else (preferred,) + BACKENDS
+    for name in candidates:
+        try:
+            _FACTORIES[name]()
+        except (ImportError, KeyError):
+            continue
+        return name
+    return "stdlib"
+
+
+def use_backend(name: str) -> None:
+    """Switches the module-level loads/dumps to the given backend."""
+    global BACKEND, loads, dumps
+    BACKEND = select_backend(name)
+    loads, dumps = _FACTORIES[BACKEND]()
+
+
+BACKEND: str
+loads: Callable[[Union[bytes, str]], Any]
+dumps: Callable[..., str]
+use_backend(os.getenv("MONARCH_JSON_BACKEND", "auto"))
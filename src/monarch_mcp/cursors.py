@@ -0,0 +1,204 @@
+# src/monarch_mcp/cursors.py
+"""
+Server-side cursors over paginated upstream results.
+
+Opening a cursor returns the first page together with an opaque next_cursor.
+The following pages are prefetched in the background at bulk priority, so a
+call with the cursor is usually answered from memory without an upstream
+request. Cursors are kept per process, in a store bounded by count and
+expiring after a period of inactivity; with several worker processes a
+follow-up call may reach another worker, so cursors are disabled then.
+"""
+import asyncio
+import collections
+import contextvars
+import os
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, OrderedDict, Tuple
+
+from .client import BULK, priority
+
+# Fetches the page starting at the given offset
+PageFetcher = Callable[[int], Awaitable[Dict[str, Any]]]
+
+
+class CursorError(ValueError):
+    """Raised for a cursor that is malformed, unknown or expired, or when cursors are disabled."""
+
+
+CURSORS_DISABLED = (
+    "Cursors are not available because the server runs several worker processes; "
+    "page with limit and offset, or use fetch_all, instead"
+)
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # Prefetches that are never read must not log "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+class _Cursor:
+    __slots__ = ("fetch", "page_size", "pages", "expires_at")
+
+    def __init__(self, fetch: PageFetcher, page_size: int, expires_at: float):
+        self.fetch = fetch
+        self.page_size = page_size
+        self.pages: Dict[int, asyncio.Task] = {}
+        self.expires_at = expires_at
+
+    def close(self) -> None:
+        for task in self.pages.values():
+            task.cancel()
+        self.pages.clear()
+
+
+class CursorStore:
+    """
+    Holds the open cursors and their prefetched pages. At most max_cursors are
+    kept (the least recently used is closed first), each expires ttl seconds
+    after its last use, and up to prefetch_pages pages ahead of the position of
+    a cursor are fetched. Closing a cursor cancels its pending prefetches.
+    """
+
+    def __init__(self, max_cursors: int = 64, ttl: float = 300.0, prefetch_pages: int = 2):
+        self.max_cursors = max(1, max_cursors)
+        self.ttl = ttl
+        self.prefetch_pages = max(0, prefetch_pages)
+        self.opened = 0
+        self.expired = 0
+        self.evicted = 0
+        self.prefetch_hits = 0
+        self.prefetch_waits = 0
+        self.prefetch_misses = 0
+        self._cursors: OrderedDict[str, _Cursor] = collections.OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> Optional["CursorStore"]:
+        """
+        Builds the store from MONARCH_CURSOR_MAX and related variables, or
+        returns None when the server runs several worker processes
+        (MONARCH_WORKERS), which do not share cursors.
+        """
+        if int(os.getenv("MONARCH_WORKERS", "1")) > 1:
+            return None
+        return cls(
+            max_cursors=int(os.getenv("MONARCH_CURSOR_MAX", "64")),
+            ttl=float(os.getenv("MONARCH_CURSOR_TTL", "300")),
+            prefetch_pages=int(os.getenv("MONARCH_CURSOR_PREFETCH_PAGES", "2")),
+        )
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    async def open(self, fetch: PageFetcher, offset: int, page_size: int) -> Dict[str, Any]:
+        """Fetches the page at offset and returns it with the cursor for the following pages."""
+        page = await fetch(offset)
+        self._purge()
+        cursor_id = secrets.token_urlsafe(12)
+        cursor = _Cursor(fetch, page_size, time.monotonic() + self.ttl)
+        self._cursors[cursor_id] = cursor
+        self.opened += 1
+        while len(self._cursors) > self.max_cursors:
+            _, oldest = self._cursors.popitem(last=False)
+            oldest.close()
+            self.evicted += 1
+        return self._advance(cursor_id, cursor, offset, page)
+
+    async def next_page(self, token: str) -> Dict[str, Any]:
+        """Returns the page a cursor points to, from memory when it has been prefetched."""
+        cursor_id, offset = self._parse(token)
+        self._purge()
+        cursor = self._cursors.get(cursor_id)
+        if cursor is None:
+            raise CursorError("Unknown or expired cursor; repeat the original query to get a new one")
+        self._cursors.move_to_end(cursor_id)
+        cursor.expires_at = time.monotonic() + self.ttl
+        task = cursor.pages.get(offset)
+        if task is None:
+            self.prefetch_misses += 1
+            page = await cursor.fetch(offset)
+        else:
+            if task.done():
+                self.prefetch_hits += 1
+            else:
+                self.prefetch_waits += 1
+            try:
+                # Shielded so that a cancelled call leaves the page for a retry
+                page = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise
+                cursor.pages.pop(offset, None)
+                page = await cursor.fetch(offset)
+            except Exception:
+                cursor.pages.pop(offset, None)
+                raise
+        if self._cursors.get(cursor_id) is not cursor:
+            # Closed while the page was being fetched
+            return {**page, "next_cursor": None}
+        return self._advance(cursor_id, cursor, offset, page)
+
+    def close(self) -> None:
+        """Closes every cursor."""
+        for cursor in self._cursors.values():
+            cursor.close()
+        self._cursors.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": len(self._cursors),
+            "opened": self.opened,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "prefetch_hits": self.prefetch_hits,
+            "prefetch_waits": self.prefetch_waits,
+            "prefetch_misses": self.prefetch_misses,
+        }
+
+    def _advance(self, cursor_id: str, cursor: _Cursor, offset: int, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Drops pages up to offset, prefetches the next ones and adds next_cursor to page."""
+        next_offset = offset + cursor.page_size
+        total = int(page.get("total", 0))
+        if not page.get("items") or next_offset >= total:
+            cursor.close()
+            del self._cursors[cursor_id]
+            return {**page, "next_cursor": None}
+        for page_offset in [o for o in cursor.pages if o <= offset]:
+            cursor.pages.pop(page_offset).cancel()
+        for i in range(self.prefetch_pages):
+            page_offset = next_offset + i * cursor.page_size
+            if page_offset >= total:
+                break
+            if page_offset not in cursor.pages:
+                cursor.pages[page_offset] = self._spawn(cursor.fetch, page_offset)
+        return {**page, "next_cursor": f"{cursor_id}:{next_offset}"}
+
+    @staticmethod
+    def _spawn(fetch: PageFetcher, offset: int) -> asyncio.Task:
+        async def prefetch() -> Dict[str, Any]:
+            with priority(BULK):
+                return await fetch(offset)
+
+        # A fresh context detaches the prefetch from the deadline and trace of the calling tool
+        task = asyncio.get_running_loop().create_task(prefetch(), context=contextvars.Context())
+        task.add_done_callback(_consume_exception)
+        return task
+
+    @staticmethod
+    def _parse(token: str) -> Tuple[str, int]:
+        cursor_id, _, offset = str(token).rpartition(":")
+        if not cursor_id or not offset.isdigit():
+            raise CursorError(f"Malformed cursor: {token!r}")
+        return cursor_id, int(offset)
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        while self._cursors:
+            cursor_id, cursor = next(iter(self._cursors.items()))
+            if cursor.expires_at > now:
+                break
+            del self._cursors[cursor_id]
+            cursor.close()
+            self.expired += 1
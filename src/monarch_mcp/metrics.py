@@ -0,0 +1,260 @@
+# src/monarch_mcp/metrics.py
+"""
+In-process metrics for upstream requests and tool calls.
+
+Upstream metrics are labelled by endpoint template (e.g. "entity/{id}") so
+the number of series stays bounded. Metrics are exported in the Prometheus
+text format (served at /metrics in HTTP mode) or summarised by snapshot()
+for periodic logging (stdio mode).
+"""
+import bisect
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Names of the variable path segments of each endpoint, keyed by its fixed prefix
+_ENDPOINT_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "entity": ("id", "category"),
+    "histopheno": ("id",),
+    "semsim/compare": ("subjects", "objects"),
+    "semsim/search": ("termset", "group"),
+}
+
+# name -> (type, help, label names, histogram buckets)
+FAMILIES: Dict[str, Tuple[str, str, Tuple[str, ...], Optional[Sequence[float]]]] = {
+    "upstream_request_duration_seconds": (
+        "histogram", "Latency of upstream Monarch API requests", ("endpoint",), LATENCY_BUCKETS,
+    ),
+    "upstream_response_bytes": (
+        "histogram", "Size of upstream response bodies", ("endpoint",), SIZE_BUCKETS,
+    ),
+    "upstream_responses_total": (
+        "counter", "Upstream responses by status code ('error' for connection failures)", ("endpoint", "status"), None,
+    ),
+    "upstream_retries_total": (
+        "counter", "Retried upstream requests", ("endpoint",), None,
+    ),
+    "cache_lookups_total": (
+        "counter", "Client requests by how they were served: memory_hit, disk_hit, coalesced or miss", ("endpoint", "result"), None,
+    ),
+    "tool_call_duration_seconds": (
+        "histogram", "Duration of tool calls", ("tool",), LATENCY_BUCKETS,
+    ),
+    "tool_result_bytes": (
+        "histogram", "Size of serialized tool results", ("tool",), SIZE_BUCKETS,
+    ),
+    "tool_calls_total": (
+        "counter", "Tool calls by outcome ('ok' or the error type)", ("tool", "outcome"), None,
+    ),
+    "tool_queue_wait_seconds": (
+        "histogram", "Time admitted tool calls waited for a slot, by tool class", ("tool_class",), LATENCY_BUCKETS,
+    ),
+    "tool_calls_rejected_total": (
+        "counter", "Tool calls rejected by admission control, by tool class", ("tool_class",), None,
+    ),
+    "tool_calls_inflight": (
+        "gauge", "Tool calls holding an admission slot, by tool class", ("tool_class",), None,
+    ),
+    "circuit_breaker_state": (
+        "gauge", "State of the upstream circuit breaker: 0 closed, 1 half-open, 2 open", ("host",), None,
+    ),
+    "circuit_breaker_opened_total": (
+        "counter", "Times the upstream circuit breaker opened", ("host",), None,
+    ),
+    "circuit_breaker_rejected_total": (
+        "counter", "Requests rejected by an open circuit breaker", ("host",), None,
+    ),
+}
+
+CACHE_HITS = ("memory_hit", "disk_hit", "coalesced")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Returns the template of an endpoint with its variable path segments
+    replaced by placeholders, e.g. 'entity/{id}' for 'entity/HP:0001250'.
+    """
+    parts = endpoint.strip("/").split("/")
+    fixed = 2 if parts[0] == "semsim" and len(parts) > 1 else 1
+    prefix = "/".join(parts[:fixed])
+    names = _ENDPOINT_PARAMS.get(prefix, ())
+    placeholders = [
+        "{" + (names[i] if i < len(names) else "param") + "}" for i in range(len(parts) - fixed)
+    ]
+    return "/".join([prefix] + placeholders)
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Returns the upper bound of the bucket holding the q-quantile (None above the last bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """
+    Registry of the metric families in FAMILIES, keyed by their label values.
+    Recording is a dictionary lookup and an increment, cheap enough for every
+    request. Values kept elsewhere (e.g. circuit breaker state) are copied in
+    by collectors, which run before the metrics are read.
+    """
+
+    def __init__(self, namespace: str = "monarch"):
+        self.namespace = namespace
+        self._histograms: Dict[str, Dict[Tuple[str, ...], Histogram]] = defaultdict(dict)
+        self._counters: Dict[str, Dict[Tuple[str, ...], float]] = defaultdict(lambda: defaultdict(int))
+        self._collectors: List[Callable[["Metrics"], None]] = []
+
+    def observe(self, name: str, value: float, *labels: str) -> None:
+        """Records a value in the histogram `name` for the given label values."""
+        series = self._histograms[name]
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = Histogram(FAMILIES[name][3])
+        histogram.observe(value)
+
+    def inc(self, name: str, *labels: str, amount: float = 1) -> None:
+        """Increments the counter `name` for the given label values."""
+        self._counters[name][labels] += amount
+
+    def set(self, name: str, value: float, *labels: str) -> None:
+        """Sets the gauge (or the counter mirrored from another source) `name` for the given label values."""
+        self._counters[name][labels] = value
+
+    def add_collector(self, collector: Callable[["Metrics"], None]) -> None:
+        """Registers a function that updates metrics from their source before they are read."""
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        for collector in self._collectors:
+            collector(self)
+
+    def histogram(self, name: str, *labels: str) -> Optional[Histogram]:
+        return self._histograms[name].get(labels)
+
+    def counter(self, name: str, *labels: str) -> float:
+        return self._counters[name].get(labels, 0)
+
+    def render_prometheus(self) -> str:
+        """Returns all metrics in the Prometheus text exposition format."""
+        self.collect()
+        lines: List[str] = []
+        for name, (kind, help_text, label_names, _) in FAMILIES.items():
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            if kind != "histogram":
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{full_name}{_labels(label_names, labels)} {_number(value)}")
+                continue
+            for labels, histogram in sorted(self._histograms[name].items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _number(float(bound))
+                    bucket_labels = _labels(label_names, labels, f'le="{le}"')
+                    lines.append(f"{full_name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{full_name}_sum{_labels(label_names, labels)} {_number(histogram.sum)}")
+                lines.append(f"{full_name}_count{_labels(label_names, labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarises the metrics per endpoint template, tool, tool class and upstream host, e.g. for logging."""
+        self.collect()
+        endpoints: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for (endpoint,), histogram in self._histograms["upstream_request_duration_seconds"].items():
+            endpoints[endpoint].update(
+                requests=histogram.count,
+                mean_seconds=histogram.sum / histogram.count,
+                p50_seconds=histogram.quantile(0.5),
+                p95_seconds=histogram.quantile(0.95),
+            )
+        for (endpoint,), histogram in self._histograms["upstream_response_bytes"].items():
+            endpoints[endpoint]["bytes"] = histogram.sum
+        for (endpoint, status), count in self._counters["upstream_responses_total"].items():
+            endpoints[endpoint].setdefault("statuses", {})[status] = count
+        for (endpoint,), count in self._counters["upstream_retries_total"].items():
+            endpoints[endpoint]["retries"] = count
+        lookups: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for (endpoint, result), count in self._counters["cache_lookups_total"].items():
+            lookups[endpoint][result] = count
+        for endpoint, results in lookups.items():
+            hits = sum(results.get(result, 0) for result in CACHE_HITS)
+            endpoints[endpoint]["cache_hit_ratio"] = hits / sum(results.values())
+
+        tools: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for (tool,), histogram in self._histograms["tool_call_duration_seconds"].items():
+            tools[tool].update(
+                calls=histogram.count,
+                mean_seconds=histogram.sum / histogram.count,
+                p50_seconds=histogram.quantile(0.5),
+                p95_seconds=histogram.quantile(0.95),
+            )
+        for (tool,), histogram in self._histograms["tool_result_bytes"].items():
+            tools[tool]["bytes"] = histogram.sum
+        for (tool, outcome), count in self._counters["tool_calls_total"].items():
+            if outcome != "ok":
+                tools[tool].setdefault("errors", {})[outcome] = count
+        tool_classes: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for (tool_class,), histogram in self._histograms["tool_queue_wait_seconds"].items():
+            tool_classes[tool_class].update(
+                admitted=histogram.count,
+                mean_queue_seconds=histogram.sum / histogram.count,
+                p95_queue_seconds=histogram.quantile(0.95),
+            )
+        for (tool_class,), count in self._counters["tool_calls_rejected_total"].items():
+            tool_classes[tool_class]["rejected"] = count
+        for (tool_class,), count in self._counters["tool_calls_inflight"].items():
+            tool_classes[tool_class]["inflight"] = count
+
+        hosts: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for key, name in (
+            ("circuit_state", "circuit_breaker_state"),
+            ("circuit_opened", "circuit_breaker_opened_total"),
+            ("circuit_rejected", "circuit_breaker_rejected_total"),
+        ):
+            for (host,), value in self._counters[name].items():
+                hosts[host][key] = value
+        return {
+            "endpoints": dict(endpoints),
+            "tools": dict(tools),
+            "tool_classes": dict(tool_classes),
+            "hosts": dict(hosts),
+        }
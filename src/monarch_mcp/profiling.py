@@ -0,0 +1,232 @@
+# src/monarch_mcp/profiling.py
+"""
+Diagnostics for a running server that cannot be attached to with a debugger
+(e.g. a stdio subprocess of an MCP host).
+
+SamplingProfiler samples the stack of the event loop thread from a background
+thread and writes collapsed stacks (the input format of flamegraph.pl and
+speedscope), rooted at the tool whose call was running. LoopLagMonitor logs
+when the event loop is blocked, together with the stack that blocked it.
+"""
+import asyncio
+import collections
+import contextlib
+import contextvars
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from types import FrameType
+from typing import Any, Counter, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Frames of this function carry the name of the tool being called in the local "name"
+TOOL_FRAME = ("_call_tool", "name")
+
+# Name of the tool whose call the current context belongs to; tasks spawned by
+# the call (upstream fetches, batch lookups, dossier sections) inherit it
+_current_tool: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("monarch_tool", default=None)
+
+
+@contextlib.contextmanager
+def tool_context(name: str) -> Iterator[None]:
+    """Attributes the samples taken within the context, and in tasks spawned from it, to a tool."""
+    token = _current_tool.set(name)
+    try:
+        yield
+    finally:
+        _current_tool.reset(token)
+
+
+def running_tool(loop: Optional[asyncio.AbstractEventLoop]) -> Optional[str]:
+    """
+    Returns the tool that the task currently running on loop works for, read
+    from the context of the task. Safe to call from another thread. Returns
+    None between tasks, outside tool calls, and before Python 3.12, where the
+    context of a task cannot be read.
+    """
+    task = asyncio.current_task(loop) if loop is not None else None
+    get_context = getattr(task, "get_context", None)
+    if get_context is None:
+        return None
+    return get_context().get(_current_tool)
+
+
+def frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_qualname}"
+
+
+def walk_stack(frame: Optional[FrameType]) -> Tuple[List[str], Optional[str]]:
+    """
+    Returns the labels of a stack from its outermost frame to frame, and the
+    name of the tool being called in it (None when no frame of the stack is a
+    tool call, e.g. in a task spawned by one).
+    """
+    labels: List[str] = []
+    tool = None
+    function, local = TOOL_FRAME
+    while frame is not None:
+        labels.append(frame_label(frame))
+        if tool is None and frame.f_code.co_name == function:
+            tool = frame.f_locals.get(local)
+        frame = frame.f_back
+    labels.reverse()
+    return labels, tool
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread (the event loop thread) every `interval`
+    seconds. Samples taken while the loop runs a task are attributed to the
+    tool call the task belongs to, including tasks the call spawned, such as
+    upstream fetches that decode the responses.
+
+    Profiles are written per window of `window` seconds to output_dir as
+    profile-<pid>-<time>-<n>.collapsed, one "tool:<name>;frame;...;frame count"
+    line per distinct stack.
+    """
+
+    def __init__(self, interval: float = 0.005, window: float = 60.0, output_dir: Optional[str] = None):
+        self.interval = interval
+        self.window = window
+        self.output_dir = output_dir or tempfile.gettempdir()
+        self.dumps: List[str] = []
+        self._samples: Counter[str] = collections.Counter()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_env(cls) -> "SamplingProfiler":
+        return cls(
+            interval=float(os.getenv("MONARCH_PROFILE_INTERVAL", "0.005")),
+            window=float(os.getenv("MONARCH_PROFILE_WINDOW", "60")),
+            output_dir=os.getenv("MONARCH_PROFILE_DIR"),
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, continuous: bool = False, thread_id: Optional[int] = None) -> None:
+        """
+        Starts sampling the given thread (the calling one by default) for one
+        window, or window after window when continuous. Does nothing while a
+        profile is already running. Tasks are attributed to tool calls when
+        called from the event loop thread.
+        """
+        if self.running:
+            return
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(thread_id or threading.get_ident(), continuous),
+            name="monarch-profiler",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Profiling the event loop every {self.interval * 1000:g} ms in {self.window:g} s windows")
+
+    def stop(self) -> None:
+        """Stops sampling and writes the current window."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, thread_id: int, continuous: bool) -> None:
+        window_ends_at = time.monotonic() + self.window
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                labels, tool = walk_stack(frame)
+                tool = running_tool(self._loop) or tool
+                root = f"tool:{tool}" if tool is not None else "(no tool)"
+                self._samples[";".join([root] + labels)] += 1
+                del frame
+            if time.monotonic() >= window_ends_at:
+                self._dump()
+                if not continuous:
+                    return
+                window_ends_at = time.monotonic() + self.window
+        self._dump()
+
+    def _dump(self) -> None:
+        samples, self._samples = self._samples, collections.Counter()
+        if not samples:
+            return
+        name = f"profile-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}-{len(self.dumps)}.collapsed"
+        path = os.path.join(self.output_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+        self.dumps.append(path)
+        logger.info(f"Wrote {sum(samples.values())} profile samples to {path}")
+
+
+class LoopLagMonitor:
+    """
+    Detects event loop stalls. A coroutine ticks every `interval` seconds; a
+    watchdog thread notices when a tick is more than `threshold` seconds late
+    and captures the stack of the loop thread, which shows the blocking code
+    (e.g. JSON encoding of a large result). Stalls are logged as warnings.
+    """
+
+    def __init__(self, threshold: float = 0.1, interval: float = 0.05):
+        self.threshold = threshold
+        self.interval = interval
+        self.stalls = 0
+        self.max_lag = 0.0
+        self._next_tick = 0.0
+        self._blocking_stack: Optional[List[str]] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_env(cls) -> Optional["LoopLagMonitor"]:
+        """Builds a monitor from MONARCH_LOOP_LAG_THRESHOLD (seconds), or None when it is unset or 0."""
+        threshold = float(os.getenv("MONARCH_LOOP_LAG_THRESHOLD", "0"))
+        return cls(threshold) if threshold > 0 else None
+
+    async def run(self) -> None:
+        """Monitors the running loop until cancelled."""
+        thread_id = threading.get_ident()
+        self._stop.clear()
+        self._next_tick = time.monotonic() + self.interval
+        watchdog = threading.Thread(target=self._watch, args=(thread_id,), name="monarch-loop-watchdog", daemon=True)
+        watchdog.start()
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                now = time.monotonic()
+                lag = now - self._next_tick
+                self._next_tick = now + self.interval
+                if lag > self.threshold:
+                    self._report(lag)
+        finally:
+            self._stop.set()
+
+    def _watch(self, thread_id: int) -> None:
+        while not self._stop.wait(self.interval / 2):
+            if self._blocking_stack is None and time.monotonic() - self._next_tick > self.threshold:
+                frame = sys._current_frames().get(thread_id)
+                if frame is not None:
+                    self._blocking_stack = walk_stack(frame)[0]
+                    del frame
+
+    def _report(self, lag: float) -> None:
+        self.stalls += 1
+        self.max_lag = max(self.max_lag, lag)
+        stack, self._blocking_stack = self._blocking_stack, None
+        where = " <- ".join(reversed(stack[-6:])) if stack else "unknown"
+        logger.warning(f"Event loop blocked for {lag * 1000:.0f} ms in {where}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"stalls": self.stalls, "max_lag_seconds": self.max_lag}
@@ -0,0 +1,45 @@
+# src/monarch_mcp/projection.py
+from typing import Any, Dict, List, Sequence
+
+
+def _select(item: Any, paths: List[List[str]]) -> Any:
+    if not isinstance(item, dict):
+        return item
+    # Group the paths by their first key so "a.b" and "a.c" select from the same "a"
+    grouped: Dict[str, List[List[str]]] = {}
+    for path in paths:
+        grouped.setdefault(path[0], []).append(path[1:])
+    selected: Dict[str, Any] = {}
+    for key, rests in grouped.items():
+        if key not in item:
+            continue
+        value = item[key]
+        if any(not rest for rest in rests):
+            selected[key] = value
+        elif isinstance(value, list):
+            selected[key] = [_select(element, rests) for element in value]
+        elif isinstance(value, dict):
+            selected[key] = _select(value, rests)
+    return selected
+
+
+def project(data: Any, fields: Sequence[str]) -> Any:
+    """
+    Returns a copy of a tool result that only contains the given fields.
+
+    Fields are key names, optionally dotted to reach into nested objects (e.g.
+    "subject", "similarity.ancestor_label"). For paginated results the fields
+    apply to each entry of "items" while the pagination keys are kept; for
+    lists they apply to every element. The input is never modified, so cached
+    responses can be projected safely.
+    """
+    paths = [field.split(".") for field in fields if field]
+    if not paths:
+        return data
+    if isinstance(data, list):
+        return [_select(element, paths) for element in data]
+    if isinstance(data, dict) and isinstance(data.get("items"), list):
+        projected = {key: value for key, value in data.items() if key != "items"}
+        projected["items"] = [_select(item, paths) for item in data["items"]]
+        return projected
+    return _select(data, paths)
@@ -0,0 +1,189 @@
+# src/monarch_mcp/ratelimit.py
+import asyncio
+import collections
+import os
+import time
+from typing import Any, Deque, Dict, Optional
+
+# Request priority classes, most urgent first. Waiting interactive requests are
+# granted slots before waiting bulk ones (large batches, fetch_all pagination).
+INTERACTIVE = 0
+BULK = 1
+PRIORITIES = {"interactive": INTERACTIVE, "bulk": BULK}
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: allows `rate` requests per second on average with
+    bursts of up to `burst` requests.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.waited_seconds = 0.0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["TokenBucket"]:
+        """
+        Builds a rate limiter from MONARCH_RATE_LIMIT (requests per second), or
+        returns None when no rate limit is configured.
+        """
+        rate = float(os.getenv("MONARCH_RATE_LIMIT", "0"))
+        if rate <= 0:
+            return None
+        return cls(rate, burst=int(os.getenv("MONARCH_RATE_LIMIT_BURST", str(max(1, int(rate))))))
+
+    async def acquire(self) -> None:
+        """Waits until a token is available and consumes it."""
+        # The lock makes waiters queue up in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+                self.waited_seconds += delay
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"rate": self.rate, "burst": self.burst, "waited_seconds": self.waited_seconds}
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of concurrent upstream requests using AIMD.
+
+    Every successful request raises the limit by 1/limit (about +1 per round of
+    requests). A throttled response (429) or a latency spike halves it. A
+    latency spike is a response slower than latency_tolerance times the
+    smoothed baseline of its endpoint template and at least min_latency_increase
+    seconds above it, so slow endpoints and scheduling jitter are not mistaken
+    for congestion. Decreases are at least decrease_cooldown seconds apart so a
+    burst of failures counts as one signal.
+
+    Waiting requests are granted slots by priority and in arrival order within
+    a priority, so interactive requests jump ahead of queued bulk ones.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        min_latency_increase: float = 0.05,
+        decrease_cooldown: float = 1.0,
+        smoothing: float = 0.1,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.min_latency_increase = min_latency_increase
+        self.decrease_cooldown = decrease_cooldown
+        self.smoothing = smoothing
+        # Smoothed latency per endpoint template
+        self.baseline_latencies: Dict[Optional[str], float] = {}
+        self.inflight = 0
+        self.last_decrease_at: Optional[float] = None
+        self.decreases = 0
+        self._waiters: Dict[int, Deque[asyncio.Future]] = {
+            level: collections.deque() for level in sorted(PRIORITIES.values())
+        }
+
+    @classmethod
+    def from_env(cls) -> "AdaptiveConcurrencyLimiter":
+        return cls(
+            initial_limit=int(os.getenv("MONARCH_CONCURRENCY_INITIAL", "8")),
+            min_limit=int(os.getenv("MONARCH_CONCURRENCY_MIN", "1")),
+            max_limit=int(os.getenv("MONARCH_CONCURRENCY_MAX", "64")),
+            min_latency_increase=float(os.getenv("MONARCH_CONCURRENCY_MIN_LATENCY_INCREASE", "0.05")),
+            decrease_cooldown=float(os.getenv("MONARCH_CONCURRENCY_DECREASE_COOLDOWN", "1")),
+        )
+
+    @property
+    def current_limit(self) -> int:
+        return int(self.limit)
+
+    @property
+    def queued(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, priority: int = INTERACTIVE) -> None:
+        """
+        Waits for a free slot. Slots are granted by priority, then in arrival order.
+        """
+        waiters = self._waiters[priority]
+        if self.inflight < self.current_limit and not any(
+            self._waiters[level] for level in self._waiters if level <= priority
+        ):
+            self.inflight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled; give it back
+                self.release()
+            else:
+                waiters.remove(waiter)
+            raise
+
+    def release(self, latency: Optional[float] = None, throttled: bool = False, key: Optional[str] = None) -> None:
+        """
+        Frees a slot and feeds the outcome of the request into the limit. Pass no
+        latency for requests that did not complete (errors, cancellation), and
+        the endpoint template as key so latencies are compared per endpoint.
+        """
+        self.inflight -= 1
+        if throttled:
+            self._decrease()
+        elif latency is not None:
+            baseline = self.baseline_latencies.get(key)
+            if (
+                baseline is not None
+                and latency > baseline * self.latency_tolerance
+                and latency - baseline >= self.min_latency_increase
+            ):
+                self._decrease()
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.baseline_latencies[key] = latency if baseline is None else (
+                (1 - self.smoothing) * baseline + self.smoothing * latency
+            )
+        self._wake_waiters()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.current_limit,
+            "inflight": self.inflight,
+            "queued": self.queued,
+            "queued_by_priority": {name: len(self._waiters[level]) for name, level in PRIORITIES.items()},
+            "decreases": self.decreases,
+            "baseline_latencies": dict(self.baseline_latencies),
+        }
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if self.last_decrease_at is not None and now - self.last_decrease_at < self.decrease_cooldown:
+            return
+        self.limit = max(self.min_limit, self.limit / 2)
+        self.last_decrease_at = now
+        self.decreases += 1
+
+    def _wake_waiters(self) -> None:
+        for waiters in self._waiters.values():
+            while waiters and self.inflight < self.current_limit:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self.inflight += 1
+                    waiter.set_result(None)
@@ -0,0 +1,139 @@
+# src/monarch_mcp/resilience.py
+import email.utils
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+# Status codes that indicate a transient upstream problem worth retrying.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the upstream circuit is open."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header given either in seconds or as an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient upstream failures.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        max_retry_after: float = 60.0,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(
+            max_retries=int(os.getenv("MONARCH_MAX_RETRIES", "3")),
+            backoff_base=float(os.getenv("MONARCH_RETRY_BACKOFF", "0.5")),
+            backoff_max=float(os.getenv("MONARCH_RETRY_BACKOFF_MAX", "10")),
+        )
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns the delay before retry number attempt (0-based). A Retry-After
+        value from the server takes precedence over the computed backoff.
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and requests
+    fail fast. Once reset_timeout has passed a single probe request is let
+    through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at: Optional[float] = None
+        self.times_opened = 0
+        self.rejected_requests = 0
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        return cls(
+            failure_threshold=int(os.getenv("MONARCH_CIRCUIT_FAILURE_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv("MONARCH_CIRCUIT_RESET_TIMEOUT", "30")),
+        )
+
+    def allow_request(self) -> bool:
+        """Returns whether a request may be sent, moving open circuits to half-open when due."""
+        now = time.monotonic()
+        if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self.probe_started_at = None
+        if self.state == self.HALF_OPEN:
+            # Allow one probe at a time; a probe that never reported back is replaced
+            if self.probe_started_at is None or now - self.probe_started_at >= self.reset_timeout:
+                self.probe_started_at = now
+                return True
+        elif self.state == self.CLOSED:
+            return True
+        self.rejected_requests += 1
+        return False
+
+    def release_probe(self) -> None:
+        """Lets another probe through after the current one was abandoned without an outcome."""
+        if self.state == self.HALF_OPEN:
+            self.probe_started_at = None
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.probe_started_at = None
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.probe_started_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected_requests": self.rejected_requests,
+        }
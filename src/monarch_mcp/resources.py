@@ -0,0 +1,208 @@
+# src/monarch_mcp/resources.py
+"""
+Large tool results kept on the server and exposed as MCP resources.
+
+A result above the size threshold is stored once as its serialized JSON, and
+the tool returns a small summary with the resource URI instead. Clients read
+the URI whole, as JSON, or in fixed-size chunks of plain text
+(monarch://results/<id>/chunks/<n>), whose concatenation is the full JSON
+document. Results are kept per process,
+in a store bounded by total size and expiring after a period of inactivity.
+
+Storing results is opt-in (MONARCH_RESOURCE_THRESHOLD), since clients that
+cannot read resources would only see the summary, and it is disabled with
+several worker processes, which do not share stored results.
+"""
+import collections
+import logging
+import os
+import secrets
+import time
+from typing import Any, Dict, List, Optional, OrderedDict, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEME = "monarch"
+RESULTS_PREFIX = f"{SCHEME}://results/"
+MIME_TYPE = "application/json"
+# A slice of a JSON document is not JSON itself
+CHUNK_MIME_TYPE = "text/plain"
+# Items of a paginated result included in its summary
+PREVIEW_ITEMS = 3
+
+
+class ResourceNotFound(ValueError):
+    """Raised for a resource URI that is malformed, unknown or expired."""
+
+
+class StoredResult:
+    __slots__ = ("id", "tool", "text", "size", "created", "expires_at")
+
+    def __init__(self, result_id: str, tool: str, text: str, expires_at: float):
+        self.id = result_id
+        self.tool = tool
+        self.text = text
+        # Size in bytes of the UTF-8 encoded text, which differs from its length for non-ASCII text
+        self.size = len(text.encode())
+        self.created = time.time()
+        self.expires_at = expires_at
+
+    @property
+    def uri(self) -> str:
+        return f"{RESULTS_PREFIX}{self.id}"
+
+
+class ResultStore:
+    """
+    Holds serialized tool results for reading as resources. Results larger
+    than `threshold` characters are stored; the store keeps at most
+    `max_bytes` of them, UTF-8 encoded (the least recently read is dropped
+    first), each for `ttl` seconds after it was last read. Chunks are
+    `chunk_size` characters.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 262144,
+        chunk_size: int = 65536,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 900.0,
+    ):
+        self.threshold = threshold
+        self.chunk_size = max(1, chunk_size)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bytes = 0
+        self.stored = 0
+        self.evicted = 0
+        self.expired = 0
+        self._results: OrderedDict[str, StoredResult] = collections.OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResultStore"]:
+        """
+        Builds the store from MONARCH_RESOURCE_THRESHOLD and related variables,
+        or returns None when results are always returned inline: when no
+        threshold is set, or when the server runs several worker processes
+        (MONARCH_WORKERS), where a read could reach another worker.
+        """
+        threshold = int(os.getenv("MONARCH_RESOURCE_THRESHOLD", "0"))
+        if threshold <= 0:
+            return None
+        if int(os.getenv("MONARCH_WORKERS", "1")) > 1:
+            logger.warning("MONARCH_RESOURCE_THRESHOLD is ignored with several worker processes; results are returned inline")
+            return None
+        return cls(
+            threshold=threshold,
+            chunk_size=int(os.getenv("MONARCH_RESOURCE_CHUNK_SIZE", "65536")),
+            max_bytes=int(os.getenv("MONARCH_RESOURCE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl=float(os.getenv("MONARCH_RESOURCE_TTL", "900")),
+        )
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def should_store(self, text: str) -> bool:
+        return len(text) > self.threshold
+
+    def put(self, tool: str, text: str, data: Any) -> Dict[str, Any]:
+        """Stores the serialized result of a tool and returns the summary sent in its place."""
+        self._purge()
+        stored = StoredResult(secrets.token_urlsafe(12), tool, text, time.monotonic() + self.ttl)
+        self._results[stored.id] = stored
+        self.bytes += stored.size
+        self.stored += 1
+        while self.bytes > self.max_bytes and len(self._results) > 1:
+            self._drop(next(iter(self._results)))
+            self.evicted += 1
+        chunk_count = -(-len(text) // self.chunk_size)
+        return {
+            "resource_uri": stored.uri,
+            "mime_type": MIME_TYPE,
+            "size": len(text),
+            "chunk_count": chunk_count,
+            "chunk_uri_template": f"{stored.uri}/chunks/{{n}}",
+            "expires_in_seconds": self.ttl,
+            "summary": summarize(data),
+            "message": (
+                f"The result of {tool} is {len(text)} characters, too large to return inline. "
+                f"Read {stored.uri} as a resource, or its chunks 0 to {chunk_count - 1}."
+            ),
+        }
+
+    def read(self, uri: str) -> str:
+        """Returns the JSON text of a stored result, or of one chunk of it."""
+        result_id, chunk = self._parse(uri)
+        self._purge()
+        stored = self._results.get(result_id)
+        if stored is None:
+            raise ResourceNotFound(f"Unknown or expired resource: {uri}; repeat the tool call to store it again")
+        self._results.move_to_end(result_id)
+        stored.expires_at = time.monotonic() + self.ttl
+        if chunk is None:
+            return stored.text
+        start = chunk * self.chunk_size
+        if start >= len(stored.text):
+            raise ResourceNotFound(f"Chunk {chunk} is out of range for {stored.uri}")
+        return stored.text[start:start + self.chunk_size]
+
+    @classmethod
+    def mime_type(cls, uri: str) -> str:
+        """Returns the MIME type of a resource: JSON for a whole result, plain text for a chunk of one."""
+        return MIME_TYPE if cls._parse(uri)[1] is None else CHUNK_MIME_TYPE
+
+    def list(self) -> List[StoredResult]:
+        """Returns the stored results, least recently read first."""
+        self._purge()
+        return list(self._results.values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "results": len(self._results),
+            "bytes": self.bytes,
+            "stored": self.stored,
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
+
+    @staticmethod
+    def _parse(uri: str) -> Tuple[str, Optional[int]]:
+        uri = str(uri)
+        if not uri.startswith(RESULTS_PREFIX):
+            raise ResourceNotFound(f"Unknown resource: {uri}")
+        parts = uri[len(RESULTS_PREFIX):].split("/")
+        if len(parts) == 1 and parts[0]:
+            return parts[0], None
+        if len(parts) == 3 and parts[0] and parts[1] == "chunks" and parts[2].isdigit():
+            return parts[0], int(parts[2])
+        raise ResourceNotFound(f"Malformed resource URI: {uri}")
+
+    def _drop(self, result_id: str) -> None:
+        stored = self._results.pop(result_id)
+        self.bytes -= stored.size
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        while self._results:
+            stored = next(iter(self._results.values()))
+            if stored.expires_at > now:
+                break
+            self._drop(stored.id)
+            self.expired += 1
+
+
+def summarize(data: Any) -> Dict[str, Any]:
+    """Describes the shape of a result: its pagination keys and a preview of its items."""
+    if isinstance(data, list):
+        return {"type": "list", "length": len(data), "preview": data[:PREVIEW_ITEMS]}
+    if not isinstance(data, dict):
+        return {"type": type(data).__name__}
+    summary: Dict[str, Any] = {"type": "object", "keys": list(data)}
+    for key in ("total", "limit", "offset", "truncated", "next_cursor"):
+        if key in data:
+            summary[key] = data[key]
+    items = data.get("items")
+    if isinstance(items, list):
+        summary["item_count"] = len(items)
+        summary["preview"] = items[:PREVIEW_ITEMS]
+    return summary
@@ -1,19 +1,49 @@
+import argparse
 import asyncio
-import json
-from typing import Any, Dict, Type
+import contextlib
+from typing import Any, Dict
 import logging
 import os
+import shutil
+import signal
+import tempfile
+import time
 
 from mcp.server import Server
+from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+import jsonschema
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 import mcp.types as types
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+import uvicorn
 
-from .client import MonarchClient
-from .tools import ALL_TOOLS, API_CLASS_MAP
+from . import codec
+from . import profiling, tools, tracing
+from .admission import AdmissionController, OverloadedError
+from .client import DeadlineExceeded, MonarchClient, deadline, load_env
+from .profiling import LoopLagMonitor, SamplingProfiler
+from .projection import project
+from .resources import MIME_TYPE, ResultStore
+from .tools import TOOL_INDEX, build_dispatch_table, module_api_class, module_tools
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+class StreamableHTTPEndpoint:
+    """
+    ASGI app passing requests to a streamable HTTP session manager. Starlette
+    serves an endpoint that is not a function as a raw ASGI app.
+    """
+    def __init__(self, session_manager: StreamableHTTPSessionManager):
+        self.session_manager = session_manager
+
+    async def __call__(self, scope, receive, send):
+        await self.session_manager.handle_request(scope, receive, send)
+
 class MonarchMcpServer:
     """
     MCP Server for Monarch Initiative data.
@@ -23,7 +53,28 @@ class MonarchMcpServer:
         self.server_version = "0.1.0"
         self.mcp_server = Server(self.server_name, self.server_version)
         self.client = MonarchClient()
-        self._api_instances: Dict[Type, Any] = {}
+        # Overall deadline for a single tool call, including all upstream requests (0 disables it)
+        self.tool_timeout = float(os.getenv("MONARCH_TOOL_TIMEOUT", "120")) or None
+        # Result layout ("pretty" or "compact") and per-tool default field projections
+        self.output_format = os.getenv("MONARCH_OUTPUT_FORMAT", "pretty")
+        self.tool_fields: Dict[str, list] = codec.loads(os.getenv("MONARCH_TOOL_FIELDS") or "{}")
+        # Bounds concurrent tool calls and sheds load beyond the wait queue (None disables it)
+        self.admission = AdmissionController.from_env()
+        # Results above a size threshold are stored and returned as resource URIs (None disables it)
+        self.results = ResultStore.from_env()
+        # Seconds between metrics summaries in the log in stdio mode (0 disables them)
+        self.metrics_log_interval = float(os.getenv("MONARCH_METRICS_LOG_INTERVAL", "300"))
+        # Sampling profiler: "off", "on" (profile continuously) or "signal" (SIGUSR1 profiles one window)
+        self.profile_mode = os.getenv("MONARCH_PROFILE", "off")
+        self.profiler = SamplingProfiler.from_env()
+        self.lag_monitor = LoopLagMonitor.from_env()
+        # Tool name -> bound coroutine, and tool name -> compiled schema
+        # validator. These are plain dicts filled per tool module the first time
+        # one of its tools is called, rather than tables built once at startup,
+        # so that tool modules are only imported when they are used
+        self._dispatch: Dict[str, Any] = {}
+        self._validators: Dict[str, Any] = {}
+        self._entity_api = None
         self._setup_handlers()
         logger.info(f"{self.server_name} v{self.server_version} initialized.")
 
@@ -33,64 +84,370 @@ class MonarchMcpServer:
         @self.mcp_server.list_tools()
         async def handle_list_tools() -> list[types.Tool]:
             """Returns the list of all available tools."""
-            return ALL_TOOLS
+            return self.list_tools()
 
-        @self.mcp_server.call_tool()
+        # Arguments are validated in call_tool with precompiled validators
+        @self.mcp_server.call_tool(validate_input=False)
         async def handle_call_tool(
             name: str, arguments: Dict[str, Any]
         ) -> list[types.TextContent]:
             """Handles a tool call request."""
-            logger.info(f"Handling call for tool: '{name}'")
-            
-            try:
-                if name not in API_CLASS_MAP:
-                    raise ValueError(f"Unknown tool: {name}")
-
-                api_class = API_CLASS_MAP[name]
-                
-                if api_class not in self._api_instances:
-                    self._api_instances[api_class] = api_class()
-                
-                api_instance = self._api_instances[api_class]
-                
-                if not hasattr(api_instance, name):
-                    raise ValueError(f"Tool method '{name}' not found")
-                
-                func_to_call = getattr(api_instance, name)
-                result_data = await func_to_call(self.client, **arguments)
-                
-                result_json = json.dumps(result_data, indent=2)
-                return [types.TextContent(type="text", text=result_json)]
-
-            except Exception as e:
-                logger.error(f"Error calling tool '{name}': {str(e)}", exc_info=True)
-                error_response = {
-                    "error": type(e).__name__,
-                    "message": str(e),
-                    "tool_name": name
-                }
-                return [types.TextContent(type="text", text=json.dumps(error_response, indent=2))]
+            return await self.call_tool(name, arguments)
+
+        @self.mcp_server.list_resources()
+        async def handle_list_resources() -> list[types.Resource]:
+            """Returns the stored large tool results."""
+            return self.list_resources()
+
+        @self.mcp_server.read_resource()
+        async def handle_read_resource(uri) -> list[ReadResourceContents]:
+            """Returns a stored tool result, or one chunk of it."""
+            content = self.read_resource(str(uri))
+            return [ReadResourceContents(content=content, mime_type=ResultStore.mime_type(str(uri)))]
+
+    def list_tools(self) -> list[types.Tool]:
+        """Returns the definitions of all tools, importing the tool modules on first use."""
+        return tools.ALL_TOOLS
+
+    def _resolve_tool(self, name: str):
+        """Returns the bound coroutine implementing a tool, loading its module on first use."""
+        func = self._dispatch.get(name)
+        if func is None:
+            module_name = TOOL_INDEX.get(name)
+            if module_name is None:
+                raise ValueError(f"Unknown tool: {name}")
+            if self._entity_api is None:
+                self._entity_api = module_api_class("entity")()
+            self._dispatch.update(build_dispatch_table(self._entity_api, [module_name]))
+            for tool in module_tools(module_name):
+                self._validators[tool.name] = jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+            func = self._dispatch[name]
+        return func
+
+    def list_resources(self) -> list[types.Resource]:
+        """Returns the tool results currently stored as resources."""
+        if self.results is None:
+            return []
+        return [
+            types.Resource(
+                uri=stored.uri,
+                name=f"{stored.tool} result",
+                description=f"Result of a {stored.tool} call, readable in chunks of {self.results.chunk_size} characters",
+                mimeType=MIME_TYPE,
+                size=stored.size,
+            )
+            for stored in self.results.list()
+        ]
+
+    def read_resource(self, uri: str) -> str:
+        """Returns the JSON text of a stored tool result or of one of its chunks."""
+        if self.results is None:
+            raise ValueError(f"Unknown resource: {uri}")
+        return self.results.read(uri)
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> list[types.TextContent]:
+        """
+        Runs a tool and returns its JSON-encoded result. Every upstream request
+        made by the tool shares a deadline of tool_timeout seconds. When the
+        server is saturated the call waits in a bounded queue or is rejected
+        with an OverloadedError result.
+
+        The optional "fields" and "output_format" arguments are handled here: the
+        result is projected onto the fields before it is serialized. Results
+        larger than the resource threshold are stored and replaced by a
+        summary with the URI to read them from.
+
+        The call is traced as a span whose children are its upstream requests,
+        and profile samples of the call and of the tasks it spawns are
+        attributed to the tool.
+        """
+        with tracing.span("call_tool", tool=name), profiling.tool_context(name):
+            return await self._call_tool(name, arguments)
+
+    async def _call_tool(self, name: str, arguments: Dict[str, Any]) -> list[types.TextContent]:
+        logger.info(f"Handling call for tool: '{name}'")
+        arguments = arguments or {}
+        tool_arguments = dict(arguments)
+        fields = tool_arguments.pop("fields", None) or self.tool_fields.get(name)
+        output_format = tool_arguments.pop("output_format", None) or self.output_format
+        indent = None if output_format == "compact" else 2
+        started = time.monotonic()
+
+        try:
+            func_to_call = self._resolve_tool(name)
+            error = jsonschema.exceptions.best_match(self._validators[name].iter_errors(arguments))
+            if error is not None:
+                raise ValueError(f"Input validation error: {error.message}")
+
+            # The call holds its admission slot until its result is serialized
+            admission = (
+                self.admission.admit(TOOL_INDEX[name], self.client.metrics)
+                if self.admission is not None
+                else contextlib.nullcontext()
+            )
+            async with admission:
+                try:
+                    with deadline(self.tool_timeout):
+                        async with asyncio.timeout(self.tool_timeout):
+                            result_data = await func_to_call(self.client, **tool_arguments)
+                except TimeoutError:
+                    raise DeadlineExceeded(f"Tool call exceeded its deadline of {self.tool_timeout} seconds") from None
+
+                if fields:
+                    result_data = project(result_data, fields)
+                result_json = codec.dumps(result_data, indent=indent)
+                if self.results is not None and self.results.should_store(result_json):
+                    result_json = codec.dumps(self.results.put(name, result_json, result_data), indent=indent)
+            return self._tool_result(name, started, result_json)
+
+        except asyncio.CancelledError:
+            self.client.metrics.inc("tool_calls_total", self._metrics_tool_name(name), "cancelled")
+            raise
+
+        except OverloadedError as e:
+            logger.warning(f"Rejected call to tool '{name}': {str(e)}")
+            error_response = {
+                "error": type(e).__name__,
+                "message": str(e),
+                "tool_name": name,
+                "tool_class": TOOL_INDEX[name],
+            }
+            return self._tool_result(name, started, codec.dumps(error_response, indent=indent), type(e).__name__)
+        except DeadlineExceeded as e:
+            logger.warning(f"Tool '{name}' timed out: {str(e)}")
+            error_response = {
+                "error": type(e).__name__,
+                "message": str(e),
+                "tool_name": name,
+                "timeout_seconds": self.tool_timeout,
+            }
+            return self._tool_result(name, started, codec.dumps(error_response, indent=indent), type(e).__name__)
+        except Exception as e:
+            logger.error(f"Error calling tool '{name}': {str(e)}", exc_info=True)
+            error_response = {
+                "error": type(e).__name__,
+                "message": str(e),
+                "tool_name": name
+            }
+            return self._tool_result(name, started, codec.dumps(error_response, indent=indent), type(e).__name__)
+
+    @staticmethod
+    def _metrics_tool_name(name: str) -> str:
+        # Unknown names come from clients; folding them keeps the number of series bounded
+        return name if name in TOOL_INDEX else "unknown"
+
+    def _tool_result(self, name: str, started: float, text: str, outcome: str = "ok") -> list[types.TextContent]:
+        """Records the metrics of a finished tool call and wraps its JSON result."""
+        tool = self._metrics_tool_name(name)
+        metrics = self.client.metrics
+        metrics.observe("tool_call_duration_seconds", time.monotonic() - started, tool)
+        metrics.observe("tool_result_bytes", len(text), tool)
+        metrics.inc("tool_calls_total", tool, outcome)
+        span = tracing.current_span()
+        if span is not None:
+            span.set(outcome=outcome, result_bytes=len(text))
+        return [types.TextContent(type="text", text=text)]
+
+    async def log_metrics(self, interval: float):
+        """Logs a summary of the metrics every `interval` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            logger.info(f"Metrics: {codec.dumps(self.client.metrics.snapshot())}")
+
+    def start_diagnostics(self):
+        """Starts the profiler and the event loop lag monitor, as configured, on the running loop."""
+        if self.profile_mode == "on":
+            self.profiler.start(continuous=True)
+        elif self.profile_mode == "signal" and hasattr(signal, "SIGUSR1"):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, self.profiler.start)
+            logger.info(f"Send SIGUSR1 to pid {os.getpid()} to profile the next {self.profiler.window:g} seconds")
+        if self.lag_monitor is not None:
+            self._lag_monitor_task = asyncio.create_task(self.lag_monitor.run())
+
+    def stop_diagnostics(self):
+        """Stops the profiler, writing out the samples of the current window."""
+        self.profiler.stop()
+        if self.lag_monitor is not None:
+            self._lag_monitor_task.cancel()
 
     async def run(self):
         """Starts the MCP server."""
         logger.info(f"Starting {self.server_name} v{self.server_version}...")
-        
-        async with stdio_server() as (read_stream, write_stream):
-            await self.mcp_server.run(
-                read_stream, 
-                write_stream,
-                self.mcp_server.create_initialization_options()
+        # Open upstream connections in the background so the first tool call skips the handshake
+        self._warm_up_task = asyncio.create_task(self.client.warm_up())
+        if self.metrics_log_interval:
+            self._metrics_task = asyncio.create_task(self.log_metrics(self.metrics_log_interval))
+        self.start_diagnostics()
+
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.mcp_server.run(
+                    read_stream,
+                    write_stream,
+                    self.mcp_server.create_initialization_options()
+                )
+        finally:
+            self.stop_diagnostics()
+
+    def create_app(self, transport: str = "http", stateless: bool = False) -> Starlette:
+        """
+        Builds an ASGI app serving many concurrent MCP sessions from this server,
+        so every session shares one MonarchClient (connection pool and caches).
+
+        "http" serves the streamable HTTP transport at /mcp; "sse" serves the
+        legacy SSE transport at /sse with messages posted to /messages/. Both
+        serve Prometheus metrics at /metrics. A stateless HTTP app keeps no
+        per-session state between requests, which lets any worker process
+        answer any request.
+        """
+        if transport == "http":
+            session_manager = StreamableHTTPSessionManager(app=self.mcp_server, stateless=stateless)
+
+            # A Route rather than a Mount, so that /mcp is served without a redirect to /mcp/
+            routes = [
+                Route("/mcp", endpoint=StreamableHTTPEndpoint(session_manager), methods=["GET", "POST", "DELETE"])
+            ]
+            run_sessions = session_manager.run
+        elif transport == "sse":
+            sse = SseServerTransport("/messages/")
+
+            async def handle_sse(request):
+                async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+                    await self.mcp_server.run(
+                        read_stream,
+                        write_stream,
+                        self.mcp_server.create_initialization_options()
+                    )
+                return Response()
+
+            routes = [
+                Route("/sse", endpoint=handle_sse, methods=["GET"]),
+                Mount("/messages/", app=sse.handle_post_message),
+            ]
+            run_sessions = contextlib.nullcontext
+        else:
+            raise ValueError(f"Unknown HTTP transport: {transport}")
+
+        async def handle_metrics(request):
+            return Response(
+                self.client.metrics.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
             )
 
-def main():
+        routes.append(Route("/metrics", endpoint=handle_metrics, methods=["GET"]))
+
+        @contextlib.asynccontextmanager
+        async def lifespan(app: Starlette):
+            self._warm_up_task = asyncio.create_task(self.client.warm_up())
+            self.start_diagnostics()
+            async with run_sessions():
+                logger.info(f"{self.server_name} serving MCP over {transport} (pid {os.getpid()})")
+                yield
+            self.stop_diagnostics()
+            await self.client.close()
+
+        return Starlette(routes=routes, lifespan=lifespan)
+
+    async def run_http(self, transport: str = "http", host: str = "127.0.0.1", port: int = 8000):
+        """Starts the MCP server as a long-lived HTTP service."""
+        logger.info(f"Starting {self.server_name} v{self.server_version} on http://{host}:{port}...")
+        config = uvicorn.Config(self.create_app(transport), host=host, port=port, log_level="info")
+        await uvicorn.Server(config).serve()
+
+def create_worker_app() -> Starlette:
+    """
+    App factory used by each worker process in multi-worker mode. Every worker
+    has its own server and client; they share the SQLite disk cache.
+    """
+    tracing.configure_from_env()
+    return MonarchMcpServer().create_app("http", stateless=True)
+
+def run_workers(host: str, port: int, workers: int):
+    """
+    Runs `workers` processes serving stateless streamable HTTP behind one
+    listening socket, so JSON decoding and encoding of large results scales
+    across cores. Unless MONARCH_DISK_CACHE_PATH is set, the workers share a
+    disk cache in a private temporary directory, removed when they exit.
+    """
+    cache_dir = None
+    if not os.getenv("MONARCH_DISK_CACHE_PATH"):
+        # mkdtemp creates the directory readable by this user only, so other
+        # local users cannot plant responses in a predictable file
+        cache_dir = tempfile.mkdtemp(prefix="monarch-mcp-")
+        os.environ["MONARCH_DISK_CACHE_PATH"] = os.path.join(cache_dir, "cache.sqlite")
+    # Tells the workers that per-process state (cursors, stored results) is not shared
+    os.environ["MONARCH_WORKERS"] = str(workers)
+    logger.info(
+        f"Starting {workers} workers on http://{host}:{port} "
+        f"sharing disk cache {os.environ['MONARCH_DISK_CACHE_PATH']}..."
+    )
+    try:
+        uvicorn.run(
+            "monarch_mcp.server:create_worker_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            log_level="info",
+        )
+    finally:
+        if cache_dir is not None:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="monarch_mcp.server", description="Monarch Initiative MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        default=os.getenv("MONARCH_TRANSPORT", "stdio"),
+        help="stdio serves a single client; http (streamable HTTP) and sse serve many concurrent sessions",
+    )
+    parser.add_argument("--host", default=os.getenv("MONARCH_HOST", "127.0.0.1"), help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=int(os.getenv("MONARCH_PORT", "8000")), help="HTTP port")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("MONARCH_WORKERS", "1")),
+        help="number of worker processes for the http transport (stateless sessions, shared disk cache)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["off", "on", "signal"],
+        default=os.getenv("MONARCH_PROFILE", "off"),
+        help="sample the event loop continuously (on) or for one window per SIGUSR1 (signal) and write collapsed stacks",
+    )
+    parser.add_argument(
+        "--loop-lag-threshold",
+        type=float,
+        default=float(os.getenv("MONARCH_LOOP_LAG_THRESHOLD", "0")),
+        help="log the blocking stack whenever the event loop stalls for longer than this many seconds (0 disables it)",
+    )
+    args = parser.parse_args(argv)
+    if args.workers > 1 and args.transport != "http":
+        parser.error("--workers requires --transport http")
+    return args
+
+def main(argv=None):
     """Main entry point."""
+    load_env()
+    tracing.configure_from_env()
+    args = parse_args(argv)
+    # Passed on through the environment so worker processes pick them up too
+    os.environ["MONARCH_PROFILE"] = args.profile
+    os.environ["MONARCH_LOOP_LAG_THRESHOLD"] = str(args.loop_lag_threshold)
+    if args.workers > 1:
+        run_workers(args.host, args.port, args.workers)
+        return
     server = MonarchMcpServer()
     try:
-        asyncio.run(server.run())
+        if args.transport == "stdio":
+            asyncio.run(server.run())
+        else:
+            asyncio.run(server.run_http(args.transport, args.host, args.port))
     except KeyboardInterrupt:
         logger.info("Server interrupted by user.")
     finally:
         asyncio.run(server.client.close())
+        tracing.set_exporter(None)
         logger.info("Server shutdown complete.")
 
 if __name__ == "__main__":
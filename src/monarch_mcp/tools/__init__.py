@@ -1,50 +1,117 @@
-from .entity import ENTITY_TOOLS, EntityApi
-from .disease import DISEASE_TOOLS, DiseaseApi
-from .gene import GENE_TOOLS, GeneApi
-from .phenotype import PHENOTYPE_TOOLS, PhenotypeApi
-from .similarity import SIMILARITY_TOOLS, SimilarityApi
-from .search import SEARCH_TOOLS, SearchApi
-from .histopheno import HISTOPHENO_TOOLS, HistoPhenoApi
-from .mapping import MAPPING_TOOLS, MappingApi
-from .chemical import CHEMICAL_TOOLS, ChemicalApi
-from .variant import VARIANT_TOOLS, VariantApi
-from .protein import PROTEIN_TOOLS, ProteinApi
-
-# Aggregate all tools
-ALL_TOOLS = (
-    ENTITY_TOOLS +
-    DISEASE_TOOLS +
-    GENE_TOOLS +
-    PHENOTYPE_TOOLS +
-    SIMILARITY_TOOLS +
-    SEARCH_TOOLS +
-    HISTOPHENO_TOOLS +
-    MAPPING_TOOLS +
-    CHEMICAL_TOOLS +
-    VARIANT_TOOLS +
-    PROTEIN_TOOLS
-)
-
-# Map tool names to API classes
-API_CLASS_MAP = {
-    **{tool.name: EntityApi for tool in ENTITY_TOOLS},
-    **{tool.name: DiseaseApi for tool in DISEASE_TOOLS},
-    **{tool.name: GeneApi for tool in GENE_TOOLS},
-    **{tool.name: PhenotypeApi for tool in PHENOTYPE_TOOLS},
-    **{tool.name: SimilarityApi for tool in SIMILARITY_TOOLS},
-    **{tool.name: SearchApi for tool in SEARCH_TOOLS},
-    **{tool.name: HistoPhenoApi for tool in HISTOPHENO_TOOLS},
-    **{tool.name: MappingApi for tool in MAPPING_TOOLS},
-    **{tool.name: ChemicalApi for tool in CHEMICAL_TOOLS},
-    **{tool.name: VariantApi for tool in VARIANT_TOOLS},
-    **{tool.name: ProteinApi for tool in PROTEIN_TOOLS},
+"""
+Tool modules are imported on first use: the registry knows every tool name
+without loading them, listing tools only imports their definitions, and
+ALL_TOOLS, API_CLASS_MAP and the API classes are resolved lazily when accessed.
+"""
+import importlib
+import inspect
+from types import MappingProxyType, ModuleType
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional
+
+import mcp.types as types
+
+from .registry import API_CLASS_MODULES, TOOL_INDEX, TOOL_MODULES
+
+# Output options understood by the server for every tool; they are removed
+# from the arguments before the tool method is called.
+OUTPUT_PROPERTIES = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Only return these fields of each result item (dotted paths reach into nested objects, e.g. ['subject', 'object', 'object_label']).",
+    },
+    "output_format": {
+        "type": "string",
+        "description": "JSON layout of the result: 'compact' (no whitespace, fewer tokens) or 'pretty'.",
+        "enum": ["compact", "pretty"],
+    },
 }
 
+_loaded_definitions: Dict[str, List[types.Tool]] = {}
+
+
+def module_tools(module_name: str) -> List[types.Tool]:
+    """
+    Returns the tool definitions of a tool module, with the output options
+    added to their schemas, without importing the module itself.
+    """
+    tools = _loaded_definitions.get(module_name)
+    if tools is None:
+        _, tools_attr, _ = TOOL_MODULES[module_name]
+        tools = getattr(importlib.import_module(f"{__name__}.definitions.{module_name}"), tools_attr)
+        for tool in tools:
+            tool.inputSchema.setdefault("properties", {}).update(OUTPUT_PROPERTIES)
+        _loaded_definitions[module_name] = tools
+    return tools
+
+
+def load_tool_module(module_name: str) -> ModuleType:
+    """Imports a tool module (the implementation of its tools)."""
+    module_tools(module_name)
+    return importlib.import_module(f"{__name__}.{module_name}")
+
+
+def module_api_class(module_name: str) -> type:
+    """Returns the API class implementing the tools of a tool module."""
+    class_name, _, _ = TOOL_MODULES[module_name]
+    return getattr(load_tool_module(module_name), class_name)
+
+
+def build_dispatch_table(
+    entity_api: Optional[Any] = None,
+    modules: Optional[Iterable[str]] = None,
+) -> Mapping[str, Callable[..., Awaitable[Any]]]:
+    """
+    Returns a read-only map from tool name to the bound coroutine method that
+    implements it, for the given tool modules (all of them by default). Each
+    API class is instantiated once, and every domain API shares the same
+    EntityApi. The server calls it for one module at a time, as modules are
+    loaded, and merges the results into its own dispatch dict.
+    """
+    entity_api = entity_api if entity_api is not None else module_api_class("entity")()
+    table = {}
+    for module_name in (TOOL_MODULES if modules is None else modules):
+        api_class = module_api_class(module_name)
+        if isinstance(entity_api, api_class):
+            instance = entity_api
+        elif "entity_api" in inspect.signature(api_class).parameters:
+            instance = api_class(entity_api=entity_api)
+        else:
+            instance = api_class()
+        for tool_name in TOOL_MODULES[module_name][2]:
+            table[tool_name] = getattr(instance, tool_name)
+    return MappingProxyType(table)
+
+
+def __getattr__(name: str) -> Any:
+    # Module-level attributes that need every (or one) tool module imported
+    if name == "ALL_TOOLS":
+        value = [tool for module_name in TOOL_MODULES for tool in module_tools(module_name)]
+    elif name == "API_CLASS_MAP":
+        value = {
+            tool_name: module_api_class(module_name)
+            for tool_name, module_name in TOOL_INDEX.items()
+        }
+    elif name in API_CLASS_MODULES:
+        return getattr(load_tool_module(API_CLASS_MODULES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "ALL_TOOLS",
     "API_CLASS_MAP",
+    "TOOL_INDEX",
+    "TOOL_MODULES",
+    "build_dispatch_table",
+    "load_tool_module",
+    "module_tools",
+    "module_api_class",
+    "OUTPUT_PROPERTIES",
     "EntityApi",
-    "DiseaseApi", 
+    "DiseaseApi",
     "GeneApi",
     "PhenotypeApi",
     "SimilarityApi",
@@ -54,4 +121,4 @@ __all__ = [
     "ChemicalApi",
     "VariantApi",
     "ProteinApi",
-]
\ No newline at end of file
+]
@@ -0,0 +1,5 @@
+"""
+Tool definitions (names, descriptions and input schemas), one module per tool
+module. They only depend on mcp.types, so the tools can be listed without
+importing their implementations.
+"""
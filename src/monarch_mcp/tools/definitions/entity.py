@@ -0,0 +1,94 @@
+# src/monarch_mcp/tools/definitions/entity.py
+import mcp.types as types
+
+ENTITY_TOOLS = [
+    types.Tool(
+        name="get_entity",
+        description="Get detailed information about any Monarch entity (disease, phenotype, gene, etc.) by its ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_id": {"type": "string", "description": "Entity ID (e.g., MONDO:0005015, HP:0001250, HGNC:1097)"}
+            },
+            "required": ["entity_id"]
+        }
+    ),
+    types.Tool(
+        name="get_entity_associations_by_category",
+        description="Retrieves a table of associations for a given entity, filtered by a single high-level category with optional ortholog traversal.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_id": {"type": "string", "description": "The ID of the entity, e.g., 'MONDO:0019391'"},
+                "category": {"type": "string", "description": "The category of association table to retrieve."},
+                "traverse_orthologs": {"type": "boolean", "description": "Whether to traverse orthologs for cross-species data.", "default": False},
+                "direct": {"type": "boolean", "description": "Whether to only return direct associations.", "default": False},
+                "limit": {"type": "number", "description": "Number of results per page (default: 20)", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination (default: 0)", "default": 0}
+            },
+            "required": ["entity_id", "category"]
+        }
+    ),
+    types.Tool(
+        name="get_associations",
+        description="Retrieves associations with powerful filtering, such as by subject, predicate, or object.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {"type": "array", "items": {"type": "string"}, "description": "A list of association categories to filter for."},
+                "subject": {"type": "array", "items": {"type": "string"}, "description": "A list of subject CURIEs to filter for."},
+                "predicate": {"type": "array", "items": {"type": "string"}, "description": "A list of predicate CURIEs to filter for."},
+                "object": {"type": "array", "items": {"type": "string"}, "description": "A list of object CURIEs to filter for."},
+                "entity": {"type": "array", "items": {"type": "string"}, "description": "A list of entity CURIEs to filter for, in any position."},
+                "direct": {"type": "boolean", "description": "Whether to only return direct associations.", "default": False},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0},
+                "fetch_all": {"type": "boolean", "description": "Fetch every page starting at offset and merge them into one result (limit is ignored).", "default": False},
+                "max_items": {"type": "number", "description": "Maximum number of associations to return when fetch_all is set (at most 10000).", "default": 1000},
+                "use_cursor": {"type": "boolean", "description": "Return the first page with a next_cursor; the following pages are prefetched on the server. Not available when the server runs several worker processes.", "default": False},
+                "cursor": {"type": "string", "description": "A next_cursor from a previous call; returns the following page of that query and ignores all other arguments."}
+            }
+        }
+    ),
+    types.Tool(
+        name="get_associations_advanced",
+        description="Advanced association query with detailed filtering by categories, namespaces, and taxons for subjects and objects.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {"type": "array", "items": {"type": "string"}, "description": "Association categories to filter for."},
+                "subject": {"type": "array", "items": {"type": "string"}, "description": "Subject CURIEs to filter for."},
+                "subject_category": {"type": "array", "items": {"type": "string"}, "description": "Subject categories (e.g., biolink:Gene)."},
+                "subject_namespace": {"type": "array", "items": {"type": "string"}, "description": "Subject namespaces (e.g., HGNC)."},
+                "subject_taxon": {"type": "array", "items": {"type": "string"}, "description": "Subject taxons (e.g., NCBITaxon:9606 for human)."},
+                "predicate": {"type": "array", "items": {"type": "string"}, "description": "Predicate CURIEs to filter for."},
+                "object": {"type": "array", "items": {"type": "string"}, "description": "Object CURIEs to filter for."},
+                "object_category": {"type": "array", "items": {"type": "string"}, "description": "Object categories."},
+                "object_namespace": {"type": "array", "items": {"type": "string"}, "description": "Object namespaces."},
+                "object_taxon": {"type": "array", "items": {"type": "string"}, "description": "Object taxons."},
+                "entity": {"type": "array", "items": {"type": "string"}, "description": "Entity CURIEs in any position."},
+                "direct": {"type": "boolean", "description": "Only return direct associations.", "default": False},
+                "facet_fields": {"type": "array", "items": {"type": "string"}, "description": "Fields to facet on."},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0},
+                "fetch_all": {"type": "boolean", "description": "Fetch every page starting at offset and merge them into one result (limit is ignored).", "default": False},
+                "max_items": {"type": "number", "description": "Maximum number of associations to return when fetch_all is set (at most 10000).", "default": 1000},
+                "use_cursor": {"type": "boolean", "description": "Return the first page with a next_cursor; the following pages are prefetched on the server. Not available when the server runs several worker processes.", "default": False},
+                "cursor": {"type": "string", "description": "A next_cursor from a previous call; returns the following page of that query and ignores all other arguments."}
+            }
+        }
+    ),
+    types.Tool(
+        name="get_entities_batch",
+        description="Get information for multiple entities at once in a single batch operation.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_ids": {"type": "array", "items": {"type": "string"}, "description": "List of entity IDs to retrieve"},
+                "max_concurrency": {"type": "number", "description": "Maximum number of entities fetched in parallel.", "default": 8},
+                "timeout": {"type": "number", "description": "Optional overall deadline in seconds; entities not fetched in time are returned with an error."}
+            },
+            "required": ["entity_ids"]
+        }
+    )
+]
@@ -0,0 +1,130 @@
+# src/monarch_mcp/tools/definitions/gene.py
+import mcp.types as types
+
+# Section of a gene dossier -> GeneApi method providing it
+DOSSIER_SECTIONS = {
+    "phenotypes": "get_gene_phenotype_associations",
+    "diseases": "get_gene_disease_associations",
+    "expression": "get_gene_expression_associations",
+    "interactions": "get_gene_interactions",
+    "orthologs": "get_gene_orthologs",
+    "pathways": "get_gene_pathways",
+    "causal_diseases": "get_diseases_by_gene",
+}
+
+GENE_TOOLS = [
+    types.Tool(
+        name="get_gene_phenotype_associations",
+        description="Get phenotypes associated with a gene across species.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097 for BRCA1)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    types.Tool(
+        name="get_gene_disease_associations",
+        description="Get diseases associated with a gene.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    types.Tool(
+        name="get_gene_expression_associations",
+        description="Get gene expression data across tissues and cell types.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    types.Tool(
+        name="get_gene_interactions",
+        description="Get gene-gene interactions for a specific gene.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    types.Tool(
+        name="get_gene_orthologs",
+        description="Get orthologous genes across different species.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    types.Tool(
+        name="get_gene_pathways",
+        description="Get biological pathways involving a specific gene.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    types.Tool(
+        name="get_diseases_by_gene",
+        description="Get diseases caused by or associated with a specific gene (reverse lookup).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    types.Tool(
+        name="get_gene_dossier",
+        description="Profile a gene in one call: phenotypes, diseases, expression, interactions, orthologs, pathways and causal diseases, queried in parallel. Failed sections are listed in 'errors'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
+                "sections": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(DOSSIER_SECTIONS)},
+                    "description": "Sections to include (default: all)."
+                },
+                "limit": {"type": "number", "description": "Number of associations per section.", "default": 10},
+                "section_limits": {
+                    "type": "object",
+                    "additionalProperties": {"type": "number"},
+                    "description": "Per-section overrides of limit, e.g. {\"phenotypes\": 50}."
+                },
+                "timeout": {"type": "number", "description": "Optional overall deadline in seconds; sections not fetched in time are reported as errors."}
+            },
+            "required": ["gene_id"]
+        }
+    )
+]
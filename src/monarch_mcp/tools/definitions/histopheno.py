@@ -0,0 +1,16 @@
+# src/monarch_mcp/tools/definitions/histopheno.py
+import mcp.types as types
+
+HISTOPHENO_TOOLS = [
+    types.Tool(
+        name="get_histopheno",
+        description="Retrieves histophenotype data showing phenotype frequency information for a disease.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "The disease entity ID (e.g., MONDO:0019391)."}
+            },
+            "required": ["id"]
+        }
+    )
+]
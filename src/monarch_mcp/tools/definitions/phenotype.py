@@ -0,0 +1,79 @@
+# src/monarch_mcp/tools/definitions/phenotype.py
+import mcp.types as types
+
+PHENOTYPE_TOOLS = [
+    types.Tool(
+        name="phenotype_profile_search",
+        description="Match a profile of phenotypes to find similar diseases or other entities using semantic similarity.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "phenotype_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of HPO phenotype IDs (e.g., ['HP:0001250', 'HP:0001251'])"
+                },
+                "search_group": {
+                    "type": "string",
+                    "description": "Group of entities to search within.",
+                    "default": "Human Diseases",
+                    "enum": ["Human Diseases", "Human Genes", "Mouse Genes", "Rat Genes", "Zebrafish Genes", "C. Elegans Genes"]
+                },
+                "limit": {"type": "number", "description": "Number of matches to return.", "default": 10}
+            },
+            "required": ["phenotype_ids"]
+        }
+    ),
+    types.Tool(
+        name="get_phenotype_gene_associations",
+        description="Get genes associated with a specific phenotype.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "phenotype_id": {"type": "string", "description": "Phenotype ID (e.g., HP:0001250 for seizure)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["phenotype_id"]
+        }
+    ),
+    types.Tool(
+        name="get_phenotype_disease_associations",
+        description="Get diseases associated with a specific phenotype.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "phenotype_id": {"type": "string", "description": "Phenotype ID (e.g., HP:0001250)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["phenotype_id"]
+        }
+    ),
+    types.Tool(
+        name="get_diseases_with_phenotype",
+        description="Get diseases that have a specific phenotype (reverse lookup).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "phenotype_id": {"type": "string", "description": "Phenotype ID (e.g., HP:0001250)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["phenotype_id"]
+        }
+    ),
+    types.Tool(
+        name="get_genes_with_phenotype",
+        description="Get genes that cause a specific phenotype (reverse lookup).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "phenotype_id": {"type": "string", "description": "Phenotype ID (e.g., HP:0001250)"},
+                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
+                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+            },
+            "required": ["phenotype_id"]
+        }
+    )
+]
@@ -1,12 +1,55 @@
-from typing import Any, Dict, List, Optional
-import mcp.types as types
-from ..client import MonarchClient
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple, TypeVar
+from ..client import BULK, MonarchClient, priority
+from ..cursors import CURSORS_DISABLED, CursorError, CursorStore
+from .definitions.entity import ENTITY_TOOLS
+
+# The Monarch API rejects page sizes above this.
+MAX_PAGE_SIZE = 500
+# Hard upper bound on the number of associations a fetch_all query collects.
+MAX_FETCH_ALL_ITEMS = 10000
+
+K = TypeVar("K")
+
+async def wait_for_all(
+    tasks: Dict[K, "asyncio.Future[Any]"], timeout: Optional[float] = None
+) -> Tuple[Dict[K, Any], Dict[K, str]]:
+    """
+    Wait for tasks started by a fan-out tool, for at most timeout seconds.
+
+    Tasks still running when the timeout expires are cancelled and awaited.
+    Returns the results of the tasks that finished, and an error message for
+    each task that failed or timed out, both keyed like tasks.
+    """
+    try:
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=timeout)
+    finally:
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results: Dict[K, Any] = {}
+    errors: Dict[K, str] = {}
+    for key, task in tasks.items():
+        if task.cancelled():
+            errors[key] = f"Timed out after {timeout} seconds"
+        elif task.exception() is not None:
+            errors[key] = f"{type(task.exception()).__name__}: {task.exception()}"
+        else:
+            results[key] = task.result()
+    return results, errors
 
 class EntityApi:
     """
     Core tool for retrieving entities and their associations from the Monarch API.
     """
 
+    def __init__(self, cursors: Optional[CursorStore] = None):
+        # None when cursors are disabled (several worker processes)
+        self.cursors = cursors if cursors is not None else CursorStore.from_env()
+
     async def get_entity(self, client: MonarchClient, entity_id: str) -> Dict[str, Any]:
         """
         Retrieves the entity with the specified ID.
@@ -57,10 +100,22 @@ class EntityApi:
         compact: bool = False,
         limit: int = 20,
         offset: int = 0,
+        fetch_all: bool = False,
+        max_items: int = 1000,
+        max_concurrency: int = 4,
+        use_cursor: bool = False,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Retrieves associations using the generic /association endpoint.
+
+        With fetch_all, every page from offset onwards is fetched (up to max_items)
+        and merged into a single result. With use_cursor, the page is returned with
+        a next_cursor; passing it back as cursor returns the following page, which
+        is prefetched in the background (all other arguments are then ignored).
         """
+        if cursor is not None:
+            return await self._cursor_store().next_page(cursor)
         params = {
             "category": category,
             "subject": subject,
@@ -73,6 +128,10 @@ class EntityApi:
             "offset": offset,
         }
         params = {k: v for k, v in params.items() if v is not None}
+        if fetch_all:
+            return await self._fetch_all_pages(client, "association", params, max_items, max_concurrency)
+        if use_cursor:
+            return await self._open_cursor(client, "association", params)
         return await client.get("association", params=params)
 
     async def get_associations_advanced(
@@ -96,10 +155,22 @@ class EntityApi:
         filter_queries: Optional[List[str]] = None,
         limit: int = 20,
         offset: int = 0,
+        fetch_all: bool = False,
+        max_items: int = 1000,
+        max_concurrency: int = 4,
+        use_cursor: bool = False,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Advanced association query with all available filters.
+
+        With fetch_all, every page from offset onwards is fetched (up to max_items)
+        and merged into a single result. With use_cursor, the page is returned with
+        a next_cursor; passing it back as cursor returns the following page, which
+        is prefetched in the background (all other arguments are then ignored).
         """
+        if cursor is not None:
+            return await self._cursor_store().next_page(cursor)
         params = {
             "category": category,
             "subject": subject,
@@ -121,103 +192,194 @@ class EntityApi:
             "offset": offset,
         }
         params = {k: v for k, v in params.items() if v is not None}
+        if fetch_all:
+            return await self._fetch_all_pages(client, "association", params, max_items, max_concurrency)
+        if use_cursor:
+            return await self._open_cursor(client, "association", params)
         return await client.get("association", params=params)
 
+    async def iter_associations(
+        self,
+        client: MonarchClient,
+        category: Optional[List[str]] = None,
+        subject: Optional[List[str]] = None,
+        subject_category: Optional[List[str]] = None,
+        subject_namespace: Optional[List[str]] = None,
+        subject_taxon: Optional[List[str]] = None,
+        predicate: Optional[List[str]] = None,
+        object: Optional[List[str]] = None,
+        object_category: Optional[List[str]] = None,
+        object_namespace: Optional[List[str]] = None,
+        object_taxon: Optional[List[str]] = None,
+        entity: Optional[List[str]] = None,
+        direct: bool = False,
+        compact: bool = False,
+        filter_queries: Optional[List[str]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        offset: int = 0,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields associations matching the same filters as get_associations_advanced,
+        one at a time.
+
+        The next page is requested while the current one is being consumed, so at
+        most two pages are held in memory regardless of the size of the result set.
+        """
+        params = {
+            "category": category,
+            "subject": subject,
+            "subject_category": subject_category,
+            "subject_namespace": subject_namespace,
+            "subject_taxon": subject_taxon,
+            "predicate": predicate,
+            "object": object,
+            "object_category": object_category,
+            "object_namespace": object_namespace,
+            "object_taxon": object_taxon,
+            "entity": entity,
+            "direct": direct,
+            "compact": compact,
+            "filter_queries": filter_queries,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+
+        def fetch_page(page_offset: int) -> asyncio.Future:
+            # Prefetches run at bulk priority so they never delay interactive requests
+            with priority(BULK):
+                return asyncio.ensure_future(
+                    client.get("association", params={**params, "limit": page_size, "offset": page_offset})
+                )
+
+        page_offset = offset
+        remaining = max_items
+        next_page: Optional[asyncio.Future] = fetch_page(page_offset)
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                items = page.get("items", [])
+                page_offset += page_size
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                if items and page_offset < page.get("total", 0) and remaining != 0:
+                    next_page = fetch_page(page_offset)
+                for item in items:
+                    yield item
+                del page, items
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _open_cursor(self, client: MonarchClient, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the first page of a paginated endpoint with a cursor for the following pages."""
+        page_size = max(1, min(int(params.get("limit", 20)), MAX_PAGE_SIZE))
+
+        def fetch_page(page_offset: int) -> Awaitable[Dict[str, Any]]:
+            return client.get(endpoint, params={**params, "limit": page_size, "offset": page_offset})
+
+        return await self._cursor_store().open(fetch_page, int(params.get("offset", 0)), page_size)
+
+    def _cursor_store(self) -> CursorStore:
+        if self.cursors is None:
+            raise CursorError(CURSORS_DISABLED)
+        return self.cursors
+
+    async def _fetch_all_pages(
+        self,
+        client: MonarchClient,
+        endpoint: str,
+        params: Dict[str, Any],
+        max_items: int,
+        max_concurrency: int,
+    ) -> Dict[str, Any]:
+        """
+        Fetches all pages of a paginated endpoint and merges their items in order.
+
+        The first page reports the total; the remaining pages are then fetched
+        concurrently, at most max_concurrency at a time. The number of items is
+        capped at max_items (and never exceeds MAX_FETCH_ALL_ITEMS). All pages
+        are requested at bulk priority.
+        """
+        with priority(BULK):
+            return await self._fetch_pages(client, endpoint, params, max_items, max_concurrency)
+
+    async def _fetch_pages(
+        self,
+        client: MonarchClient,
+        endpoint: str,
+        params: Dict[str, Any],
+        max_items: int,
+        max_concurrency: int,
+    ) -> Dict[str, Any]:
+        max_items = max(1, min(int(max_items), MAX_FETCH_ALL_ITEMS))
+        start = int(params.get("offset", 0))
+        page_size = min(max_items, MAX_PAGE_SIZE)
+
+        first_page = await client.get(endpoint, params={**params, "limit": page_size, "offset": start})
+        available = max(0, int(first_page.get("total", 0)) - start)
+        wanted = min(available, max_items)
+
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+        async def fetch_page(page_offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await client.get(endpoint, params={**params, "limit": page_size, "offset": page_offset})
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(fetch_page(page_offset))
+                    for page_offset in range(start + page_size, start + wanted, page_size)
+                ]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+
+        items = list(first_page.get("items", []))
+        for task in tasks:
+            items.extend(task.result().get("items", []))
+        items = items[:wanted]
+        return {
+            **first_page,
+            "limit": len(items),
+            "offset": start,
+            "items": items,
+            "truncated": available > len(items),
+        }
+
     async def get_entities_batch(
         self,
         client: MonarchClient,
-        entity_ids: List[str]
+        entity_ids: List[str],
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get information for multiple entities at once.
+
+        Entities are fetched concurrently at bulk priority, at most
+        max_concurrency at a time, and repeated IDs are only fetched once.
+        Results keep the order of entity_ids.
+        Lookups that fail, or are still running when the optional overall timeout
+        (in seconds) expires, are returned as {"id": ..., "error": ...}.
         """
-        results = []
-        for entity_id in entity_ids:
-            try:
-                result = await client.get(f"entity/{entity_id}")
-                results.append(result)
-            except Exception as e:
-                results.append({"id": entity_id, "error": str(e)})
-        return results
-
-ENTITY_TOOLS = [
-    types.Tool(
-        name="get_entity",
-        description="Get detailed information about any Monarch entity (disease, phenotype, gene, etc.) by its ID.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "entity_id": {"type": "string", "description": "Entity ID (e.g., MONDO:0005015, HP:0001250, HGNC:1097)"}
-            },
-            "required": ["entity_id"]
-        }
-    ),
-    types.Tool(
-        name="get_entity_associations_by_category",
-        description="Retrieves a table of associations for a given entity, filtered by a single high-level category with optional ortholog traversal.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "entity_id": {"type": "string", "description": "The ID of the entity, e.g., 'MONDO:0019391'"},
-                "category": {"type": "string", "description": "The category of association table to retrieve."},
-                "traverse_orthologs": {"type": "boolean", "description": "Whether to traverse orthologs for cross-species data.", "default": False},
-                "direct": {"type": "boolean", "description": "Whether to only return direct associations.", "default": False},
-                "limit": {"type": "number", "description": "Number of results per page (default: 20)", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination (default: 0)", "default": 0}
-            },
-            "required": ["entity_id", "category"]
-        }
-    ),
-    types.Tool(
-        name="get_associations",
-        description="Retrieves associations with powerful filtering, such as by subject, predicate, or object.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "category": {"type": "array", "items": {"type": "string"}, "description": "A list of association categories to filter for."},
-                "subject": {"type": "array", "items": {"type": "string"}, "description": "A list of subject CURIEs to filter for."},
-                "predicate": {"type": "array", "items": {"type": "string"}, "description": "A list of predicate CURIEs to filter for."},
-                "object": {"type": "array", "items": {"type": "string"}, "description": "A list of object CURIEs to filter for."},
-                "entity": {"type": "array", "items": {"type": "string"}, "description": "A list of entity CURIEs to filter for, in any position."},
-                "direct": {"type": "boolean", "description": "Whether to only return direct associations.", "default": False},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            }
-        }
-    ),
-    types.Tool(
-        name="get_associations_advanced",
-        description="Advanced association query with detailed filtering by categories, namespaces, and taxons for subjects and objects.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "category": {"type": "array", "items": {"type": "string"}, "description": "Association categories to filter for."},
-                "subject": {"type": "array", "items": {"type": "string"}, "description": "Subject CURIEs to filter for."},
-                "subject_category": {"type": "array", "items": {"type": "string"}, "description": "Subject categories (e.g., biolink:Gene)."},
-                "subject_namespace": {"type": "array", "items": {"type": "string"}, "description": "Subject namespaces (e.g., HGNC)."},
-                "subject_taxon": {"type": "array", "items": {"type": "string"}, "description": "Subject taxons (e.g., NCBITaxon:9606 for human)."},
-                "predicate": {"type": "array", "items": {"type": "string"}, "description": "Predicate CURIEs to filter for."},
-                "object": {"type": "array", "items": {"type": "string"}, "description": "Object CURIEs to filter for."},
-                "object_category": {"type": "array", "items": {"type": "string"}, "description": "Object categories."},
-                "object_namespace": {"type": "array", "items": {"type": "string"}, "description": "Object namespaces."},
-                "object_taxon": {"type": "array", "items": {"type": "string"}, "description": "Object taxons."},
-                "entity": {"type": "array", "items": {"type": "string"}, "description": "Entity CURIEs in any position."},
-                "direct": {"type": "boolean", "description": "Only return direct associations.", "default": False},
-                "facet_fields": {"type": "array", "items": {"type": "string"}, "description": "Fields to facet on."},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+        async def fetch(entity_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await client.get(f"entity/{entity_id}")
+                except Exception as e:
+                    return {"id": entity_id, "error": str(e)}
+
+        with priority(BULK):
+            tasks = {
+                entity_id: asyncio.ensure_future(fetch(entity_id))
+                for entity_id in dict.fromkeys(entity_ids)
             }
-        }
-    ),
-    types.Tool(
-        name="get_entities_batch",
-        description="Get information for multiple entities at once in a single batch operation.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "entity_ids": {"type": "array", "items": {"type": "string"}, "description": "List of entity IDs to retrieve"}
-            },
-            "required": ["entity_ids"]
-        }
-    )
-]
\ No newline at end of file
+        results, errors = await wait_for_all(tasks, timeout)
+        for entity_id, error in errors.items():
+            results[entity_id] = {"id": entity_id, "error": error}
+        return [results[entity_id] for entity_id in entity_ids]
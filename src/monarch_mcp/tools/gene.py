@@ -1,14 +1,15 @@
+import asyncio
 from typing import Any, Dict, List, Optional
-import mcp.types as types
 from ..client import MonarchClient
-from .entity import EntityApi
+from .entity import EntityApi, wait_for_all
+from .definitions.gene import DOSSIER_SECTIONS, GENE_TOOLS
 
 class GeneApi:
     """
     Gene-specific queries for Monarch, refactored to use the core associations API.
     """
-    def __init__(self):
-        self.entity_api = EntityApi()
+    def __init__(self, entity_api: Optional[EntityApi] = None):
+        self.entity_api = entity_api if entity_api is not None else EntityApi()
 
     async def get_gene_phenotype_associations(
         self,
@@ -124,96 +125,35 @@ class GeneApi:
             offset=offset
         )
 
-GENE_TOOLS = [
-    types.Tool(
-        name="get_gene_phenotype_associations",
-        description="Get phenotypes associated with a gene across species.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097 for BRCA1)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
-        }
-    ),
-    types.Tool(
-        name="get_gene_disease_associations",
-        description="Get diseases associated with a gene.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
-        }
-    ),
-    types.Tool(
-        name="get_gene_expression_associations",
-        description="Get gene expression data across tissues and cell types.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
-        }
-    ),
-    types.Tool(
-        name="get_gene_interactions",
-        description="Get gene-gene interactions for a specific gene.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
-        }
-    ),
-    types.Tool(
-        name="get_gene_orthologs",
-        description="Get orthologous genes across different species.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
-        }
-    ),
-    types.Tool(
-        name="get_gene_pathways",
-        description="Get biological pathways involving a specific gene.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
-        }
-    ),
-    types.Tool(
-        name="get_diseases_by_gene",
-        description="Get diseases caused by or associated with a specific gene (reverse lookup).",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
+    async def get_gene_dossier(
+        self,
+        client: MonarchClient,
+        gene_id: str,
+        sections: Optional[List[str]] = None,
+        limit: int = 10,
+        section_limits: Optional[Dict[str, int]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Profile of a gene built from all gene queries in one call.
+
+        The sections (all of DOSSIER_SECTIONS by default) are queried
+        concurrently, each returning up to its entry in section_limits or limit
+        associations. Sections that fail, or are still running when the
+        optional overall timeout (in seconds) expires, are reported in "errors"
+        while the other sections are still returned.
+        """
+        sections = list(dict.fromkeys(sections or DOSSIER_SECTIONS))
+        section_limits = section_limits or {}
+        unknown = [name for name in [*sections, *section_limits] if name not in DOSSIER_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown dossier sections: {', '.join(unknown)}; choose from {', '.join(DOSSIER_SECTIONS)}")
+
+        tasks = {
+            name: asyncio.ensure_future(
+                getattr(self, DOSSIER_SECTIONS[name])(client, gene_id, limit=int(section_limits.get(name, limit)))
+            )
+            for name in sections
         }
-    )
-]
\ No newline at end of file
+        results, errors = await wait_for_all(tasks, timeout)
+        return {"gene_id": gene_id, "sections": results, "errors": errors, "complete": not errors}
@@ -1,6 +1,6 @@
 from typing import Any, Dict
-import mcp.types as types
 from ..client import MonarchClient
+from .definitions.histopheno import HISTOPHENO_TOOLS
 
 class HistoPhenoApi:
     """
@@ -12,17 +12,3 @@ class HistoPhenoApi:
         Retrieves histopheno data for a given entity ID.
         """
         return await client.get(f"histopheno/{id}")
-
-HISTOPHENO_TOOLS = [
-    types.Tool(
-        name="get_histopheno",
-        description="Retrieves histophenotype data showing phenotype frequency information for a disease.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "id": {"type": "string", "description": "The disease entity ID (e.g., MONDO:0019391)."}
-            },
-            "required": ["id"]
-        }
-    )
-]
\ No newline at end of file
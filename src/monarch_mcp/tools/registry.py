@@ -0,0 +1,95 @@
+# src/monarch_mcp/tools/registry.py
+"""
+Static index of the tool modules and the tools they define.
+
+The server uses it to resolve a tool name to its module without importing
+any tool module, so a module is only loaded when one of its tools is called
+(listing tools only loads tools.definitions). Keep it in sync with the
+*_TOOLS lists of the definitions; the test suite checks that they match.
+"""
+from typing import Dict, Tuple
+
+# Tool module -> (API class, tool list attribute, tool names), in listing order
+TOOL_MODULES: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "entity": ("EntityApi", "ENTITY_TOOLS", (
+        "get_entity",
+        "get_entity_associations_by_category",
+        "get_associations",
+        "get_associations_advanced",
+        "get_entities_batch",
+    )),
+    "disease": ("DiseaseApi", "DISEASE_TOOLS", (
+        "get_disease_phenotype_associations",
+        "get_disease_gene_associations",
+        "get_disease_treatments",
+        "get_disease_variants",
+        "get_disease_inheritance",
+    )),
+    "gene": ("GeneApi", "GENE_TOOLS", (
+        "get_gene_phenotype_associations",
+        "get_gene_disease_associations",
+        "get_gene_expression_associations",
+        "get_gene_interactions",
+        "get_gene_orthologs",
+        "get_gene_pathways",
+        "get_diseases_by_gene",
+        "get_gene_dossier",
+    )),
+    "phenotype": ("PhenotypeApi", "PHENOTYPE_TOOLS", (
+        "phenotype_profile_search",
+        "get_phenotype_gene_associations",
+        "get_phenotype_disease_associations",
+        "get_diseases_with_phenotype",
+        "get_genes_with_phenotype",
+    )),
+    "similarity": ("SimilarityApi", "SIMILARITY_TOOLS", (
+        "compare_termsets",
+        "find_similar_terms",
+    )),
+    "search": ("SearchApi", "SEARCH_TOOLS", (
+        "search",
+        "autocomplete",
+        "semsim_autocomplete",
+    )),
+    "histopheno": ("HistoPhenoApi", "HISTOPHENO_TOOLS", (
+        "get_histopheno",
+    )),
+    "mapping": ("MappingApi", "MAPPING_TOOLS", (
+        "get_mappings",
+    )),
+    "chemical": ("ChemicalApi", "CHEMICAL_TOOLS", (
+        "get_chemical_info",
+        "get_chemical_disease_associations",
+        "get_chemical_pathway_associations",
+        "get_diseases_treated_by_chemical",
+        "get_chemicals_for_disease",
+    )),
+    "variant": ("VariantApi", "VARIANT_TOOLS", (
+        "get_variant_info",
+        "get_variant_gene_associations",
+        "get_variant_disease_associations",
+        "get_variant_phenotype_associations",
+        "get_gene_variants",
+        "get_variants_by_disease",
+    )),
+    "protein": ("ProteinApi", "PROTEIN_TOOLS", (
+        "get_protein_info",
+        "get_protein_interactions",
+        "get_protein_functions",
+        "get_protein_processes",
+        "get_protein_locations",
+        "get_proteins_by_function",
+    )),
+}
+
+# Tool name -> module that defines it
+TOOL_INDEX: Dict[str, str] = {
+    tool_name: module_name
+    for module_name, (_, _, tool_names) in TOOL_MODULES.items()
+    for tool_name in tool_names
+}
+
+# API class name -> module that defines it
+API_CLASS_MODULES: Dict[str, str] = {
+    class_name: module_name for module_name, (class_name, _, _) in TOOL_MODULES.items()
+}
@@ -1,11 +1,11 @@
 from typing import Any, Dict, List, Optional
-import mcp.types as types
 from ..client import MonarchClient
 from .entity import EntityApi
+from .definitions.variant import VARIANT_TOOLS
 
 class VariantApi:
-    def __init__(self):
-        self.entity_api = EntityApi()
+    def __init__(self, entity_api: Optional[EntityApi] = None):
+        self.entity_api = entity_api if entity_api is not None else EntityApi()
 
     async def get_variant_info(self, client: MonarchClient, variant_id: str) -> Dict[str, Any]:
         return await self.entity_api.get_entity(client, variant_id)
@@ -84,82 +84,3 @@ class VariantApi:
             limit=limit,
             offset=offset
         )
-
-VARIANT_TOOLS = [
-    types.Tool(
-        name="get_variant_info",
-        description="Get detailed information about a genetic variant.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "variant_id": {"type": "string", "description": "Variant ID (e.g., ClinVar:12345)"}
-            },
-            "required": ["variant_id"]
-        }
-    ),
-    types.Tool(
-        name="get_variant_gene_associations",
-        description="Get genes associated with a genetic variant.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "variant_id": {"type": "string", "description": "Variant ID (e.g., ClinVar:12345)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["variant_id"]
-        }
-    ),
-    types.Tool(
-        name="get_variant_disease_associations",
-        description="Get diseases associated with a genetic variant.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "variant_id": {"type": "string", "description": "Variant ID (e.g., ClinVar:12345)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["variant_id"]
-        }
-    ),
-    types.Tool(
-        name="get_variant_phenotype_associations",
-        description="Get phenotypes associated with a genetic variant.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "variant_id": {"type": "string", "description": "Variant ID (e.g., ClinVar:12345)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["variant_id"]
-        }
-    ),
-    types.Tool(
-        name="get_gene_variants",
-        description="Get genetic variants associated with a specific gene.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "gene_id": {"type": "string", "description": "Gene ID (e.g., HGNC:1097)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["gene_id"]
-        }
-    ),
-    types.Tool(
-        name="get_variants_by_disease",
-        description="Get genetic variants associated with a specific disease.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "disease_id": {"type": "string", "description": "Disease ID (e.g., MONDO:0005015)"},
-                "limit": {"type": "number", "description": "Number of results per page.", "default": 20},
-                "offset": {"type": "number", "description": "Offset for pagination.", "default": 0}
-            },
-            "required": ["disease_id"]
-        }
-    )
-]
\ No newline at end of file
@@ -0,0 +1,151 @@
+# src/monarch_mcp/tracing.py
+"""
+Lightweight tracing of tool calls and the upstream requests they make.
+
+Each tool call is a root span; every MonarchClient request made during it
+(including from spawned tasks) is a child span, and every HTTP attempt a
+child of its request. Finished spans are handed to the configured exporter.
+Tracing is off unless an exporter is set, either with set_exporter() or by
+pointing MONARCH_TRACE_FILE at a JSON-lines file; while it is off span()
+returns a shared no-op context manager.
+"""
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Protocol
+
+from . import codec
+
+
+class Span:
+    """A timed operation with attributes, linked to its parent by IDs."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start_time", "duration", "attributes", "error", "_started")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.name = name
+        self.start_time = time.time()
+        self.duration: Optional[float] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration_ms": None if self.duration is None else self.duration * 1000,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class Exporter(Protocol):
+    """Receives every finished span."""
+
+    def export(self, span: Span) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonLinesExporter:
+    """Appends finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = codec.dumps(span.to_dict()) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class InMemoryExporter:
+    """Keeps finished spans in a list, e.g. for tests."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("monarch_span", default=None)
+_exporter: Optional[Exporter] = None
+_NOOP = contextlib.nullcontext()
+
+
+class _SpanContext:
+    __slots__ = ("span", "_token")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.span = Span(name, _current_span.get(), attributes)
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        span = self.span
+        span.duration = time.perf_counter() - span._started
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        _current_span.reset(self._token)
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(span)
+
+
+def span(name: str, **attributes: Any):
+    """
+    Returns a context manager that records a span, a child of the current one,
+    and yields it (or yields None while tracing is disabled).
+    """
+    if _exporter is None:
+        return _NOOP
+    return _SpanContext(name, attributes)
+
+
+def current_span() -> Optional[Span]:
+    """Returns the innermost open span of the current context, if any."""
+    return _current_span.get()
+
+
+def set_exporter(exporter: Optional[Exporter]) -> None:
+    """Enables tracing with the given exporter, or disables it with None."""
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.close()
+
+
+def enabled() -> bool:
+    return _exporter is not None
+
+
+def configure_from_env() -> None:
+    """Exports spans to the JSON-lines file MONARCH_TRACE_FILE, when it is set."""
+    path = os.getenv("MONARCH_TRACE_FILE")
+    if path:
+        set_exporter(JsonLinesExporter(path))
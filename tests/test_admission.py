@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from monarch_mcp.admission import AdmissionController, CallLimit, OverloadedError, parse_limits
+from monarch_mcp.metrics import Metrics
+
+@pytest.mark.asyncio
+async def test_call_limit_queues_in_order_and_rejects_when_full():
+    """Test that calls beyond the limit queue FIFO and overflow is rejected immediately."""
+    limit = CallLimit("server", max_inflight=1, max_queued=2)
+    await limit.acquire()
+    order = []
+
+    async def queued(i):
+        await limit.acquire()
+        order.append(i)
+        limit.release()
+
+    waiters = [asyncio.create_task(queued(i)) for i in range(2)]
+    await asyncio.sleep(0)
+    assert limit.queued == 2
+    with pytest.raises(OverloadedError):
+        await limit.acquire()
+
+    await asyncio.sleep(0.01)
+    limit.release()
+    await asyncio.gather(*waiters)
+
+    assert order == [0, 1]
+    stats = limit.stats()
+    assert stats["inflight"] == 0
+    assert stats["admitted"] == 3
+    assert stats["rejected"] == 1
+    assert stats["max_queue_seconds"] >= 0.01
+    assert stats["mean_queue_seconds"] > 0
+
+@pytest.mark.asyncio
+async def test_call_limit_rejects_after_queue_timeout_and_survives_cancellation():
+    """Test that queued calls give up after the timeout and cancelled waiters leave the queue."""
+    limit = CallLimit("server", max_inflight=1, max_queued=4)
+    await limit.acquire()
+    with pytest.raises(OverloadedError, match="Timed out"):
+        await limit.acquire(timeout=0.01)
+
+    waiter = asyncio.create_task(limit.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limit.queued == 0
+    limit.release()
+    assert limit.inflight == 0
+    assert limit.stats()["rejected"] == 1
+
+@pytest.mark.asyncio
+async def test_tool_class_limits_apply_before_the_server_limit():
+    """Test that a saturated tool class does not use up server-wide slots."""
+    admission = AdmissionController(max_inflight=2, max_queued=0, class_limits={"similarity": 1})
+    release = asyncio.Event()
+
+    async def call(tool_class):
+        async with admission.admit(tool_class):
+            await release.wait()
+
+    semsim = asyncio.create_task(call("similarity"))
+    await asyncio.sleep(0)
+    with pytest.raises(OverloadedError, match="similarity"):
+        await call("similarity")
+    entity = asyncio.create_task(call("entity"))
+    await asyncio.sleep(0)
+    assert admission.stats()["inflight"] == 2
+    with pytest.raises(OverloadedError, match="server"):
+        await call("entity")
+
+    release.set()
+    await asyncio.gather(semsim, entity)
+    stats = admission.stats()
+    assert stats["inflight"] == 0
+    assert stats["classes"]["similarity"]["rejected"] == 1
+    assert stats["rejected"] == 1
+
+@pytest.mark.asyncio
+async def test_admission_records_queue_wait_rejections_and_inflight():
+    """Test that admission control reports its queue, rejections and calls in flight per tool class."""
+    admission = AdmissionController(max_inflight=1, max_queued=1)
+    metrics = Metrics()
+    release = asyncio.Event()
+    inflight = []
+
+    async def call(tool_class):
+        async with admission.admit(tool_class, metrics):
+            inflight.append(metrics.counter("tool_calls_inflight", tool_class))
+            await release.wait()
+
+    first = asyncio.create_task(call("entity"))
+    queued = asyncio.create_task(call("similarity"))
+    await asyncio.sleep(0.01)
+    with pytest.raises(OverloadedError):
+        await call("similarity")
+    release.set()
+    await asyncio.gather(first, queued)
+
+    assert inflight == [1, 1]
+    assert metrics.counter("tool_calls_inflight", "entity") == 0
+    assert metrics.counter("tool_calls_rejected_total", "similarity") == 1
+    assert metrics.histogram("tool_queue_wait_seconds", "similarity").sum >= 0.01
+    snapshot = metrics.snapshot()["tool_classes"]
+    assert snapshot["similarity"]["rejected"] == 1
+    assert snapshot["entity"]["admitted"] == 1
+    assert 'monarch_tool_calls_inflight{tool_class="entity"} 0' in metrics.render_prometheus()
+
+def test_admission_from_env():
+    """Test that admission control is configured from the environment and can be disabled."""
+    assert parse_limits("similarity=4, entity=32") == {"similarity": 4, "entity": 32}
+    with patch.dict("os.environ", {
+        "MONARCH_MAX_CONCURRENT_CALLS": "16",
+        "MONARCH_MAX_QUEUED_CALLS": "8",
+        "MONARCH_TOOL_CLASS_LIMITS": "similarity=2",
+    }):
+        admission = AdmissionController.from_env()
+    assert admission.total.max_inflight == 16
+    assert admission.total.max_queued == 8
+    assert admission.classes["similarity"].max_inflight == 2
+    with patch.dict("os.environ", {"MONARCH_MAX_CONCURRENT_CALLS": "0"}):
+        assert AdmissionController.from_env() is None
@@ -0,0 +1,171 @@
+import time
+import httpx
+import pytest
+from unittest.mock import patch
+from monarch_mcp.cache import DiskCache, ResponseCache, make_cache_key
+from monarch_mcp.client import MonarchClient
+
+def test_cache_key_ignores_param_order():
+    """Test that the cache key is canonical with respect to param order."""
+    key_a = make_cache_key("association", {"subject": ["HGNC:1097"], "limit": 20})
+    key_b = make_cache_key("association", {"limit": 20, "subject": ["HGNC:1097"]})
+    assert key_a == key_b
+    assert key_a != make_cache_key("association", {"limit": 10, "subject": ["HGNC:1097"]})
+
+def test_cache_hit_and_miss_counters():
+    """Test that lookups update the hit/miss counters."""
+    cache = ResponseCache()
+    assert cache.get("entity/HP:0001250?{}") is None
+    cache.set("entity/HP:0001250?{}", {"id": "HP:0001250"}, size=10, ttl=60)
+    assert cache.get("entity/HP:0001250?{}") == {"id": "HP:0001250"}
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+def test_cache_lru_eviction_by_entries_and_bytes():
+    """Test that least recently used entries are evicted when bounds are exceeded."""
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.set("a", 1, size=10, ttl=60)
+    cache.set("b", 2, size=10, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, size=10, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, size=95, ttl=60)
+    assert len(cache) == 1
+    assert cache.current_bytes == 95
+    assert cache.evictions == 3
+
+def test_cache_expiry_uses_endpoint_ttl():
+    """Test that entries expire according to the TTL of their endpoint."""
+    cache = ResponseCache(ttls={"search": 5})
+    assert cache.ttl_for("search") == 5
+    assert cache.ttl_for("entity/HGNC:1097") == 3600
+    with patch("monarch_mcp.cache.time.monotonic", return_value=100.0):
+        cache.set("k", "v", size=1, ttl=cache.ttl_for("search"))
+    with patch("monarch_mcp.cache.time.monotonic", return_value=106.0):
+        assert cache.get("k") is None
+    assert len(cache) == 0
+
+@pytest.mark.asyncio
+async def test_client_serves_repeated_get_from_cache():
+    """Test that MonarchClient only hits the network once for a repeated query."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json={"id": "MONDO:0005015"})
+
+    client = MonarchClient(
+        base_url="https://api.example.org/v3/api/",
+        cache=ResponseCache(),
+        transport=httpx.MockTransport(handler),
+    )
+    first = await client.get("entity/MONDO:0005015", params={"a": 1, "b": 2})
+    second = await client.get("entity/MONDO:0005015", params={"b": 2, "a": 1})
+    await client.close()
+
+    assert first == second == {"id": "MONDO:0005015"}
+    assert len(calls) == 1
+    assert client.cache.stats()["hits"] == 1
+
+def test_disk_cache_roundtrip_and_expiry(tmp_path):
+    """Test that the disk cache stores compressed bodies and honours TTLs."""
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    cache.set("entity/HGNC:1097?{}", b'{"id": "HGNC:1097"}', ttl=60)
+    assert cache.get("entity/HGNC:1097?{}") == {"id": "HGNC:1097"}
+    with patch("monarch_mcp.cache.time.time", return_value=time.time() + 120):
+        assert cache.get("entity/HGNC:1097?{}") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """Test that the disk cache evicts old rows once the size cap is exceeded."""
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), max_bytes=25)
+    cache.set("a", b'{"v": "aaaaaaaa"}', ttl=60)
+    cache.set("b", b'{"v": "bbbbbbbb"}', ttl=60)
+    assert cache.get("a") is None
+    assert cache.get("b") == {"v": "bbbbbbbb"}
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+def test_disk_cache_keeps_a_running_total(tmp_path):
+    """Test that the total size follows replaced, expired and cleared rows without summing the table."""
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path)
+    cache.set("a", b"[1, 2, 3]", ttl=60)
+    cache.set("a", b"[1]", ttl=60)
+    cache.set("b", b'{"v": 1}', ttl=1)
+    assert cache.stats()["bytes"] == 3 + 8
+    with patch("monarch_mcp.cache.time.time", return_value=time.time() + 10):
+        cache.set("c", b"[]", ttl=60)
+    assert (cache.stats()["entries"], cache.stats()["bytes"]) == (2, 3 + 2)
+    # A file written before the total was kept is counted when it is opened
+    cache._conn.execute("DROP TABLE total_size")
+    cache.close()
+    cache = DiskCache(path)
+    assert cache.stats()["bytes"] == 3 + 2
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+    cache.close()
+
+def test_disk_cache_is_shared_between_instances(tmp_path):
+    """Test that a second connection (e.g. another process) sees existing rows."""
+    path = str(tmp_path / "cache.sqlite")
+    writer = DiskCache(path)
+    reader = DiskCache(path)
+    writer.set("k", b"[1, 2, 3]", ttl=60)
+    assert reader.get("k") == [1, 2, 3]
+    (mode,) = reader._conn.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+    writer.close()
+    reader.close()
+
+@pytest.mark.asyncio
+async def test_client_warms_from_disk_cache(tmp_path):
+    """Test that a fresh client is served from a disk cache filled by another client."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json={"id": "HP:0001250"})
+
+    path = str(tmp_path / "cache.sqlite")
+    first = MonarchClient(
+        base_url="https://api.example.org/v3/api/",
+        disk_cache=DiskCache(path),
+        transport=httpx.MockTransport(handler),
+    )
+    await first.get("entity/HP:0001250")
+    await first.close()
+
+    second = MonarchClient(
+        base_url="https://api.example.org/v3/api/",
+        cache=ResponseCache(),
+        disk_cache=DiskCache(path),
+        transport=httpx.MockTransport(handler),
+    )
+    assert await second.get("entity/HP:0001250") == {"id": "HP:0001250"}
+    assert await second.get("entity/HP:0001250") == {"id": "HP:0001250"}
+    await second.close()
+
+    assert len(calls) == 1
+    assert second.cache.stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_disk_cache_is_separate_per_api_url(tmp_path):
+    """Test that clients of different APIs sharing a disk cache file do not see each other's responses."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"host": request.url.host})
+
+    path = str(tmp_path / "cache.sqlite")
+    results = []
+    for base_url in ("https://staging.example.org/v3/api/", "https://api.example.org/v3/api/"):
+        client = MonarchClient(base_url=base_url, disk_cache=DiskCache(path), transport=httpx.MockTransport(handler))
+        results.append(await client.get("entity/HP:0001250"))
+        await client.close()
+
+    assert results == [{"host": "staging.example.org"}, {"host": "api.example.org"}]
@@ -0,0 +1,373 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+from monarch_mcp.client import DeadlineExceeded, MonarchClient, deadline, limits_from_env
+from monarch_mcp.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+
+BASE_URL = "https://api.example.org/v3/api/"
+
+def make_client(handler, **kwargs) -> MonarchClient:
+    """Builds a MonarchClient whose requests are answered by handler."""
+    return MonarchClient(base_url=BASE_URL, transport=httpx.MockTransport(handler), **kwargs)
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_are_coalesced():
+    """Test that concurrent identical requests share a single upstream fetch."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "MONDO:0005015"})
+
+    client = make_client(handler)
+    results = await asyncio.gather(*[client.get("entity/MONDO:0005015") for _ in range(5)])
+    await client.close()
+
+    assert len(calls) == 1
+    assert all(result == {"id": "MONDO:0005015"} for result in results)
+    assert client.stats()["coalesced_requests"] == 4
+    assert client.stats()["inflight_requests"] == 0
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_share_errors():
+    """Test that an upstream error is raised to every coalesced caller."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(404, text="not found")
+
+    client = make_client(handler)
+    results = await asyncio.gather(
+        client.get("entity/INVALID:ID"), client.get("entity/INVALID:ID"), return_exceptions=True
+    )
+    await client.close()
+
+    assert len(calls) == 1
+    assert all("404" in str(result) for result in results)
+
+@pytest.mark.asyncio
+async def test_different_params_are_not_coalesced():
+    """Test that requests with different params are sent separately."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json={"items": []})
+
+    client = make_client(handler)
+    await asyncio.gather(
+        client.get("association", params={"limit": 10}),
+        client.get("association", params={"limit": 20}),
+    )
+    await client.close()
+
+    assert len(calls) == 2
+    assert client.stats()["coalesced_requests"] == 0
+
+def no_backoff() -> RetryPolicy:
+    """Retry policy that retries immediately so tests do not sleep."""
+    return RetryPolicy(max_retries=3, backoff_base=0.0)
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    """Test that 5xx responses and connection errors are retried until success."""
+    outcomes = [httpx.ConnectError("connection refused"), httpx.Response(503), httpx.Response(200, json={"ok": True})]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    client = make_client(handler, retry_policy=no_backoff())
+    assert await client.get("entity/HGNC:1097") == {"ok": True}
+    await client.close()
+
+    stats = client.stats()
+    assert stats["retries"] == 2
+    assert stats["circuit_breakers"]["api.example.org"]["state"] == "closed"
+
+@pytest.mark.asyncio
+async def test_retries_are_exhausted_and_client_errors_not_retried():
+    """Test that retries stop at max_retries and 4xx responses fail immediately."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(500 if "flaky" in request.url.path else 404)
+
+    client = make_client(handler, retry_policy=no_backoff())
+    with pytest.raises(Exception, match="500"):
+        await client.get("entity/flaky")
+    with pytest.raises(Exception, match="404"):
+        await client.get("entity/missing")
+    await client.close()
+
+    assert len(calls) == 5
+
+@pytest.mark.asyncio
+async def test_retry_after_header_is_honoured():
+    """Test that the delay requested by Retry-After is used for 429 responses."""
+    outcomes = [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={})]
+    client = make_client(lambda request: outcomes.pop(0), retry_policy=no_backoff())
+
+    with patch("monarch_mcp.client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await client.get("search", params={"q": "marfan"})
+    await client.close()
+
+    mock_sleep.assert_awaited_once_with(2.0)
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_and_recovers():
+    """Test that the breaker opens after repeated failures and closes after a good probe."""
+    healthy = False
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={}) if healthy else httpx.Response(502)
+
+    client = make_client(
+        handler,
+        retry_policy=RetryPolicy(max_retries=0),
+        breaker_factory=lambda: CircuitBreaker(failure_threshold=2, reset_timeout=0.05),
+    )
+    for _ in range(2):
+        with pytest.raises(Exception, match="502"):
+            await client.get("entity/HGNC:1097")
+    with pytest.raises(CircuitOpenError):
+        await client.get("entity/HGNC:1097")
+    assert len(calls) == 2
+    assert client.stats()["circuit_breakers"]["api.example.org"]["state"] == "open"
+    text = client.metrics.render_prometheus()
+    assert 'monarch_circuit_breaker_state{host="api.example.org"} 2' in text
+    assert 'monarch_circuit_breaker_opened_total{host="api.example.org"} 1' in text
+    assert 'monarch_circuit_breaker_rejected_total{host="api.example.org"} 1' in text
+
+    await asyncio.sleep(0.06)
+    healthy = True
+    assert await client.get("entity/HGNC:1097") == {}
+    await client.close()
+    assert client.stats()["circuit_breakers"]["api.example.org"]["state"] == "closed"
+    assert client.metrics.snapshot()["hosts"]["api.example.org"] == {
+        "circuit_state": 0, "circuit_opened": 1, "circuit_rejected": 1,
+    }
+
+@pytest.mark.asyncio
+async def test_abandoned_probe_does_not_keep_circuit_open():
+    """Test that a half-open probe cancelled by a deadline lets the next request probe again."""
+    healthy = False
+    hang = False
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if hang:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={}) if healthy else httpx.Response(502)
+
+    client = make_client(
+        handler,
+        retry_policy=RetryPolicy(max_retries=0),
+        breaker_factory=lambda: CircuitBreaker(failure_threshold=1, reset_timeout=0.5),
+    )
+    with pytest.raises(Exception, match="502"):
+        await client.get("entity/HGNC:1097")
+    await asyncio.sleep(0.5)
+
+    hang = True
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0.05):
+            await client.get("entity/HGNC:1097")
+
+    hang, healthy = False, True
+    assert await client.get("entity/HGNC:1097") == {}
+    assert client.circuit_breaker("api.example.org").state == CircuitBreaker.CLOSED
+    await client.close()
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, HTTP dates and garbage."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+@pytest.mark.asyncio
+async def test_requests_respect_deadline():
+    """Test that requests made under a deadline fail with DeadlineExceeded."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+    with deadline(0.05):
+        with pytest.raises(DeadlineExceeded):
+            await client.get("entity/HGNC:1097")
+        with pytest.raises(DeadlineExceeded):
+            await asyncio.sleep(0.06)
+            await client.get("entity/HGNC:1098")
+    await client.close()
+
+def test_timeouts_from_env(monkeypatch):
+    """Test that the httpx timeouts are configurable through the environment."""
+    monkeypatch.setenv("MONARCH_CONNECT_TIMEOUT", "2")
+    monkeypatch.setenv("MONARCH_READ_TIMEOUT", "15")
+    client = MonarchClient(base_url=BASE_URL)
+    assert client.client.timeout.connect == 2.0
+    assert client.client.timeout.read == 15.0
+    assert client.client.timeout.pool == 10.0
+
+def test_pool_limits_from_env(monkeypatch):
+    """Test that connection pool limits are configurable through the environment."""
+    monkeypatch.setenv("MONARCH_MAX_CONNECTIONS", "50")
+    monkeypatch.setenv("MONARCH_MAX_KEEPALIVE_CONNECTIONS", "25")
+    limits = limits_from_env()
+    assert limits.max_connections == 50
+    assert limits.max_keepalive_connections == 25
+    assert limits.keepalive_expiry == 30.0
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    """Test that requesting HTTP/2 without the h2 package falls back to HTTP/1.1."""
+    monkeypatch.setattr("monarch_mcp.client.http2_available", lambda: False)
+    client = MonarchClient(base_url=BASE_URL, http2=True)
+    assert client.http2 is False
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_connections_and_ignores_errors():
+    """Test that warm_up sends requests to the API root without raising."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if len(calls) > 1:
+            raise httpx.ConnectError("unreachable")
+        return httpx.Response(404)
+
+    client = make_client(handler)
+    await client.warm_up(connections=2)
+    await client.warm_up(connections=0)
+    await client.close()
+
+    assert calls == [("HEAD", "/v3/api/"), ("HEAD", "/v3/api/")]
+
+def hanging_handler(started: list, aborted: list):
+    """Returns a transport handler that never answers and records aborted requests."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(request.url.path)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            aborted.append(request.url.path)
+            raise
+    return handler
+
+@pytest.mark.asyncio
+async def test_cancelled_get_aborts_upstream_request():
+    """Test that cancelling the only caller aborts its request and frees the concurrency slot."""
+    started, aborted = [], []
+    client = make_client(hanging_handler(started, aborted))
+    caller = asyncio.create_task(client.get("entity/HGNC:1097"))
+    await asyncio.sleep(0.01)
+    assert client.concurrency_limiter.inflight == 1
+
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0)
+
+    assert aborted == ["/v3/api/entity/HGNC:1097"]
+    stats = client.stats()
+    assert stats["concurrency"]["inflight"] == 0
+    assert stats["inflight_requests"] == 0
+    assert stats["cancelled_requests"] == 1
+    await client.close()
+
+@pytest.mark.asyncio
+async def test_shared_fetch_runs_until_last_caller_leaves():
+    """Test that a coalesced fetch survives one caller's cancellation but not all of them."""
+    release = asyncio.Event()
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await release.wait()
+        return httpx.Response(200, json={"id": "HGNC:1097"})
+
+    client = make_client(handler)
+    first = asyncio.create_task(client.get("entity/HGNC:1097"))
+    second = asyncio.create_task(client.get("entity/HGNC:1097"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await second == {"id": "HGNC:1097"}
+    assert first.cancelled()
+    assert len(calls) == 1
+    assert client.stats()["cancelled_requests"] == 0
+
+    # Once every caller is gone the next identical request starts a new fetch
+    release.clear()
+    third = asyncio.create_task(client.get("entity/HGNC:1098"))
+    await asyncio.sleep(0.01)
+    third.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await client.get("entity/HGNC:1098") == {"id": "HGNC:1097"}
+    assert calls == ["/v3/api/entity/HGNC:1097", "/v3/api/entity/HGNC:1098", "/v3/api/entity/HGNC:1098"]
+    await client.close()
+
+@pytest.mark.asyncio
+async def test_abandoned_request_frees_connection_pool_slot():
+    """Test that a request abandoned at its deadline gives its pooled connection back."""
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            if b"/slow" in request:
+                await asyncio.sleep(10)
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}")
+            await writer.drain()
+
+    upstream = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = upstream.sockets[0].getsockname()[1]
+    client = MonarchClient(
+        base_url=f"http://127.0.0.1:{port}/",
+        limits=httpx.Limits(max_connections=1),
+        timeout=httpx.Timeout(5.0, pool=0.5),
+    )
+    with deadline(0.05):
+        with pytest.raises(DeadlineExceeded):
+            await client.get("slow")
+
+    # With the only pool slot leaked this would fail with PoolTimeout
+    assert await client.get("fast") == {}
+    assert client.concurrency_limiter.inflight == 0
+    await client.close()
+    upstream.close()
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded_per_endpoint_template():
+    """Test that latency, size, status, retries and cache lookups are recorded per endpoint template."""
+    from monarch_mcp.cache import ResponseCache
+
+    statuses = [503, 200, 200]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(statuses.pop(0), json={"id": "x"})
+
+    client = make_client(handler, retry_policy=no_backoff(), cache=ResponseCache())
+    await asyncio.gather(client.get("entity/HGNC:1097"), client.get("entity/HGNC:1097"))
+    await client.get("entity/HGNC:1097")
+    await client.get("entity/HGNC:1100")
+    await client.close()
+
+    metrics = client.metrics
+    assert metrics.counter("upstream_responses_total", "entity/{id}", "503") == 1
+    assert metrics.counter("upstream_responses_total", "entity/{id}", "200") == 2
+    assert metrics.counter("upstream_retries_total", "entity/{id}") == 1
+    assert metrics.histogram("upstream_request_duration_seconds", "entity/{id}").count == 3
+    assert metrics.histogram("upstream_response_bytes", "entity/{id}").sum == 3 * len(b'{"id":"x"}')
+    assert metrics.snapshot()["endpoints"]["entity/{id}"]["cache_hit_ratio"] == 0.5
@@ -0,0 +1,36 @@
+import json
+import pytest
+from monarch_mcp import codec
+
+PAYLOAD = {
+    "total": 2,
+    "items": [
+        {"id": "uuid:1", "subject": "MONDO:0007739", "object": "HP:0001250", "negated": False, "score": 0.5},
+        {"id": "uuid:2", "subject": "MONDO:0007739", "object_label": "Sjögren syndrome", "qualifiers": None},
+    ],
+}
+
+@pytest.fixture
+def backend(request):
+    """Switches the codec to the requested backend for one test."""
+    original = codec.BACKEND
+    if codec.select_backend(request.param) != request.param:
+        pytest.skip(f"{request.param} is not installed")
+    codec.use_backend(request.param)
+    yield request.param
+    codec.use_backend(original)
+
+@pytest.mark.parametrize("backend", codec.BACKENDS, indirect=True)
+def test_codec_roundtrip(backend):
+    """Test that every backend decodes and encodes like the stdlib json module."""
+    raw = json.dumps(PAYLOAD).encode()
+    assert codec.loads(raw) == PAYLOAD
+    assert json.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+    assert json.loads(codec.dumps(PAYLOAD, indent=2)) == PAYLOAD
+    assert "\n  " in codec.dumps(PAYLOAD, indent=2)
+    assert "\n" not in codec.dumps(PAYLOAD)
+
+def test_unknown_backend_falls_back():
+    """Test that an unavailable backend falls back to an installed one."""
+    assert codec.select_backend("no-such-backend") in codec.BACKENDS
+    assert codec.select_backend("stdlib") == "stdlib"
@@ -1,5 +1,8 @@
+import asyncio
+import time
 import pytest
-from monarch_mcp.tools.entity import EntityApi
+from unittest.mock import patch
+from monarch_mcp.tools.entity import EntityApi, wait_for_all
 
 @pytest.mark.asyncio
 async def test_get_entity(mock_client):
@@ -182,4 +185,280 @@ async def test_get_entities_batch_with_error(mock_client):
     assert len(results) == 2
     assert results[0]["id"] == "MONDO:0005015"
     assert results[1]["id"] == "INVALID:ID"
-    assert "error" in results[1]
\ No newline at end of file
+    assert "error" in results[1]
+
+@pytest.mark.asyncio
+async def test_get_entities_batch_deduplicates_and_keeps_order(mock_client):
+    """Test that repeated IDs are fetched once and results follow input order."""
+    entity_api = EntityApi()
+
+    async def fake_get(endpoint):
+        # Finish in reverse order to show that results are not in completion order
+        delay = {"entity/A:1": 0.03, "entity/B:2": 0.02, "entity/C:3": 0.01}[endpoint]
+        await asyncio.sleep(delay)
+        return {"id": endpoint.split("/", 1)[1]}
+
+    mock_client.get.side_effect = fake_get
+    results = await entity_api.get_entities_batch(mock_client, ["A:1", "B:2", "A:1", "C:3"])
+
+    assert [result["id"] for result in results] == ["A:1", "B:2", "A:1", "C:3"]
+    assert mock_client.get.call_count == 3
+
+@pytest.mark.asyncio
+async def test_get_entities_batch_bounded_concurrency(mock_client):
+    """Test that no more than max_concurrency lookups run at once."""
+    entity_api = EntityApi()
+    running = 0
+    peak = 0
+
+    async def fake_get(endpoint):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"id": endpoint}
+
+    mock_client.get.side_effect = fake_get
+    entity_ids = [f"HGNC:{i}" for i in range(10)]
+    results = await entity_api.get_entities_batch(mock_client, entity_ids, max_concurrency=3)
+
+    assert len(results) == 10
+    assert peak == 3
+
+@pytest.mark.asyncio
+async def test_get_entities_batch_timeout(mock_client):
+    """Test that entities still pending at the deadline are reported as errors."""
+    entity_api = EntityApi()
+
+    async def fake_get(endpoint):
+        if endpoint == "entity/SLOW:1":
+            await asyncio.sleep(10)
+        return {"id": endpoint.split("/", 1)[1]}
+
+    mock_client.get.side_effect = fake_get
+    results = await entity_api.get_entities_batch(mock_client, ["FAST:1", "SLOW:1"], timeout=0.05)
+
+    assert results[0] == {"id": "FAST:1"}
+    assert results[1]["id"] == "SLOW:1"
+    assert "Timed out" in results[1]["error"]
+
+@pytest.mark.asyncio
+async def test_wait_for_all_splits_results_failures_and_timeouts():
+    """Test that wait_for_all cancels tasks still running at the deadline."""
+    async def fail():
+        raise ValueError("bad id")
+
+    slow = asyncio.ensure_future(asyncio.sleep(10))
+    tasks = {"fast": asyncio.ensure_future(asyncio.sleep(0, "ok")), "fail": asyncio.ensure_future(fail()), "slow": slow}
+    results, errors = await wait_for_all(tasks, timeout=0.05)
+
+    assert results == {"fast": "ok"}
+    assert errors == {"fail": "ValueError: bad id", "slow": "Timed out after 0.05 seconds"}
+    assert slow.cancelled()
+
+def make_paged_get(total):
+    """Builds a fake client.get serving `total` numbered association items."""
+    async def fake_get(endpoint, params):
+        start, limit = params["offset"], params["limit"]
+        await asyncio.sleep(0.001 * (total - start) / max(total, 1))
+        items = [{"id": f"assoc:{i}"} for i in range(start, min(start + limit, total))]
+        return {"total": total, "limit": limit, "offset": start, "items": items}
+    return fake_get
+
+@pytest.mark.asyncio
+async def test_get_associations_fetch_all_merges_pages_in_order(mock_client):
+    """Test that fetch_all collects every page and merges the items in order."""
+    entity_api = EntityApi()
+    mock_client.get.side_effect = make_paged_get(1200)
+    result = await entity_api.get_associations(mock_client, subject=["MONDO:0007739"], fetch_all=True, max_items=5000)
+
+    assert [item["id"] for item in result["items"]] == [f"assoc:{i}" for i in range(1200)]
+    assert result["total"] == 1200
+    assert result["truncated"] is False
+    assert mock_client.get.call_count == 3
+    mock_client.get.assert_any_call(
+        "association",
+        params={"subject": ["MONDO:0007739"], "direct": False, "compact": False, "limit": 500, "offset": 1000},
+    )
+
+@pytest.mark.asyncio
+async def test_get_associations_advanced_fetch_all_respects_max_items(mock_client):
+    """Test that fetch_all stops at max_items and reports truncation."""
+    entity_api = EntityApi()
+    mock_client.get.side_effect = make_paged_get(5000)
+    result = await entity_api.get_associations_advanced(
+        mock_client, subject_taxon=["NCBITaxon:9606"], offset=100, fetch_all=True, max_items=750
+    )
+
+    assert len(result["items"]) == 750
+    assert result["items"][0]["id"] == "assoc:100"
+    assert result["items"][-1]["id"] == "assoc:849"
+    assert result["offset"] == 100
+    assert result["truncated"] is True
+    assert mock_client.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_iter_associations_streams_all_items(mock_client):
+    """Test that iter_associations yields every item in order across pages."""
+    entity_api = EntityApi()
+    mock_client.get.side_effect = make_paged_get(45)
+    ids = [item["id"] async for item in entity_api.iter_associations(
+        mock_client, subject=["HGNC:1097"], page_size=20
+    )]
+
+    assert ids == [f"assoc:{i}" for i in range(45)]
+    assert mock_client.get.call_count == 3
+    mock_client.get.assert_any_call(
+        "association",
+        params={"subject": ["HGNC:1097"], "direct": False, "compact": False, "limit": 20, "offset": 40},
+    )
+
+@pytest.mark.asyncio
+async def test_iter_associations_prefetches_next_page(mock_client):
+    """Test that the next page is requested before the current page is consumed."""
+    entity_api = EntityApi()
+    mock_client.get.side_effect = make_paged_get(100)
+    stream = entity_api.iter_associations(mock_client, page_size=10)
+
+    first = await stream.__anext__()
+    assert first["id"] == "assoc:0"
+    assert mock_client.get.call_count == 2
+
+    await stream.aclose()
+    assert mock_client.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_iter_associations_max_items(mock_client):
+    """Test that iter_associations stops after max_items."""
+    entity_api = EntityApi()
+    mock_client.get.side_effect = make_paged_get(100)
+    ids = [item["id"] async for item in entity_api.iter_associations(mock_client, page_size=10, max_items=15)]
+
+    assert len(ids) == 15
+    assert mock_client.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_bulk_fetches_run_at_bulk_priority(mock_client):
+    """Test that fetch_all pages and batch lookups are requested at bulk priority."""
+    from monarch_mcp.client import BULK, INTERACTIVE, _priority
+
+    entity_api = EntityApi()
+    paged_get = make_paged_get(1200)
+    priorities = []
+
+    async def recording_get(endpoint, params=None):
+        priorities.append(_priority.get())
+        return await paged_get(endpoint, params) if endpoint == "association" else {"id": endpoint}
+
+    mock_client.get.side_effect = recording_get
+    await entity_api.get_associations(mock_client, subject=["MONDO:0007739"], fetch_all=True)
+    await entity_api.get_entities_batch(mock_client, ["HGNC:1097", "HGNC:1100"])
+    assert priorities == [BULK] * 4
+
+    await entity_api.get_entity(mock_client, "HGNC:1097")
+    assert priorities[-1] == INTERACTIVE
+
+@pytest.mark.asyncio
+async def test_get_associations_cursor_serves_prefetched_pages(mock_client):
+    """Test that a cursor walks all pages and follow-up pages come from the background prefetch."""
+    from monarch_mcp.client import BULK, _priority
+    from monarch_mcp.cursors import CursorStore
+
+    entity_api = EntityApi(cursors=CursorStore(prefetch_pages=2))
+    paged_get = make_paged_get(50)
+    priorities = {}
+
+    async def recording_get(endpoint, params=None):
+        priorities[params["offset"]] = _priority.get()
+        return await paged_get(endpoint, params)
+
+    mock_client.get.side_effect = recording_get
+    page = await entity_api.get_associations(mock_client, subject=["HGNC:1097"], limit=20, use_cursor=True)
+    assert [item["id"] for item in page["items"]] == [f"assoc:{i}" for i in range(20)]
+    await asyncio.sleep(0.01)
+    assert mock_client.get.call_count == 3
+    assert priorities[20] == priorities[40] == BULK
+
+    ids = [item["id"] for item in page["items"]]
+    while page["next_cursor"] is not None:
+        page = await entity_api.get_associations(mock_client, cursor=page["next_cursor"])
+        ids += [item["id"] for item in page["items"]]
+
+    assert ids == [f"assoc:{i}" for i in range(50)]
+    assert mock_client.get.call_count == 3
+    stats = entity_api.cursors.stats()
+    assert stats["prefetch_hits"] == 2
+    assert stats["open"] == 0
+
+@pytest.mark.asyncio
+async def test_cursor_retry_returns_same_page_and_unknown_cursor_fails(mock_client):
+    """Test that re-sending a cursor returns the same page and expired cursors are rejected."""
+    from monarch_mcp.cursors import CursorError, CursorStore
+
+    entity_api = EntityApi(cursors=CursorStore(ttl=60, prefetch_pages=1))
+    mock_client.get.side_effect = make_paged_get(100)
+    page = await entity_api.get_associations_advanced(mock_client, limit=10, use_cursor=True)
+    cursor = page["next_cursor"]
+
+    second = await entity_api.get_associations_advanced(mock_client, cursor=cursor)
+    again = await entity_api.get_associations_advanced(mock_client, cursor=cursor)
+    assert second["items"] == again["items"]
+    assert second["items"][0]["id"] == "assoc:10"
+    assert again["next_cursor"] == second["next_cursor"]
+
+    with patch("monarch_mcp.cursors.time.monotonic", return_value=time.monotonic() + 120):
+        with pytest.raises(CursorError, match="expired"):
+            await entity_api.get_associations_advanced(mock_client, cursor=again["next_cursor"])
+    with pytest.raises(CursorError, match="Malformed"):
+        await entity_api.get_associations_advanced(mock_client, cursor="not-a-cursor")
+
+@pytest.mark.asyncio
+async def test_cursor_store_is_bounded_and_cancels_prefetches(mock_client):
+    """Test that the least recently used cursor is closed and its pending prefetch cancelled."""
+    from monarch_mcp.cursors import CursorError, CursorStore
+
+    store = CursorStore(max_cursors=1, prefetch_pages=1)
+    entity_api = EntityApi(cursors=store)
+    release = asyncio.Event()
+    cancelled = []
+
+    async def slow_get(endpoint, params=None):
+        if params["offset"] == 0:
+            return {"total": 100, "items": [{"id": "assoc:0"}]}
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.append(params["subject"])
+            raise
+        return {"total": 100, "items": []}
+
+    mock_client.get.side_effect = slow_get
+    first = await entity_api.get_associations(mock_client, subject=["A"], limit=1, use_cursor=True)
+    await asyncio.sleep(0)
+    await entity_api.get_associations(mock_client, subject=["B"], limit=1, use_cursor=True)
+    await asyncio.sleep(0)
+
+    assert cancelled == [["A"]]
+    assert len(store) == 1
+    assert store.stats()["evicted"] == 1
+    with pytest.raises(CursorError):
+        await entity_api.get_associations(mock_client, cursor=first["next_cursor"])
+    store.close()
+
+@pytest.mark.asyncio
+async def test_cursors_are_rejected_with_several_workers(mock_client, monkeypatch):
+    """Test that cursor calls fail with a clear error when worker processes do not share cursors."""
+    from monarch_mcp.cursors import CursorError
+
+    monkeypatch.setenv("MONARCH_WORKERS", "4")
+    entity_api = EntityApi()
+    assert entity_api.cursors is None
+    with pytest.raises(CursorError, match="several worker processes"):
+        await entity_api.get_associations(mock_client, subject=["HGNC:1097"], use_cursor=True)
+    with pytest.raises(CursorError, match="several worker processes"):
+        await entity_api.get_associations_advanced(mock_client, cursor="abc:20")
+    mock_client.get.assert_not_called()
+
+    mock_client.get.return_value = {"total": 0, "items": []}
+    assert await entity_api.get_associations(mock_client, subject=["HGNC:1097"]) == {"total": 0, "items": []}
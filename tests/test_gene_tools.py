@@ -107,4 +107,61 @@ async def test_get_diseases_by_gene(mock_client):
                       "biolink:CorrelatedGeneToDiseaseAssociation"],
             limit=30,
             offset=0
-        )
\ No newline at end of file
+        )
+
+@pytest.mark.asyncio
+async def test_get_gene_dossier_runs_sections_concurrently(mock_client):
+    """Test that the dossier queries every section at once with per-section limits."""
+    import asyncio
+    gene_api = GeneApi()
+    inflight = []
+    peak = 0
+
+    async def fake_get(endpoint, params=None):
+        nonlocal peak
+        inflight.append(params["category"][0])
+        peak = max(peak, len(inflight))
+        await asyncio.sleep(0.01)
+        inflight.pop()
+        return {"total": 1, "items": [{"category": params["category"][0], "limit": params["limit"]}]}
+
+    mock_client.get.side_effect = fake_get
+    dossier = await gene_api.get_gene_dossier(mock_client, "HGNC:1097", limit=5, section_limits={"phenotypes": 50})
+
+    assert peak == 7
+    assert dossier["complete"] is True
+    assert dossier["errors"] == {}
+    assert list(dossier["sections"]) == [
+        "phenotypes", "diseases", "expression", "interactions", "orthologs", "pathways", "causal_diseases"
+    ]
+    assert dossier["sections"]["phenotypes"]["items"][0]["limit"] == 50
+    assert dossier["sections"]["pathways"]["items"][0] == {"category": "biolink:GeneToPathwayAssociation", "limit": 5}
+
+@pytest.mark.asyncio
+async def test_get_gene_dossier_reports_partial_failures(mock_client):
+    """Test that failed and timed-out sections are reported while the others are returned."""
+    import asyncio
+    gene_api = GeneApi()
+
+    async def fake_get(endpoint, params=None):
+        category = params["category"][0]
+        if category == "biolink:GeneToPathwayAssociation":
+            raise RuntimeError("upstream error")
+        if category == "biolink:GeneToExpressionSiteAssociation":
+            await asyncio.sleep(10)
+        return {"total": 0, "items": []}
+
+    mock_client.get.side_effect = fake_get
+    dossier = await gene_api.get_gene_dossier(
+        mock_client, "HGNC:1097", sections=["phenotypes", "expression", "pathways"], timeout=0.05
+    )
+
+    assert list(dossier["sections"]) == ["phenotypes"]
+    assert dossier["errors"] == {
+        "expression": "Timed out after 0.05 seconds",
+        "pathways": "RuntimeError: upstream error",
+    }
+    assert dossier["complete"] is False
+
+    with pytest.raises(ValueError, match="Unknown dossier sections: genome"):
+        await gene_api.get_gene_dossier(mock_client, "HGNC:1097", section_limits={"genome": 1})
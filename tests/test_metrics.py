@@ -0,0 +1,60 @@
+from monarch_mcp.metrics import Histogram, Metrics, endpoint_template
+
+def test_endpoint_template_replaces_variable_segments():
+    """Test that endpoint templates keep the fixed path and replace IDs with placeholders."""
+    assert endpoint_template("entity/HP:0001250") == "entity/{id}"
+    assert endpoint_template("entity/HGNC:1097/biolink:DiseaseToPhenotypicFeatureAssociation") == "entity/{id}/{category}"
+    assert endpoint_template("semsim/search/HP:0001250,HP:0001263/Human Diseases") == "semsim/search/{termset}/{group}"
+    assert endpoint_template("semsim/compare/HP:1/HP:2") == "semsim/compare/{subjects}/{objects}"
+    assert endpoint_template("semsim/autocomplete") == "semsim/autocomplete"
+    assert endpoint_template("association") == "association"
+    assert endpoint_template("histopheno/HP:0000924") == "histopheno/{id}"
+
+def test_histogram_buckets_and_quantiles():
+    """Test that observations land in the first bucket whose bound is not below them."""
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) is None
+
+def test_prometheus_rendering():
+    """Test the Prometheus text format of counters and cumulative histogram buckets."""
+    metrics = Metrics()
+    metrics.observe("upstream_request_duration_seconds", 0.02, "entity/{id}")
+    metrics.observe("upstream_request_duration_seconds", 0.3, "entity/{id}")
+    metrics.inc("upstream_responses_total", "entity/{id}", "200", amount=2)
+    text = metrics.render_prometheus()
+
+    assert "# TYPE monarch_upstream_request_duration_seconds histogram" in text
+    assert 'monarch_upstream_request_duration_seconds_bucket{endpoint="entity/{id}",le="0.025"} 1' in text
+    assert 'monarch_upstream_request_duration_seconds_bucket{endpoint="entity/{id}",le="+Inf"} 2' in text
+    assert 'monarch_upstream_request_duration_seconds_count{endpoint="entity/{id}"} 2' in text
+    assert 'monarch_upstream_responses_total{endpoint="entity/{id}",status="200"} 2' in text
+    assert text.endswith("\n")
+
+def test_snapshot_summarises_endpoints_and_tools():
+    """Test that the snapshot reports request counts, statuses and cache hit ratio."""
+    metrics = Metrics()
+    metrics.observe("upstream_request_duration_seconds", 0.02, "association")
+    metrics.observe("upstream_response_bytes", 2048, "association")
+    metrics.inc("upstream_responses_total", "association", "200")
+    metrics.inc("upstream_retries_total", "association")
+    for result in ("miss", "memory_hit", "memory_hit", "coalesced"):
+        metrics.inc("cache_lookups_total", "association", result)
+    metrics.observe("tool_call_duration_seconds", 0.05, "get_associations")
+    metrics.inc("tool_calls_total", "get_associations", "ok")
+    metrics.inc("tool_calls_total", "get_associations", "DeadlineExceeded")
+
+    snapshot = metrics.snapshot()
+    association = snapshot["endpoints"]["association"]
+    assert association["requests"] == 1
+    assert association["bytes"] == 2048
+    assert association["statuses"] == {"200": 1}
+    assert association["retries"] == 1
+    assert association["cache_hit_ratio"] == 0.75
+    assert snapshot["tools"]["get_associations"]["calls"] == 1
+    assert snapshot["tools"]["get_associations"]["errors"] == {"DeadlineExceeded": 1}
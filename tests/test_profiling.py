@@ -0,0 +1,81 @@
+import asyncio
+import json
+import logging
+import sys
+import time
+import httpx
+import pytest
+from monarch_mcp import codec
+from monarch_mcp.client import MonarchClient
+from monarch_mcp.profiling import LoopLagMonitor, SamplingProfiler
+from monarch_mcp.server import MonarchMcpServer
+
+def busy(seconds):
+    """Blocks the calling thread, like encoding a very large result would."""
+    ends_at = time.monotonic() + seconds
+    while time.monotonic() < ends_at:
+        pass
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="reading the context of a task needs Python 3.12")
+@pytest.mark.asyncio
+async def test_profiler_attributes_spawned_tasks_to_tools(tmp_path):
+    """Test that upstream responses decoded in the shared fetch tasks are attributed to the calling tool."""
+    document = {"items": [{"id": f"HP:{i:07d}", "name": "Abnormality of the nervous system"} for i in range(20000)]}
+    body = json.dumps(document).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    server = MonarchMcpServer()
+    server.client = MonarchClient(base_url="https://api.example.org/", transport=httpx.MockTransport(handler))
+    # The stdlib decoder runs Python frames the sampler can land in; orjson is one C call
+    original = codec.BACKEND
+    codec.use_backend("stdlib")
+    profiler = SamplingProfiler(interval=0.001, window=60, output_dir=str(tmp_path))
+    try:
+        profiler.start()
+        entity_ids = [f"HGNC:{i}" for i in range(20)]
+        await server.call_tool("get_entities_batch", {"entity_ids": entity_ids, "output_format": "compact"})
+        profiler.stop()
+    finally:
+        codec.use_backend(original)
+        await server.client.close()
+
+    [path] = profiler.dumps
+    fetch_stacks = [line for line in open(path).read().splitlines() if "client.py:MonarchClient._fetch;" in line]
+    assert any(line.startswith("tool:get_entities_batch;") and "codec.py:" in line for line in fetch_stacks)
+    assert not [line for line in fetch_stacks if not line.startswith("tool:get_entities_batch;")]
+
+@pytest.mark.asyncio
+async def test_profiler_writes_one_file_per_window(tmp_path):
+    """Test that a single-window profile stops by itself after the window."""
+    profiler = SamplingProfiler(interval=0.001, window=0.05, output_dir=str(tmp_path))
+    profiler.start()
+    busy(0.1)
+    await asyncio.sleep(0.05)
+    assert not profiler.running
+    assert len(profiler.dumps) == 1
+    profiler.stop()
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_logs_blocking_stack(caplog):
+    """Test that a stalled event loop is reported with the code that blocked it."""
+    monitor = LoopLagMonitor(threshold=0.05, interval=0.01)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.03)
+    with caplog.at_level(logging.WARNING, logger="monarch_mcp.profiling"):
+        busy(0.2)
+        await asyncio.sleep(0.03)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert monitor.stalls == 1
+    assert monitor.max_lag >= 0.15
+    assert "test_profiling.py:busy" in caplog.text
+
+def test_profiling_cli_options():
+    """Test that the profiling mode and lag threshold can be set on the command line."""
+    from monarch_mcp.server import parse_args
+    args = parse_args(["--profile", "signal", "--loop-lag-threshold", "0.2"])
+    assert args.profile == "signal"
+    assert args.loop_lag_threshold == 0.2
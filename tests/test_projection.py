@@ -0,0 +1,40 @@
+from monarch_mcp.projection import project
+
+ASSOCIATIONS = {
+    "total": 2,
+    "limit": 20,
+    "offset": 0,
+    "items": [
+        {"subject": "MONDO:0007739", "predicate": "biolink:has_phenotype", "object": "HP:0001250",
+         "object_label": "Seizure", "publications": ["PMID:1"], "grouping_key": "x"},
+        {"subject": "MONDO:0007739", "predicate": "biolink:has_phenotype", "object": "HP:0002072"},
+    ],
+}
+
+def test_project_paginated_result_keeps_pagination():
+    """Test that fields apply to each item while pagination keys are kept."""
+    result = project(ASSOCIATIONS, ["object", "object_label"])
+    assert result == {
+        "total": 2,
+        "limit": 20,
+        "offset": 0,
+        "items": [{"object": "HP:0001250", "object_label": "Seizure"}, {"object": "HP:0002072"}],
+    }
+    # The original (possibly cached) response is untouched
+    assert "grouping_key" in ASSOCIATIONS["items"][0]
+
+def test_project_nested_fields_and_lists():
+    """Test dotted paths into nested objects and lists of objects."""
+    matches = [
+        {"subject": {"id": "MONDO:1", "name": "a", "synonym": ["x"]}, "score": 9.1,
+         "similarity": {"ancestor_id": "HP:1", "ancestor_label": "b", "jaccard_similarity": 0.3}},
+    ]
+    result = project(matches, ["subject.id", "subject.name", "score", "similarity.ancestor_label"])
+    assert result == [{"subject": {"id": "MONDO:1", "name": "a"}, "score": 9.1,
+                       "similarity": {"ancestor_label": "b"}}]
+
+def test_project_single_entity_and_empty_fields():
+    """Test projection of a plain object, and that no fields means no projection."""
+    entity = {"id": "HGNC:1097", "name": "BRAF", "description": "long text", "xref": ["x"]}
+    assert project(entity, ["id", "name", "missing"]) == {"id": "HGNC:1097", "name": "BRAF"}
+    assert project(entity, []) is entity
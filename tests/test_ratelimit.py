@@ -0,0 +1,164 @@
+import asyncio
+import time
+import httpx
+import pytest
+from monarch_mcp.client import BULK, MonarchClient, priority
+from monarch_mcp.ratelimit import INTERACTIVE, AdaptiveConcurrencyLimiter, TokenBucket
+from monarch_mcp.resilience import RetryPolicy
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    """Test that requests beyond the burst are spread out at the configured rate."""
+    bucket = TokenBucket(rate=100, burst=2)
+    started = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    elapsed = time.monotonic() - started
+    # Two requests use the burst, the other four wait ~10ms each
+    assert elapsed >= 0.035
+    assert bucket.stats()["waited_seconds"] > 0
+
+@pytest.mark.asyncio
+async def test_limiter_grows_on_success_and_halves_on_throttle():
+    """Test the additive increase / multiplicative decrease behaviour."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+    for _ in range(8):
+        await limiter.acquire()
+        limiter.release(latency=0.0)
+    assert limiter.current_limit == 5
+
+    await limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.current_limit == 2
+    assert limiter.stats()["decreases"] == 1
+
+@pytest.mark.asyncio
+async def test_limiter_shrinks_on_latency_spike():
+    """Test that a response much slower than the baseline reduces the limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    for latency in (0.001, 0.001):
+        await limiter.acquire()
+        limiter.release(latency=latency)
+    await limiter.acquire()
+    limiter.release(latency=1.0)
+    assert limiter.current_limit == 5
+
+@pytest.mark.asyncio
+async def test_limiter_compares_latency_per_endpoint_and_damps_decreases():
+    """Test that slower endpoints and jitter are not spikes and spikes within the cooldown count once."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=12, max_limit=12, decrease_cooldown=60)
+    for _ in range(20):
+        await limiter.acquire()
+        limiter.release(latency=0.02, key="entity/{id}")
+    for _ in range(20):
+        await limiter.acquire()
+        limiter.release(latency=0.3, key="association")
+    for _ in range(5):
+        await limiter.acquire()
+        limiter.release(latency=0.045, key="entity/{id}")
+    assert limiter.current_limit == 12
+    assert limiter.decreases == 0
+
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release(latency=2.0, key="association")
+    assert limiter.current_limit == 6
+    assert limiter.decreases == 1
+    assert set(limiter.stats()["baseline_latencies"]) == {"entity/{id}", "association"}
+
+@pytest.mark.asyncio
+async def test_limiter_queues_beyond_limit_and_survives_cancellation():
+    """Test that waiters are admitted as slots free up and cancelled waiters leave the queue."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    cancelled = asyncio.ensure_future(limiter.acquire())
+    admitted = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 2
+
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    limiter.release()
+    await asyncio.wait_for(admitted, 1)
+    assert limiter.inflight == 1
+    assert limiter.queued == 0
+
+@pytest.mark.asyncio
+async def test_client_shares_limiter_and_backs_off_on_429():
+    """Test that MonarchClient requests pass through the limiter and 429s shrink it."""
+    peak = 0
+    running = 0
+    statuses = [429] + [200] * 20
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal peak, running
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+        return httpx.Response(statuses.pop(0), json={})
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+    client = MonarchClient(
+        base_url="https://api.example.org/v3/api/",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(backoff_base=0.0),
+        concurrency_limiter=limiter,
+    )
+    await client.get("entity/HGNC:0")
+    assert limiter.stats()["decreases"] == 1
+    assert limiter.current_limit == 2
+
+    await asyncio.gather(*[client.get(f"entity/HGNC:{i}") for i in range(1, 11)])
+    await client.close()
+
+    assert peak <= 4
+    assert limiter.current_limit == 4
+    assert limiter.inflight == 0
+
+@pytest.mark.asyncio
+async def test_limiter_grants_interactive_waiters_before_bulk():
+    """Test that queued interactive requests jump ahead of queued bulk requests."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    order = []
+
+    async def request(name, level):
+        await limiter.acquire(level)
+        order.append(name)
+        limiter.release()
+
+    tasks = [asyncio.ensure_future(request(f"bulk{i}", BULK)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.ensure_future(request("interactive", INTERACTIVE)))
+    await asyncio.sleep(0)
+    assert limiter.stats()["queued_by_priority"] == {"interactive": 1, "bulk": 3}
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "bulk0", "bulk1", "bulk2"]
+
+@pytest.mark.asyncio
+async def test_interactive_request_overtakes_queued_bulk_pages():
+    """Test that a client request made during a bulk job is sent before the job's queued pages."""
+    sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        await asyncio.sleep(0.005)
+        return httpx.Response(200, json={})
+
+    client = MonarchClient(
+        base_url="https://api.example.org/v3/api/",
+        transport=httpx.MockTransport(handler),
+        concurrency_limiter=AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2),
+    )
+    with priority(BULK):
+        bulk = [asyncio.ensure_future(client.get(f"entity/BULK:{i}")) for i in range(10)]
+    await asyncio.sleep(0)
+    await client.get("entity/HGNC:1097")
+    await asyncio.gather(*bulk)
+    await client.close()
+
+    # Only the bulk requests already holding the two slots went first
+    assert sent.index("/v3/api/entity/HGNC:1097") == 2
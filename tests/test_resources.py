@@ -0,0 +1,72 @@
+import time
+import pytest
+from unittest.mock import patch
+from monarch_mcp.resources import ResourceNotFound, ResultStore, summarize
+
+def test_result_store_reads_chunks_and_rejects_bad_uris():
+    """Test that chunks cover the stored text and unknown or out-of-range URIs fail."""
+    store = ResultStore(threshold=10, chunk_size=4)
+    text = "0123456789ab"
+    summary = store.put("get_associations", text, {"total": 1, "items": [1]})
+    uri = summary["resource_uri"]
+
+    assert summary["chunk_count"] == 3
+    assert [store.read(f"{uri}/chunks/{n}") for n in range(3)] == ["0123", "4567", "89ab"]
+    assert store.read(uri) == text
+    assert ResultStore.mime_type(uri) == "application/json"
+    assert ResultStore.mime_type(f"{uri}/chunks/0") == "text/plain"
+    with pytest.raises(ResourceNotFound, match="out of range"):
+        store.read(f"{uri}/chunks/3")
+    with pytest.raises(ResourceNotFound, match="Malformed"):
+        store.read(f"{uri}/pages/0")
+    with pytest.raises(ResourceNotFound, match="Unknown"):
+        store.read("monarch://results/missing")
+
+def test_result_store_is_bounded_by_size_and_expires():
+    """Test that the least recently read result is dropped first and unread results expire."""
+    store = ResultStore(threshold=1, max_bytes=25, ttl=60)
+    first = store.put("a", "x" * 10, None)["resource_uri"]
+    second = store.put("b", "y" * 10, None)["resource_uri"]
+    store.read(first)
+    store.put("c", "z" * 10, None)
+
+    assert [stored.tool for stored in store.list()] == ["a", "c"]
+    assert store.stats()["bytes"] == 20
+    with pytest.raises(ResourceNotFound):
+        store.read(second)
+
+    with patch("monarch_mcp.resources.time.monotonic", return_value=time.monotonic() + 120):
+        assert store.list() == []
+    assert store.stats()["expired"] == 2
+
+def test_result_store_counts_utf8_bytes():
+    """Test that stored sizes are UTF-8 bytes, not characters."""
+    store = ResultStore(threshold=1)
+    store.put("get_entity", '{"name": "Sjögren"}', None)
+    [stored] = store.list()
+    assert stored.size == len('{"name": "Sjögren"}') + 1
+    assert store.stats()["bytes"] == stored.size
+
+def test_summarize_describes_paginated_results():
+    """Test that summaries keep the pagination keys and preview a few items."""
+    summary = summarize({"total": 50, "offset": 0, "items": list(range(20)), "facet_fields": []})
+    assert summary["total"] == 50
+    assert summary["item_count"] == 20
+    assert summary["preview"] == [0, 1, 2]
+    assert summarize([1, 2, 3, 4])["length"] == 4
+
+def test_result_store_from_env():
+    """Test that the store is configured from the environment and disabled with several workers."""
+    with patch.dict("os.environ", {"MONARCH_RESOURCE_THRESHOLD": "100", "MONARCH_RESOURCE_CHUNK_SIZE": "10"}):
+        store = ResultStore.from_env()
+    assert store.threshold == 100
+    assert store.chunk_size == 10
+    with patch.dict("os.environ", {"MONARCH_RESOURCE_THRESHOLD": "0"}):
+        assert ResultStore.from_env() is None
+    with patch.dict("os.environ", {"MONARCH_RESOURCE_THRESHOLD": "100", "MONARCH_WORKERS": "2"}):
+        assert ResultStore.from_env() is None
+
+def test_results_are_inline_by_default(monkeypatch):
+    """Test that storing results as resources is opt-in."""
+    monkeypatch.delenv("MONARCH_RESOURCE_THRESHOLD", raising=False)
+    assert ResultStore.from_env() is None
@@ -0,0 +1,376 @@
+import asyncio
+import json
+import os
+import pytest
+from unittest.mock import AsyncMock, patch
+from monarch_mcp.server import MonarchMcpServer
+
+@pytest.fixture
+def server(mock_client) -> MonarchMcpServer:
+    """Fixture to create a MonarchMcpServer backed by the mock client."""
+    server = MonarchMcpServer()
+    mock_client.warm_up = AsyncMock()
+    server.client = mock_client
+    return server
+
+@pytest.mark.asyncio
+async def test_call_tool_returns_json_result(server, mock_client):
+    """Test that a tool call is dispatched and its result JSON-encoded."""
+    mock_client.get.return_value = {"id": "MONDO:0005015", "name": "diabetes mellitus"}
+    result = await server.call_tool("get_entity", {"entity_id": "MONDO:0005015"})
+
+    assert json.loads(result[0].text) == {"id": "MONDO:0005015", "name": "diabetes mellitus"}
+    mock_client.get.assert_called_once_with("entity/MONDO:0005015")
+
+@pytest.mark.asyncio
+async def test_call_tool_unknown_tool(server):
+    """Test that unknown tools produce a structured error."""
+    result = await server.call_tool("no_such_tool", {})
+    error = json.loads(result[0].text)
+    assert error["error"] == "ValueError"
+    assert error["tool_name"] == "no_such_tool"
+
+@pytest.mark.asyncio
+async def test_call_tool_deadline(server, mock_client):
+    """Test that a stuck tool call returns a structured timeout error."""
+    async def stuck_get(endpoint):
+        await asyncio.sleep(10)
+
+    mock_client.get.side_effect = stuck_get
+    server.tool_timeout = 0.05
+    result = await server.call_tool("get_entity", {"entity_id": "MONDO:0005015"})
+    error = json.loads(result[0].text)
+
+    assert error["error"] == "DeadlineExceeded"
+    assert error["tool_name"] == "get_entity"
+    assert error["timeout_seconds"] == 0.05
+
+@pytest.mark.asyncio
+async def test_call_tool_compact_output_with_fields(server, mock_client):
+    """Test that fields are projected and compact output has no whitespace."""
+    mock_client.get.return_value = {
+        "total": 1,
+        "items": [{"subject": "HGNC:1097", "object": "HP:0001250", "object_label": "Seizure", "grouping_key": "k"}],
+    }
+    result = await server.call_tool("get_gene_phenotype_associations", {
+        "gene_id": "HGNC:1097",
+        "fields": ["object", "object_label"],
+        "output_format": "compact",
+    })
+
+    assert result[0].text == '{"total":1,"items":[{"object":"HP:0001250","object_label":"Seizure"}]}'
+    # Output options are not forwarded to the tool method
+    assert "fields" not in mock_client.get.call_args.kwargs["params"]
+
+@pytest.mark.asyncio
+async def test_call_tool_per_tool_default_fields(server, mock_client):
+    """Test that per-tool default projections apply when no fields are passed."""
+    mock_client.get.return_value = {"id": "HGNC:1097", "name": "BRAF", "description": "long"}
+    server.tool_fields = {"get_entity": ["id", "name"]}
+    result = await server.call_tool("get_entity", {"entity_id": "HGNC:1097"})
+
+    assert json.loads(result[0].text) == {"id": "HGNC:1097", "name": "BRAF"}
+    assert "\n" in result[0].text
+
+def test_every_tool_accepts_output_options():
+    """Test that the output options are advertised in every tool schema."""
+    from monarch_mcp.tools import ALL_TOOLS
+    for tool in ALL_TOOLS:
+        assert "fields" in tool.inputSchema["properties"]
+        assert "output_format" in tool.inputSchema["properties"]
+
+def _mcp_post(http, payload, session_id=None):
+    """Posts a JSON-RPC message to the streamable HTTP endpoint and decodes the reply."""
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+    if session_id:
+        headers["mcp-session-id"] = session_id
+    response = http.post("/mcp", json=payload, headers=headers, follow_redirects=False)
+    assert response.status_code in (200, 202), response.text
+    data = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+    return response, (json.loads(data[-1]) if data else None)
+
+def test_http_transport_serves_sessions_with_shared_client(server, mock_client):
+    """Test that several HTTP sessions are served by one server and one client."""
+    from starlette.testclient import TestClient
+
+    mock_client.get.return_value = {"id": "HGNC:1097"}
+    initialize = {
+        "jsonrpc": "2.0", "id": 1, "method": "initialize",
+        "params": {"protocolVersion": "2025-03-26", "capabilities": {},
+                   "clientInfo": {"name": "test", "version": "0"}},
+    }
+    with TestClient(server.create_app("http")) as http:
+        for _ in range(2):
+            response, reply = _mcp_post(http, initialize)
+            session_id = response.headers["mcp-session-id"]
+            assert reply["result"]["serverInfo"]["name"] == "monarch-mcp"
+            _mcp_post(http, {"jsonrpc": "2.0", "method": "notifications/initialized"}, session_id)
+            _, reply = _mcp_post(http, {
+                "jsonrpc": "2.0", "id": 2, "method": "tools/call",
+                "params": {"name": "get_entity", "arguments": {"entity_id": "HGNC:1097"}},
+            }, session_id)
+            assert json.loads(reply["result"]["content"][0]["text"]) == {"id": "HGNC:1097"}
+
+    assert mock_client.get.call_count == 2
+
+def test_parse_args_selects_transport():
+    """Test the transport CLI flags."""
+    from monarch_mcp.server import parse_args
+    assert parse_args([]).transport == "stdio"
+    args = parse_args(["--transport", "http", "--port", "9000"])
+    assert (args.transport, args.host, args.port) == ("http", "127.0.0.1", 9000)
+
+def test_parse_args_workers_require_http():
+    """Test that multi-worker mode is only available for the http transport."""
+    from monarch_mcp.server import parse_args
+    assert parse_args(["--transport", "http", "--workers", "4"]).workers == 4
+    with pytest.raises(SystemExit):
+        parse_args(["--transport", "sse", "--workers", "4"])
+
+def test_run_workers_shares_disk_cache(monkeypatch):
+    """Test that worker mode starts uvicorn workers with a disk cache in a private directory."""
+    from monarch_mcp import server as server_module
+    calls = []
+
+    def run(app, **kwargs):
+        cache_dir = os.path.dirname(os.environ["MONARCH_DISK_CACHE_PATH"])
+        calls.append((app, kwargs, cache_dir, os.stat(cache_dir).st_mode & 0o777))
+
+    monkeypatch.setattr(server_module.uvicorn, "run", run)
+
+    with patch.dict(os.environ):
+        os.environ.pop("MONARCH_DISK_CACHE_PATH", None)
+        server_module.main(["--transport", "http", "--workers", "3", "--port", "9001"])
+        assert os.environ["MONARCH_WORKERS"] == "3"
+
+    app, kwargs, cache_dir, mode = calls[0]
+    assert app == "monarch_mcp.server:create_worker_app"
+    assert kwargs["factory"] is True
+    assert kwargs["workers"] == 3
+    assert kwargs["port"] == 9001
+    assert mode == 0o700
+    assert not os.path.exists(cache_dir)
+
+def test_stateless_http_app_answers_without_session(server, mock_client):
+    """Test that the stateless app used by workers serves calls without a session id."""
+    from starlette.testclient import TestClient
+
+    mock_client.get.return_value = {"id": "HP:0001250"}
+    with TestClient(server.create_app("http", stateless=True)) as http:
+        _, reply = _mcp_post(http, {
+            "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "get_entity", "arguments": {"entity_id": "HP:0001250"}},
+        })
+    assert json.loads(reply["result"]["content"][0]["text"]) == {"id": "HP:0001250"}
+
+@pytest.mark.asyncio
+async def test_call_tool_validates_arguments(server, mock_client):
+    """Test that arguments are checked against the tool's input schema."""
+    result = await server.call_tool("get_entity", {"entity_id": 42})
+    error = json.loads(result[0].text)
+    assert error["error"] == "ValueError"
+    assert "Input validation error" in error["message"]
+
+    result = await server.call_tool("get_disease_phenotype_associations", {"limit": 5})
+    assert "'disease_id' is a required property" in json.loads(result[0].text)["message"]
+    mock_client.get.assert_not_called()
+
+def test_tools_are_bound_once_and_share_entity_api(server):
+    """Test that tools are bound on first use and domain APIs share one EntityApi."""
+    assert server._dispatch == {}
+    entity_api = server._resolve_tool("get_entity").__self__
+    assert server._resolve_tool("get_gene_orthologs").__self__.entity_api is entity_api
+    assert server._resolve_tool("get_disease_treatments").__self__.entity_api is entity_api
+    # The whole module is bound at once and reused afterwards
+    assert "get_gene_pathways" in server._dispatch
+    assert server._resolve_tool("get_entity").__self__ is entity_api
+    with pytest.raises(ValueError, match="Unknown tool"):
+        server._resolve_tool("no_such_tool")
+
+def test_dispatch_table_is_immutable():
+    """Test that the full dispatch table covers every tool and cannot be modified."""
+    from monarch_mcp.tools import ALL_TOOLS, build_dispatch_table
+    dispatch = build_dispatch_table()
+    assert set(dispatch) == {tool.name for tool in ALL_TOOLS}
+    with pytest.raises(TypeError):
+        dispatch["get_entity"] = None
+
+def test_tool_registry_matches_tool_modules():
+    """Test that the static registry lists exactly the tools each definitions module defines."""
+    import importlib
+    from monarch_mcp.tools import TOOL_MODULES
+    for module_name, (class_name, tools_attr, tool_names) in TOOL_MODULES.items():
+        definitions = importlib.import_module(f"monarch_mcp.tools.definitions.{module_name}")
+        assert tuple(tool.name for tool in getattr(definitions, tools_attr)) == tool_names
+        module = importlib.import_module(f"monarch_mcp.tools.{module_name}")
+        assert getattr(module, tools_attr) is getattr(definitions, tools_attr)
+        api_class = getattr(module, class_name)
+        assert all(callable(getattr(api_class, name, None)) for name in tool_names)
+
+def test_tool_modules_load_on_first_use():
+    """Test that listing tools over MCP imports no tool module and a call imports only what it needs."""
+    import subprocess
+    import sys
+    script = (
+        "import asyncio, sys\n"
+        "from unittest.mock import AsyncMock\n"
+        "from mcp.shared.memory import create_connected_server_and_client_session\n"
+        "from monarch_mcp.server import MonarchMcpServer\n"
+        "from monarch_mcp.tools import TOOL_INDEX\n"
+        "def loaded():\n"
+        "    names = (m.split('.') for m in sys.modules if m.startswith('monarch_mcp.tools.'))\n"
+        "    return sorted(n[2] for n in names if len(n) == 3 and n[2] not in ('registry', 'definitions'))\n"
+        "async def main():\n"
+        "    server = MonarchMcpServer()\n"
+        "    server.client.get = AsyncMock(return_value={'items': []})\n"
+        "    async with create_connected_server_and_client_session(server.mcp_server) as session:\n"
+        "        print(loaded())\n"
+        "        result = await session.call_tool('get_gene_orthologs', {'gene_id': 'HGNC:1097'})\n"
+        "        assert not result.isError, result\n"
+        "        print(loaded())\n"
+        "        tools = await session.list_tools()\n"
+        "        assert {tool.name for tool in tools.tools} == set(TOOL_INDEX)\n"
+        "        print(loaded())\n"
+        "asyncio.run(main())\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert output == ["[]", "['entity', 'gene']", "['entity', 'gene']"]
+
+@pytest.mark.asyncio
+async def test_cancelled_tool_call_aborts_upstream_requests():
+    """Test that an MCP cancellation aborts every upstream request of the tool call."""
+    import httpx
+    import mcp.types as types
+    from mcp.shared.memory import create_connected_server_and_client_session
+    from monarch_mcp.client import MonarchClient
+
+    started, aborted = [], []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(request.url.path)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            aborted.append(request.url.path)
+            raise
+
+    server = MonarchMcpServer()
+    server.client = MonarchClient(base_url="https://api.example.org/", transport=httpx.MockTransport(handler))
+    async with create_connected_server_and_client_session(server.mcp_server) as session:
+        call = asyncio.create_task(
+            session.call_tool("get_entities_batch", {"entity_ids": ["HGNC:1097", "HGNC:1100", "HGNC:3236"]})
+        )
+        while len(started) < 3:
+            await asyncio.sleep(0.01)
+        cancel = types.CancelledNotification(
+            params=types.CancelledNotificationParams(requestId=session._request_id - 1)
+        )
+        await session.send_notification(types.ClientNotification(cancel))
+        for _ in range(100):
+            if len(aborted) == 3:
+                break
+            await asyncio.sleep(0.01)
+        call.cancel()
+
+    assert sorted(aborted) == sorted(started)
+    assert server.client.stats()["concurrency"]["inflight"] == 0
+    assert server.client.stats()["inflight_requests"] == 0
+    await server.client.close()
+
+@pytest.mark.asyncio
+async def test_saturated_server_rejects_calls_with_overloaded_error(server, mock_client):
+    """Test that calls beyond the admission limits fail fast with a structured error."""
+    from monarch_mcp.admission import AdmissionController
+
+    release = asyncio.Event()
+
+    async def slow_get(endpoint, params=None):
+        await release.wait()
+        return {"id": endpoint}
+
+    mock_client.get.side_effect = slow_get
+    server.admission = AdmissionController(max_inflight=1, max_queued=1)
+    running = asyncio.create_task(server.call_tool("get_entity", {"entity_id": "HGNC:1097"}))
+    queued = asyncio.create_task(server.call_tool("get_entity", {"entity_id": "HGNC:1100"}))
+    await asyncio.sleep(0.01)
+
+    result = await server.call_tool("get_entity", {"entity_id": "HGNC:3236"})
+    error = json.loads(result[0].text)
+    assert error["error"] == "OverloadedError"
+    assert error["tool_class"] == "entity"
+
+    release.set()
+    results = await asyncio.gather(running, queued)
+    assert [json.loads(r[0].text)["id"] for r in results] == ["entity/HGNC:1097", "entity/HGNC:1100"]
+    assert server.admission.stats()["inflight"] == 0
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_recorded_in_metrics(server, mock_client):
+    """Test that tool latency, result size and outcome are recorded, and unknown names folded."""
+    mock_client.get.return_value = {"id": "HGNC:1097"}
+    await server.call_tool("get_entity", {"entity_id": "HGNC:1097"})
+    await server.call_tool("get_entity", {"entity_id": 1})
+    await server.call_tool("made_up_tool", {})
+
+    metrics = mock_client.metrics
+    assert metrics.counter("tool_calls_total", "get_entity", "ok") == 1
+    assert metrics.counter("tool_calls_total", "get_entity", "ValueError") == 1
+    assert metrics.counter("tool_calls_total", "unknown", "ValueError") == 1
+    assert metrics.histogram("tool_call_duration_seconds", "get_entity").count == 2
+    assert metrics.histogram("tool_result_bytes", "get_entity").sum > 0
+
+def test_http_app_serves_prometheus_metrics(server, mock_client):
+    """Test that the HTTP app exposes the metrics in the Prometheus text format."""
+    from starlette.testclient import TestClient
+
+    mock_client.metrics.inc("tool_calls_total", "get_entity", "ok")
+    with TestClient(server.create_app("http")) as http:
+        response = http.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'monarch_tool_calls_total{tool="get_entity",outcome="ok"} 1' in response.text
+
+@pytest.mark.asyncio
+async def test_large_results_are_returned_as_chunked_resources(server, mock_client):
+    """Test that a result above the threshold is stored and read back as an MCP resource in chunks."""
+    from mcp.shared.memory import create_connected_server_and_client_session
+    from monarch_mcp.resources import ResultStore
+
+    items = [{"id": f"assoc:{i}", "subject": "HGNC:1097", "subject_label": "Sjögren syndrome"} for i in range(200)]
+    mock_client.get.return_value = {"total": 200, "limit": 200, "offset": 0, "items": items}
+    server.results = ResultStore(threshold=1000, chunk_size=4096)
+
+    async with create_connected_server_and_client_session(server.mcp_server) as session:
+        result = await session.call_tool("get_associations", {"limit": 200, "output_format": "compact"})
+        summary = json.loads(result.content[0].text)
+        assert summary["summary"]["total"] == 200
+        assert summary["summary"]["preview"] == items[:3]
+        assert summary["chunk_count"] > 1
+
+        listed = await session.list_resources()
+        assert [str(resource.uri) for resource in listed.resources] == [summary["resource_uri"]]
+
+        chunks = []
+        for n in range(summary["chunk_count"]):
+            uri = summary["chunk_uri_template"].format(n=n)
+            contents = (await session.read_resource(uri)).contents
+            assert contents[0].mimeType == "text/plain"
+            chunks.append(contents[0].text)
+        assert json.loads("".join(chunks))["items"] == items
+        whole = await session.read_resource(summary["resource_uri"])
+        assert whole.contents[0].mimeType == "application/json"
+        assert whole.contents[0].text == "".join(chunks)
+        assert listed.resources[0].size == len(whole.contents[0].text.encode())
+
+@pytest.mark.asyncio
+async def test_small_results_stay_inline(server, mock_client):
+    """Test that results below the threshold are returned inline and nothing is stored."""
+    from monarch_mcp.resources import ResultStore
+
+    mock_client.get.return_value = {"id": "HGNC:1097"}
+    server.results = ResultStore(threshold=1000)
+    result = await server.call_tool("get_entity", {"entity_id": "HGNC:1097"})
+    assert json.loads(result[0].text) == {"id": "HGNC:1097"}
+    assert server.list_resources() == []
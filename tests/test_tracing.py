@@ -0,0 +1,83 @@
+import asyncio
+import json
+import httpx
+import pytest
+from monarch_mcp import tracing
+from monarch_mcp.client import MonarchClient
+from monarch_mcp.server import MonarchMcpServer
+
+@pytest.fixture
+def exporter():
+    """Fixture that enables tracing into memory for one test."""
+    exporter = tracing.InMemoryExporter()
+    tracing.set_exporter(exporter)
+    yield exporter
+    tracing.set_exporter(None)
+
+def test_disabled_tracing_returns_shared_noop():
+    """Test that span() does no work while no exporter is configured."""
+    assert not tracing.enabled()
+    with tracing.span("a", x=1) as span:
+        assert span is None
+    assert tracing.span("a") is tracing.span("b")
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_tasks(exporter):
+    """Test that spans opened in spawned tasks are children of the span that spawned them."""
+    async def child(i):
+        with tracing.span("child", index=i):
+            await asyncio.sleep(0)
+
+    with pytest.raises(KeyError):
+        with tracing.span("root") as root:
+            await asyncio.gather(child(0), child(1))
+            raise KeyError("boom")
+
+    children = [span for span in exporter.spans if span.name == "child"]
+    assert len(children) == 2
+    assert all(span.parent_id == root.span_id and span.trace_id == root.trace_id for span in children)
+    assert exporter.spans[-1] is root
+    assert root.parent_id is None
+    assert root.error == "KeyError"
+    assert tracing.current_span() is None
+
+def test_json_lines_exporter(tmp_path):
+    """Test that the JSON-lines exporter writes one parseable object per span."""
+    path = tmp_path / "trace.jsonl"
+    tracing.set_exporter(tracing.JsonLinesExporter(str(path)))
+    try:
+        with tracing.span("outer", tool="get_entity"):
+            with tracing.span("inner"):
+                pass
+    finally:
+        tracing.set_exporter(None)
+
+    inner, outer = [json.loads(line) for line in path.read_text().splitlines()]
+    assert inner["parent_id"] == outer["span_id"]
+    assert outer["attributes"] == {"tool": "get_entity"}
+    assert outer["duration_ms"] >= inner["duration_ms"] >= 0
+
+@pytest.mark.asyncio
+async def test_tool_call_traces_every_upstream_request(exporter):
+    """Test that a fan-out tool call produces one root span with a child per upstream request."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[1]})
+
+    server = MonarchMcpServer()
+    server.client = MonarchClient(base_url="https://api.example.org/v3/api/", transport=httpx.MockTransport(handler))
+    await server.call_tool("get_entities_batch", {"entity_ids": ["HGNC:1097", "HGNC:1100", "HGNC:1097"]})
+    await server.client.close()
+
+    [root] = [span for span in exporter.spans if span.name == "call_tool"]
+    gets = [span for span in exporter.spans if span.name == "client.get"]
+    requests = [span for span in exporter.spans if span.name == "http.request"]
+    assert root.attributes["tool"] == "get_entities_batch"
+    assert root.attributes["outcome"] == "ok"
+    assert len(gets) == 2 and len(requests) == 2
+    assert all(span.parent_id == root.span_id for span in gets)
+    assert {span.parent_id for span in requests} == {span.span_id for span in gets}
+    for span in gets:
+        assert span.attributes["template"] == "entity/{id}"
+        assert span.attributes["cache"] == "miss"
+        assert span.attributes["bytes"] > 0
+    assert all(span.attributes["status_code"] == 200 for span in requests)